@@ -27,6 +27,11 @@ class Settings(BaseSettings):
 
     models_bucket: str = 'models'
     artifacts_bucket: str = 'artifacts'
+    signed_url_cache_max_entries: int = 4096
+    signed_url_refresh_margin_seconds: int = 300
+    artifact_upload_threads: int = 4
+    artifact_upload_attempts: int = 3
+    artifact_gzip_min_bytes: int = 65536
 
     openrouter_base_url: str = 'https://openrouter.ai/api/v1'
     openrouter_site_url: str | None = None
@@ -34,6 +39,8 @@ class Settings(BaseSettings):
 
     e2b_api_key: str | None = None
     e2b_template: str | None = None
+    e2b_pool_max_idle: int = 2
+    e2b_pool_max_idle_seconds: int = 300
     execution_backend: Literal['auto', 'local', 'e2b'] = 'auto'
 
     max_planner_validation_loops: int = 5
@@ -42,6 +49,13 @@ class Settings(BaseSettings):
     execution_timeout_seconds: int = 30
 
     local_executor_workdir: str = '.cpmod_web_runtime'
+    asset_cache_dir: str = '.cpmod_web_cache/assets'
+    asset_cache_max_bytes: int = 256 * 1024 * 1024
+    worker_concurrency: int = 4
+    worker_claim_batch_size: int = 4
+    worker_io_threads: int = 16
+    worker_wakeup: Literal['realtime', 'poll'] = 'realtime'
+    worker_fallback_poll_seconds: float = 30.0
     log_level: str = 'INFO'
 
     @property
@@ -1,7 +1,11 @@
 from __future__ import annotations
 
+import base64
+import json
 import logging
 import time
+import uuid
+from datetime import datetime
 from typing import Any
 
 from .supabase_client import get_supabase_admin, reset_supabase_admin
@@ -26,6 +30,19 @@ TRANSIENT_QUERY_MARKERS = (
     'timed out',
 )
 
+# Embedded selects so a run, its change request and model package (and optionally its events and
+# artifacts) come back from PostgREST in a single round-trip.
+_CHANGE_REQUEST_EMBED = (
+    'id, project_id, model_package_id, what_should_change, '
+    'override_input_data_storage_path, override_input_data_filename, '
+    'model_package:model_packages(id, filename, input_data_storage_path, input_data_filename)'
+)
+RUN_SUMMARY_SELECT = f'*, change_request:change_requests({_CHANGE_REQUEST_EMBED})'
+RUN_DETAIL_SELECT = RUN_SUMMARY_SELECT + ', run_events(*), run_artifacts(*)'
+# Inner-joined variant so a project's runs are filtered by their change request in the same request,
+# instead of fetching every change request id first.
+RUN_BY_PROJECT_SELECT = f'*, change_request:change_requests!inner({_CHANGE_REQUEST_EMBED})'
+
 
 class QueryExecutionError(RuntimeError):
     """Raised when a Supabase/PostgREST request fails."""
@@ -53,13 +70,43 @@ def _table(name: str):
     return get_supabase_admin().table(name)
 
 
+def encode_cursor(row: dict[str, Any]) -> str:
+    """Opaque keyset cursor pointing just past ``row`` in ``(created_at, id)`` order."""
+    raw = json.dumps([row['created_at'], row['id']]).encode('utf-8')
+    return base64.urlsafe_b64encode(raw).decode('ascii').rstrip('=')
+
+
+def decode_cursor(cursor: str) -> tuple[str, str]:
+    # Both parts end up inside a PostgREST filter, so anything but an ISO timestamp and a UUID is rejected.
+    try:
+        raw = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4))
+        created_at, row_id = json.loads(raw)
+        created_at = datetime.fromisoformat(created_at).isoformat()
+        row_id = str(uuid.UUID(row_id))
+    except Exception as exc:
+        raise ValueError('Invalid pagination cursor.') from exc
+    return created_at, row_id
+
+
+def _keyset(query, *, limit: int | None, cursor: str | None, desc: bool = True) -> list[dict[str, Any]]:
+    """Order ``query`` by ``(created_at, id)`` and return at most ``limit`` rows after ``cursor``."""
+    if cursor:
+        created_at, row_id = decode_cursor(cursor)
+        op = 'lt' if desc else 'gt'
+        query = query.or_(f'created_at.{op}."{created_at}",and(created_at.eq."{created_at}",id.{op}."{row_id}")')
+    query = query.order('created_at', desc=desc).order('id', desc=desc)
+    if limit is not None:
+        query = query.limit(limit)
+    return query.execute().data or []
+
+
 def create_project(*, user_id: str, name: str, description: str | None) -> dict[str, Any]:
     payload = {'user_id': user_id, 'name': name, 'description': description}
     return _table('projects').insert(payload).execute().data[0]
 
 
-def list_projects(*, user_id: str) -> list[dict[str, Any]]:
-    return _table('projects').select('*').eq('user_id', user_id).order('created_at', desc=True).execute().data or []
+def list_projects(*, user_id: str, limit: int | None = None, cursor: str | None = None) -> list[dict[str, Any]]:
+    return _keyset(_table('projects').select('*').eq('user_id', user_id), limit=limit, cursor=cursor)
 
 
 def get_project(*, project_id: str, user_id: str) -> dict[str, Any] | None:
@@ -84,15 +131,8 @@ def update_model_package(model_package_id: str, payload: dict[str, Any]) -> dict
     return _table('model_packages').update(payload).eq('id', model_package_id).execute().data[0]
 
 
-def list_model_packages(*, project_id: str) -> list[dict[str, Any]]:
-    return _table('model_packages').select('*').eq('project_id', project_id).order('created_at', desc=True).execute().data or []
-
-
-def list_model_packages_for_user(*, user_id: str) -> list[dict[str, Any]]:
-    project_ids = [project['id'] for project in list_projects(user_id=user_id)]
-    if not project_ids:
-        return []
-    return _table('model_packages').select('*').in_('project_id', project_ids).order('created_at', desc=True).execute().data or []
+def list_model_packages(*, project_id: str, limit: int | None = None, cursor: str | None = None) -> list[dict[str, Any]]:
+    return _keyset(_table('model_packages').select('*').eq('project_id', project_id), limit=limit, cursor=cursor)
 
 
 def get_model_package(model_package_id: str) -> dict[str, Any] | None:
@@ -108,15 +148,8 @@ def create_change_request(payload: dict[str, Any]) -> dict[str, Any]:
     return _table('change_requests').insert(payload).execute().data[0]
 
 
-def list_change_requests(*, project_id: str) -> list[dict[str, Any]]:
-    return _table('change_requests').select('*').eq('project_id', project_id).order('created_at', desc=True).execute().data or []
-
-
-def list_change_requests_for_user(*, user_id: str) -> list[dict[str, Any]]:
-    project_ids = [project['id'] for project in list_projects(user_id=user_id)]
-    if not project_ids:
-        return []
-    return _table('change_requests').select('*').in_('project_id', project_ids).order('created_at', desc=True).execute().data or []
+def list_change_requests(*, project_id: str, limit: int | None = None, cursor: str | None = None) -> list[dict[str, Any]]:
+    return _keyset(_table('change_requests').select('*').eq('project_id', project_id), limit=limit, cursor=cursor)
 
 
 def get_change_request(change_request_id: str) -> dict[str, Any] | None:
@@ -141,29 +174,31 @@ def get_workflow_run(run_id: str) -> dict[str, Any] | None:
     return data[0] if data else None
 
 
-def list_workflow_runs_for_project(project_id: str) -> list[dict[str, Any]]:
-    change_request_ids = [
-        change_request['id']
-        for change_request in list_change_requests(project_id=project_id)
-    ]
-    if not change_request_ids:
-        return []
-    return (
-        _table('workflow_runs')
-        .select('*')
-        .in_('change_request_id', change_request_ids)
-        .order('created_at', desc=True)
-        .execute()
-        .data
-        or []
-    )
+RUN_STATUS_COLUMNS = (
+    'id, status, failure_type, last_error, clarification_questions, clarification_answers, '
+    'invariants, change_summary, started_at, completed_at'
+)
+
+
+def get_workflow_run_status(run_id: str) -> dict[str, Any] | None:
+    data = _table('workflow_runs').select(RUN_STATUS_COLUMNS).eq('id', run_id).limit(1).execute().data or []
+    return data[0] if data else None
+
+
+def list_workflow_runs_for_project(project_id: str, *, limit: int | None = None, cursor: str | None = None) -> list[dict[str, Any]]:
+    query = _table('workflow_runs').select(RUN_BY_PROJECT_SELECT).eq('change_request.project_id', project_id)
+    return _keyset(query, limit=limit, cursor=cursor)
+
 
+def get_dashboard_overview(*, user_id: str, limit: int = 5) -> dict[str, Any]:
+    return get_supabase_admin().rpc('dashboard_overview', {'p_user_id': user_id, 'p_limit': limit}).execute().data or {}
 
-def list_workflow_runs_for_user(*, user_id: str) -> list[dict[str, Any]]:
-    change_request_ids = [change_request['id'] for change_request in list_change_requests_for_user(user_id=user_id)]
-    if not change_request_ids:
+
+def list_workflow_runs_joined(run_ids: list[str], *, include_details: bool = False) -> list[dict[str, Any]]:
+    if not run_ids:
         return []
-    return _table('workflow_runs').select('*').in_('change_request_id', change_request_ids).order('created_at', desc=True).execute().data or []
+    select = RUN_DETAIL_SELECT if include_details else RUN_SUMMARY_SELECT
+    return _table('workflow_runs').select(select).in_('id', run_ids).execute().data or []
 
 
 def list_workflow_runs_for_change_request(change_request_id: str) -> list[dict[str, Any]]:
@@ -178,8 +213,8 @@ def list_workflow_runs_for_change_request(change_request_id: str) -> list[dict[s
     )
 
 
-def list_run_events(run_id: str) -> list[dict[str, Any]]:
-    return _table('run_events').select('*').eq('run_id', run_id).order('created_at').execute().data or []
+def list_run_events(run_id: str, *, limit: int | None = None, cursor: str | None = None) -> list[dict[str, Any]]:
+    return _keyset(_table('run_events').select('*').eq('run_id', run_id), limit=limit, cursor=cursor, desc=False)
 
 
 def add_run_event(payload: dict[str, Any]) -> dict[str, Any]:
@@ -190,10 +225,21 @@ def list_run_artifacts(run_id: str) -> list[dict[str, Any]]:
     return _table('run_artifacts').select('*').eq('run_id', run_id).order('created_at').execute().data or []
 
 
+def get_run_artifact(*, run_id: str, artifact_id: str) -> dict[str, Any] | None:
+    data = _table('run_artifacts').select('*').eq('run_id', run_id).eq('id', artifact_id).limit(1).execute().data or []
+    return data[0] if data else None
+
+
 def add_run_artifact(payload: dict[str, Any]) -> dict[str, Any]:
     return _table('run_artifacts').insert(payload).execute().data[0]
 
 
+def add_run_artifacts(payloads: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    if not payloads:
+        return []
+    return _table('run_artifacts').insert(payloads).execute().data or []
+
+
 def list_user_api_credentials(*, user_id: str) -> list[dict[str, Any]]:
     return _table('user_api_credentials').select('*').eq('user_id', user_id).order('updated_at', desc=True).execute().data or []
 
@@ -225,12 +271,16 @@ def list_run_artifacts_for_model_package(model_package_id: str) -> list[dict[str
 
 
 def claim_pending_run() -> dict[str, Any] | None:
+    runs = claim_pending_runs(1)
+    return runs[0] if runs else None
+
+
+def claim_pending_runs(limit: int) -> list[dict[str, Any]]:
     max_attempts = 3
     for attempt in range(1, max_attempts + 1):
         try:
-            response = get_supabase_admin().rpc('claim_pending_run').execute()
-            data = response.data or []
-            return data[0] if data else None
+            response = get_supabase_admin().rpc('claim_pending_runs', {'max_runs': max(1, limit)}).execute()
+            return list(response.data or [])
         except Exception as exc:
             formatted = _format_query_error(exc)
             is_transient = _is_transient_query_error(exc)
@@ -245,6 +295,6 @@ def claim_pending_run() -> dict[str, Any] | None:
                 time.sleep(min(2.0, 0.5 * attempt))
                 continue
             raise QueryExecutionError(
-                f'Failed to claim pending run: {formatted}',
+                f'Failed to claim pending runs: {formatted}',
                 transient=is_transient,
             ) from exc
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from functools import lru_cache
 
-from supabase import Client, create_client
+from supabase import AsyncClient, Client, acreate_client, create_client
 
 from ..config import get_settings
 
@@ -17,3 +17,10 @@ def get_supabase_admin() -> Client:
 
 def reset_supabase_admin() -> None:
     get_supabase_admin.cache_clear()
+
+
+async def create_supabase_admin_async() -> AsyncClient:
+    settings = get_settings()
+    if not settings.supabase_url or not settings.supabase_service_role_key:
+        raise RuntimeError('Supabase backend credentials are not configured.')
+    return await acreate_client(settings.supabase_url, settings.supabase_service_role_key)
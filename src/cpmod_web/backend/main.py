@@ -8,6 +8,7 @@ from fastapi.responses import JSONResponse
 
 from .config import get_settings
 from .routers import change_requests, dashboard, model_packages, projects, runs, settings as settings_router
+from .services.pagination import NEXT_CURSOR_HEADER
 
 settings = get_settings()
 settings.validate_for_runtime()
@@ -28,6 +29,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=['*'],
     allow_headers=['*'],
+    expose_headers=[NEXT_CURSOR_HEADER],
 )
 
 app.include_router(projects.router)
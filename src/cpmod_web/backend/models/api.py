@@ -86,6 +86,10 @@ class ClarificationSubmit(BaseModel):
     answers: list[str]
 
 
+class RunRerun(BaseModel):
+    from_stage: Literal['planning', 'modifying', 'executing', 'validating']
+
+
 class RunArtifactRead(BaseModel):
     id: str
     run_id: str
@@ -94,6 +98,7 @@ class RunArtifactRead(BaseModel):
     metadata: dict[str, Any] = Field(default_factory=dict)
     created_at: datetime | None = None
     signed_url: str | None = None
+    content_url: str | None = None
 
 
 class RunEventRead(BaseModel):
@@ -132,6 +137,8 @@ class RunRead(BaseModel):
     completed_at: datetime | None = None
     failure_type: str | None = None
     last_error: str | None = None
+    rerun_of_run_id: str | None = None
+    rerun_from_stage: str | None = None
     created_at: datetime | None = None
     events: list[RunEventRead] = Field(default_factory=list)
     artifacts: list[RunArtifactRead] = Field(default_factory=list)
@@ -155,6 +162,7 @@ class RunSummaryRead(BaseModel):
     started_at: datetime | None = None
     completed_at: datetime | None = None
     failure_type: str | None = None
+    rerun_of_run_id: str | None = None
 
 
 class DashboardCountsRead(BaseModel):
@@ -62,6 +62,7 @@ class ExecutionResult(BaseModel):
     parsed_output: dict[str, Any] | None = None
     error_type: FailureType | None = None
     timeout_seconds: int | None = None
+    solver_status: str | None = None
 
 
 class InvariantsSummary(BaseModel):
@@ -9,8 +9,10 @@ from ..config import get_settings
 from ..db import queries
 from ..middleware.auth import AuthenticatedUser, get_current_user
 from ..models.api import ChangeRequestRead
+from ..services.pagination import PageParams, finish_page, page_params
 from ..services.resource_service import delete_change_request_with_artifacts
-from ..services.storage_service import StorageService
+from ..services.asset_cache import content_sha256
+from ..services.storage_service import StorageService, serialize_json
 
 router = APIRouter(tags=['change-requests'])
 
@@ -31,11 +33,21 @@ def _serialize_change_request(change_request: dict):
 
 
 @router.get('/projects/{project_id}/change-requests', response_model=list[ChangeRequestRead])
-def list_change_requests(project_id: str, current_user: AuthenticatedUser = Depends(get_current_user)):
+def list_change_requests(
+    project_id: str,
+    response: Response,
+    page: PageParams = Depends(page_params),
+    current_user: AuthenticatedUser = Depends(get_current_user),
+):
     project = queries.get_project(project_id=project_id, user_id=current_user.id)
     if not project:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail='Project not found.')
-    return [_serialize_change_request(change_request) for change_request in queries.list_change_requests(project_id=project_id)]
+    change_requests = finish_page(
+        queries.list_change_requests(project_id=project_id, limit=page.fetch_limit, cursor=page.cursor),
+        page,
+        response,
+    )
+    return [_serialize_change_request(change_request) for change_request in change_requests]
 
 
 @router.get('/change-requests/{change_request_id}', response_model=ChangeRequestRead)
@@ -71,6 +83,7 @@ async def create_change_request(
 
     override_filename: str | None = None
     override_storage_path: str | None = None
+    override_sha256: str | None = None
     if override_input_data_file:
         if not override_input_data_file.filename or not override_input_data_file.filename.endswith('.json'):
             raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail='Override input data must be a .json file.')
@@ -85,6 +98,7 @@ async def create_change_request(
             path=f'projects/{project_id}/change-requests/{uuid4()}/{override_filename}',
             payload=override_payload,
         )
+        override_sha256 = content_sha256(serialize_json(override_payload))
 
     change_request_id = str(uuid4())
     change_request = queries.create_change_request(
@@ -99,6 +113,7 @@ async def create_change_request(
             'additional_detail': (additional_detail or '').strip() or None,
             'override_input_data_filename': override_filename,
             'override_input_data_storage_path': override_storage_path,
+            'override_input_data_sha256': override_sha256,
             'override_input_value_info': (override_input_value_info or '').strip() or None,
             'status': 'submitted',
         }
@@ -7,6 +7,7 @@ from ..db import queries
 from ..middleware.auth import AuthenticatedUser, get_current_user
 from ..models.api import ModelPackageRead
 from ..services.model_package_service import create_model_package_with_validation
+from ..services.pagination import PageParams, finish_page, page_params
 from ..services.resource_service import delete_model_package_with_artifacts
 from ..services.storage_service import StorageService
 
@@ -32,11 +33,17 @@ def _serialize_model_package(package: dict) -> dict:
 
 
 @router.get('/projects/{project_id}/model-packages', response_model=list[ModelPackageRead])
-def list_model_packages(project_id: str, current_user: AuthenticatedUser = Depends(get_current_user)):
+def list_model_packages(
+    project_id: str,
+    response: Response,
+    page: PageParams = Depends(page_params),
+    current_user: AuthenticatedUser = Depends(get_current_user),
+):
     project = queries.get_project(project_id=project_id, user_id=current_user.id)
     if not project:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail='Project not found.')
-    return [_serialize_model_package(package) for package in queries.list_model_packages(project_id=project_id)]
+    packages = finish_page(queries.list_model_packages(project_id=project_id, limit=page.fetch_limit, cursor=page.cursor), page, response)
+    return [_serialize_model_package(package) for package in packages]
 
 
 @router.get('/model-packages/{model_package_id}', response_model=ModelPackageRead)
@@ -6,15 +6,21 @@ from fastapi import Response
 from ..db import queries
 from ..middleware.auth import AuthenticatedUser, get_current_user
 from ..models.api import ProjectCreate, ProjectRead, RunSummaryRead
+from ..services.pagination import PageParams, finish_page, page_params
 from ..services.resource_service import delete_project_with_artifacts
-from ..services.run_serialization import serialize_run
+from ..services.run_serialization import serialize_runs
 
 router = APIRouter(prefix='/projects', tags=['projects'])
 
 
 @router.get('', response_model=list[ProjectRead])
-def list_projects(current_user: AuthenticatedUser = Depends(get_current_user)):
-    return queries.list_projects(user_id=current_user.id)
+def list_projects(
+    response: Response,
+    page: PageParams = Depends(page_params),
+    current_user: AuthenticatedUser = Depends(get_current_user),
+):
+    projects = queries.list_projects(user_id=current_user.id, limit=page.fetch_limit, cursor=page.cursor)
+    return finish_page(projects, page, response)
 
 
 @router.post('', response_model=ProjectRead, status_code=status.HTTP_201_CREATED)
@@ -32,8 +38,14 @@ def delete_project(project_id: str, current_user: AuthenticatedUser = Depends(ge
 
 
 @router.get('/{project_id}/runs', response_model=list[RunSummaryRead])
-def list_project_runs(project_id: str, current_user: AuthenticatedUser = Depends(get_current_user)):
+def list_project_runs(
+    project_id: str,
+    response: Response,
+    page: PageParams = Depends(page_params),
+    current_user: AuthenticatedUser = Depends(get_current_user),
+):
     project = queries.get_project(project_id=project_id, user_id=current_user.id)
     if not project:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail='Project not found.')
-    return [serialize_run(run, include_details=False) for run in queries.list_workflow_runs_for_project(project_id)]
+    runs = finish_page(queries.list_workflow_runs_for_project(project_id, limit=page.fetch_limit, cursor=page.cursor), page, response)
+    return serialize_runs(runs, include_details=False)
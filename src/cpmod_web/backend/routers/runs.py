@@ -1,14 +1,21 @@
 from __future__ import annotations
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response, status
+from fastapi.responses import StreamingResponse
 
+from ..config import get_settings
 from ..db import queries
 from ..middleware.auth import AuthenticatedUser, get_current_user
-from ..models.api import ClarificationSubmit, RunArtifactRead, RunCreate, RunRead
+from ..models.api import ClarificationSubmit, RunArtifactRead, RunCreate, RunEventRead, RunRead, RunRerun
 from ..models.domain import RunStatus
+from ..services.artifact_uploader import decode_artifact
 from ..services.credential_service import CredentialError, supported_provider
-from ..services.model_catalog import get_catalog_entry
+from ..services.model_catalog import get_catalog_entry, infer_run_selection
+from ..services.pagination import PageParams, finish_page, page_params
+from ..services.run_rerun import create_rerun
 from ..services.run_serialization import serialize_run
+from ..services.run_stream import stream_run
+from ..services.storage_service import StorageService
 
 router = APIRouter(prefix='/runs', tags=['runs'])
 
@@ -71,6 +78,90 @@ def get_run_artifacts(run_id: str, current_user: AuthenticatedUser = Depends(get
     return serialize_run(run)['artifacts']
 
 
+@router.get('/{run_id}/artifacts/{artifact_id}/content')
+def get_run_artifact_content(run_id: str, artifact_id: str, current_user: AuthenticatedUser = Depends(get_current_user)):
+    run = queries.get_workflow_run(run_id)
+    if not run:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail='Run not found.')
+    change_request = queries.get_change_request(run['change_request_id'])
+    project = queries.get_project(project_id=change_request['project_id'], user_id=current_user.id)
+    if not project:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail='Run not found.')
+    artifact = queries.get_run_artifact(run_id=run_id, artifact_id=artifact_id)
+    if not artifact or not artifact.get('storage_path'):
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail='Artifact not found.')
+    body = StorageService().download_bytes(bucket=get_settings().artifacts_bucket, path=artifact['storage_path'])
+    filename, body, content_type = decode_artifact(artifact, body)
+    return Response(
+        content=body,
+        media_type=content_type,
+        headers={'Content-Disposition': f'inline; filename="{filename}"', 'Cache-Control': 'private, max-age=3600'},
+    )
+
+
+@router.get('/{run_id}/events', response_model=list[RunEventRead])
+def list_run_events(
+    run_id: str,
+    response: Response,
+    page: PageParams = Depends(page_params),
+    current_user: AuthenticatedUser = Depends(get_current_user),
+):
+    run = queries.get_workflow_run(run_id)
+    if not run:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail='Run not found.')
+    change_request = queries.get_change_request(run['change_request_id'])
+    project = queries.get_project(project_id=change_request['project_id'], user_id=current_user.id)
+    if not project:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail='Run not found.')
+    return finish_page(queries.list_run_events(run_id, limit=page.fetch_limit, cursor=page.cursor), page, response)
+
+
+@router.get('/{run_id}/stream')
+def stream_run_updates(
+    run_id: str,
+    after: str | None = Query(None),
+    last_event_id: str | None = Header(default=None),
+    current_user: AuthenticatedUser = Depends(get_current_user),
+):
+    run = queries.get_workflow_run(run_id)
+    if not run:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail='Run not found.')
+    change_request = queries.get_change_request(run['change_request_id'])
+    project = queries.get_project(project_id=change_request['project_id'], user_id=current_user.id)
+    if not project:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail='Run not found.')
+    cursor = last_event_id or after
+    if cursor:
+        try:
+            queries.decode_cursor(cursor)
+        except ValueError as exc:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
+    return StreamingResponse(
+        stream_run(run_id, after=cursor),
+        media_type='text/event-stream',
+        headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'},
+    )
+
+
+@router.post('/{run_id}/rerun', response_model=RunRead, status_code=status.HTTP_201_CREATED)
+def rerun_from_stage(run_id: str, payload: RunRerun, current_user: AuthenticatedUser = Depends(get_current_user)):
+    run = queries.get_workflow_run(run_id)
+    if not run:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail='Run not found.')
+    change_request = queries.get_change_request(run['change_request_id'])
+    project = queries.get_project(project_id=change_request['project_id'], user_id=current_user.id)
+    if not project:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail='Run not found.')
+    _, _, _, api_key_provider = infer_run_selection(run)
+    if not queries.get_user_api_credential(user_id=current_user.id, provider=api_key_provider):
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f'Save an API key for {api_key_provider} before rerunning this run.')
+    try:
+        rerun = create_rerun(run, payload.from_stage)
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
+    return serialize_run(rerun)
+
+
 @router.post('/{run_id}/clarify', response_model=RunRead)
 def submit_clarification(run_id: str, payload: ClarificationSubmit, current_user: AuthenticatedUser = Depends(get_current_user)):
     run = queries.get_workflow_run(run_id)
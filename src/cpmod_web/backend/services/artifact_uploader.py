@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+import gzip
+import logging
+import mimetypes
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from datetime import datetime, timezone
+from functools import lru_cache, partial
+from typing import Any
+
+from ..config import get_settings
+from ..db import queries
+from .storage_service import StorageService
+
+logger = logging.getLogger(__name__)
+
+GZIP_CONTENT_TYPE = 'application/gzip'
+GZIP_SUFFIX = '.gz'
+
+
+@lru_cache(maxsize=1)
+def get_upload_executor() -> ThreadPoolExecutor:
+    """Pool for artifact uploads, kept apart from the I/O pool so a flush never waits behind its own thread."""
+    return ThreadPoolExecutor(max_workers=max(1, get_settings().artifact_upload_threads), thread_name_prefix='cpmod-upload')
+
+
+def encode_artifact(filename: str, content: str, content_type: str) -> tuple[str, bytes, str, dict[str, Any]]:
+    """Return ``(filename, body, content_type, metadata)`` for storage, gzipping large JSON and text bodies.
+
+    Small artifacts stay plain so their signed URLs still open inline in the browser.
+    """
+    body = content.encode('utf-8')
+    min_bytes = get_settings().artifact_gzip_min_bytes
+    compressible = content_type.startswith('text/') or content_type == 'application/json'
+    if min_bytes < 0 or len(body) < min_bytes or not compressible:
+        return filename, body, content_type, {}
+    metadata = {'content_encoding': 'gzip', 'content_type': content_type, 'size_bytes': len(body)}
+    return f'{filename}{GZIP_SUFFIX}', gzip.compress(body, mtime=0), GZIP_CONTENT_TYPE, metadata
+
+
+def is_compressed(artifact: dict[str, Any]) -> bool:
+    return (artifact.get('metadata') or {}).get('content_encoding') == 'gzip'
+
+
+def decode_artifact(artifact: dict[str, Any], body: bytes) -> tuple[str, bytes, str]:
+    """Inverse of ``encode_artifact``: ``(filename, body, content_type)`` as the artifact was written."""
+    filename = (artifact.get('storage_path') or '').rsplit('/', 1)[-1]
+    if not is_compressed(artifact):
+        return filename, body, mimetypes.guess_type(filename)[0] or 'application/octet-stream'
+    return filename.removesuffix(GZIP_SUFFIX), gzip.decompress(body), artifact['metadata'].get('content_type') or 'text/plain'
+
+
+class ArtifactUploader:
+    """Uploads a run's artifacts in the background and inserts their rows in bulk.
+
+    ``enqueue`` returns immediately; each upload is retried with backoff on the upload pool. A row is
+    only inserted once its file is in storage: ``insert_completed`` writes the rows of finished
+    uploads, and ``flush`` waits for every outstanding upload first.
+    """
+
+    def __init__(
+        self,
+        storage: StorageService,
+        *,
+        bucket: str,
+        attempts: int | None = None,
+        retry_delay_seconds: float = 0.5,
+        executor: ThreadPoolExecutor | None = None,
+    ):
+        self.storage = storage
+        self.bucket = bucket
+        self.attempts = max(1, attempts if attempts is not None else get_settings().artifact_upload_attempts)
+        self.retry_delay_seconds = retry_delay_seconds
+        self._executor = executor or get_upload_executor()
+        self._lock = threading.Lock()
+        self._pending: set[Future[None]] = set()
+        self._rows: list[dict[str, Any]] = []
+        self.failed_paths: list[str] = []
+
+    def enqueue(self, *, path: str, body: bytes, content_type: str, row: dict[str, Any]) -> None:
+        # Stamp the row now so artifacts keep their production order despite concurrent uploads.
+        row = {**row, 'storage_path': path, 'created_at': datetime.now(timezone.utc).isoformat()}
+        future = self._executor.submit(self._upload, path, body, content_type)
+        with self._lock:
+            self._pending.add(future)
+        future.add_done_callback(partial(self._uploaded, path, row))
+
+    def insert_completed(self) -> None:
+        """Insert the rows of uploads that have already finished, without waiting for the rest."""
+        with self._lock:
+            rows, self._rows = self._rows, []
+        if not rows:
+            return
+        rows.sort(key=lambda row: row['created_at'])
+        try:
+            queries.add_run_artifacts(rows)
+        except Exception:
+            with self._lock:
+                self._rows[:0] = rows
+            raise
+
+    def flush(self) -> list[str]:
+        """Wait for every queued upload, insert the remaining rows and return paths that failed to upload."""
+        while True:
+            with self._lock:
+                pending = list(self._pending)
+            if not pending:
+                break
+            wait(pending)
+        self.insert_completed()
+        with self._lock:
+            return list(self.failed_paths)
+
+    def _upload(self, path: str, body: bytes, content_type: str) -> None:
+        for attempt in range(1, self.attempts + 1):
+            try:
+                self.storage.upload_bytes(bucket=self.bucket, path=path, content=body, content_type=content_type)
+                return
+            except Exception:
+                if attempt == self.attempts:
+                    raise
+                time.sleep(self.retry_delay_seconds * 2 ** (attempt - 1))
+
+    def _uploaded(self, path: str, row: dict[str, Any], future: Future[None]) -> None:
+        error = future.exception()
+        with self._lock:
+            self._pending.discard(future)
+            if error is None:
+                self._rows.append(row)
+            else:
+                self.failed_paths.append(path)
+        if error is not None:
+            logger.warning('Artifact upload to %s failed after %s attempts: %s', path, self.attempts, error)
@@ -0,0 +1,143 @@
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+from pathlib import Path
+
+from ..config import get_settings
+from .storage_service import StorageService, decode_text
+
+logger = logging.getLogger(__name__)
+
+
+def content_sha256(content: str | bytes) -> str:
+    return hashlib.sha256(content.encode('utf-8') if isinstance(content, str) else content).hexdigest()
+
+
+class AssetCache:
+    """Worker-local, size-capped LRU of storage objects on disk.
+
+    Blobs are stored once per content hash under ``blobs/``; ``paths/`` maps a ``bucket/path`` to the
+    hash it last held, so assets whose hash is not recorded are still served without a round trip.
+    Model package and override paths are never rewritten, which is what makes the path mapping safe.
+    Recency is the blob's mtime, so the LRU order survives worker restarts.
+    """
+
+    def __init__(self, root: Path, *, max_bytes: int):
+        self.root = Path(root)
+        self.max_bytes = max_bytes
+        self._blobs = self.root / 'blobs'
+        self._paths = self.root / 'paths'
+        self._blobs.mkdir(parents=True, exist_ok=True)
+        self._paths.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._sizes: OrderedDict[str, int] = OrderedDict()
+        self._total = 0
+        entries = sorted(
+            (entry.stat().st_mtime, entry.name, entry.stat().st_size)
+            for entry in self._blobs.iterdir()
+            if entry.is_file() and not entry.name.startswith('.')
+        )
+        for _, digest, size in entries:
+            self._sizes[digest] = size
+            self._total += size
+        self.stats = {'hits': 0, 'misses': 0, 'evictions': 0}
+
+    def get(self, bucket: str, path: str, *, sha256: str | None = None) -> bytes | None:
+        digest = sha256 or self._read_path_digest(bucket, path)
+        data = self._read_blob(digest) if digest else None
+        with self._lock:
+            self.stats['hits' if data is not None else 'misses'] += 1
+        return data
+
+    def put(self, bucket: str, path: str, content: bytes) -> str:
+        digest = content_sha256(content)
+        blob = self._blobs / digest
+        if not blob.exists():
+            self._write_atomic(blob, content)
+        self._write_atomic(self._path_entry(bucket, path), digest.encode('ascii'))
+        with self._lock:
+            if digest in self._sizes:
+                self._sizes.move_to_end(digest)
+            else:
+                self._sizes[digest] = len(content)
+                self._total += len(content)
+            self._evict()
+        return digest
+
+    def _read_blob(self, digest: str) -> bytes | None:
+        blob = self._blobs / digest
+        try:
+            data = blob.read_bytes()
+        except OSError:
+            return None
+        if content_sha256(data) != digest:
+            logger.warning('Dropping corrupt cached asset %s.', digest)
+            self._drop(digest)
+            return None
+        try:
+            os.utime(blob)
+        except OSError:
+            pass
+        with self._lock:
+            if digest in self._sizes:
+                self._sizes.move_to_end(digest)
+        return data
+
+    def _read_path_digest(self, bucket: str, path: str) -> str | None:
+        try:
+            return self._path_entry(bucket, path).read_text().strip() or None
+        except OSError:
+            return None
+
+    def _path_entry(self, bucket: str, path: str) -> Path:
+        return self._paths / content_sha256(f'{bucket}/{path}')
+
+    def _evict(self) -> None:
+        # Caller holds the lock. The newest blob is always kept, even if it alone exceeds the cap.
+        while self._total > self.max_bytes and len(self._sizes) > 1:
+            digest, size = self._sizes.popitem(last=False)
+            self._total -= size
+            self.stats['evictions'] += 1
+            (self._blobs / digest).unlink(missing_ok=True)
+
+    def _drop(self, digest: str) -> None:
+        with self._lock:
+            self._total -= self._sizes.pop(digest, 0)
+        (self._blobs / digest).unlink(missing_ok=True)
+
+    def _write_atomic(self, target: Path, content: bytes) -> None:
+        fd, tmp_name = tempfile.mkstemp(dir=target.parent, prefix='.tmp-')
+        try:
+            with os.fdopen(fd, 'wb') as handle:
+                handle.write(content)
+            os.replace(tmp_name, target)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+
+
+@lru_cache(maxsize=1)
+def get_asset_cache() -> AssetCache | None:
+    settings = get_settings()
+    if settings.asset_cache_max_bytes <= 0:
+        return None
+    return AssetCache(Path(settings.asset_cache_dir), max_bytes=settings.asset_cache_max_bytes)
+
+
+def download_asset_text(storage: StorageService, *, bucket: str, path: str, sha256: str | None = None) -> str:
+    """``StorageService.download_text`` through the worker's asset cache."""
+    cache = get_asset_cache()
+    data = cache.get(bucket, path, sha256=sha256) if cache else None
+    if data is None:
+        data = storage.download_bytes(bucket=bucket, path=path)
+        if cache:
+            digest = cache.put(bucket, path, data)
+            if sha256 and digest != sha256:
+                logger.warning('Stored asset %s/%s does not match its recorded hash.', bucket, path)
+    return decode_text(data)
@@ -0,0 +1,25 @@
+from __future__ import annotations
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
+from typing import Any, Callable, TypeVar
+
+from ..config import get_settings
+
+T = TypeVar('T')
+
+
+@lru_cache(maxsize=1)
+def get_io_executor() -> ThreadPoolExecutor:
+    """Bounded pool for the blocking Supabase, storage and LLM clients used by workflow runs."""
+    settings = get_settings()
+    # Every in-flight run holds at most one thread at a time, plus one for claims and failure bookkeeping.
+    workers = max(settings.worker_io_threads, settings.worker_concurrency + 1)
+    return ThreadPoolExecutor(max_workers=workers, thread_name_prefix='cpmod-io')
+
+
+async def run_blocking(func: Callable[..., T], /, *args: Any, **kwargs: Any) -> T:
+    """Run a blocking call on the shared I/O pool without stalling the event loop."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(get_io_executor(), partial(func, *args, **kwargs))
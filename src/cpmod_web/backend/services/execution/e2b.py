@@ -1,80 +1,199 @@
 from __future__ import annotations
 
+import asyncio
 import json
+import shlex
+import weakref
+from typing import Any, Awaitable, Callable
 
 from ...config import get_settings
 from ...models.domain import ExecutionResult, FailureType
 from .base import ExecutionBackend
-from .harness import build_execution_files
+from .harness import build_execution_files, solver_time_limit, split_solver_status
+from .sandbox_pool import SandboxHook, SandboxLease, SandboxPool
+
+JOB_DIR = '/home/user/job'
+RUNTIME_CHECK_COMMAND = 'python -c "import cpmpy, numpy"'
+RUNTIME_INSTALL_COMMAND = 'python -m pip install --quiet cpmpy numpy'
+
+_pools: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, SandboxPool] = weakref.WeakKeyDictionary()
+
+
+class SandboxRuntimeError(RuntimeError):
+    """The sandbox could not be provisioned with the CPMpy runtime."""
+
+    def __init__(self, *, stdout: str, stderr: str, exit_code: int):
+        super().__init__(stderr or 'Failed to install CPMpy inside the E2B sandbox.')
+        self.stdout = stdout
+        self.stderr = stderr
+        self.exit_code = exit_code
+
+
+def _busy_lifetime_seconds() -> int:
+    # Long enough for a cold runtime install plus one guarded execution.
+    settings = get_settings()
+    return settings.execution_timeout_seconds * 3 + 180
+
+
+async def create_e2b_sandbox() -> Any:
+    settings = get_settings()
+    if not settings.e2b_api_key:
+        raise RuntimeError('E2B execution requested but CPMOD_WEB_E2B_API_KEY is not configured.')
+
+    from e2b_code_interpreter import AsyncSandbox
+
+    sandbox_kwargs = {'api_key': settings.e2b_api_key, 'timeout': _busy_lifetime_seconds()}
+    if settings.e2b_template:
+        sandbox_kwargs['template'] = settings.e2b_template
+    return await AsyncSandbox.create(**sandbox_kwargs)
+
+
+async def ensure_runtime(sandbox: Any) -> None:
+    """Install CPMpy unless the sandbox template already ships it."""
+    try:
+        check = await sandbox.commands.run(RUNTIME_CHECK_COMMAND, timeout=30)
+        if check.exit_code == 0:
+            return
+    except Exception:
+        # E2B raises on a non-zero exit; either way the runtime is missing.
+        pass
+    settings = get_settings()
+    try:
+        install = await sandbox.commands.run(
+            RUNTIME_INSTALL_COMMAND,
+            timeout=min(max(settings.execution_timeout_seconds * 2, 60), 180),
+        )
+    except Exception as exc:
+        raise SandboxRuntimeError(
+            stdout=getattr(exc, 'stdout', '') or '',
+            stderr=getattr(exc, 'stderr', '') or str(exc),
+            exit_code=int(getattr(exc, 'exit_code', 1) or 1),
+        ) from exc
+    if install.exit_code != 0:
+        raise SandboxRuntimeError(stdout=install.stdout or '', stderr=install.stderr or '', exit_code=int(install.exit_code))
+
+
+async def _health_check(sandbox: Any) -> None:
+    await sandbox.set_timeout(_busy_lifetime_seconds())
+    await sandbox.commands.run('true', timeout=10)
+
+
+async def _reset(sandbox: Any) -> None:
+    await sandbox.commands.run(f'rm -rf {JOB_DIR}', timeout=10)
+    # An idle sandbox the pool forgets about (e.g. on shutdown) still expires on E2B's side.
+    await sandbox.set_timeout(get_settings().e2b_pool_max_idle_seconds + 60)
+
+
+def build_sandbox_pool(
+    create: Callable[[], Awaitable[Any]] = create_e2b_sandbox,
+    *,
+    prepare: SandboxHook | None = ensure_runtime,
+) -> SandboxPool:
+    settings = get_settings()
+    return SandboxPool(
+        create,
+        max_idle=settings.e2b_pool_max_idle,
+        max_idle_seconds=settings.e2b_pool_max_idle_seconds,
+        prepare=prepare,
+        health_check=_health_check,
+        reset=_reset,
+    )
+
+
+def get_sandbox_pool() -> SandboxPool:
+    # Sandboxes hold HTTP clients bound to the loop that created them, so each loop gets its own pool.
+    loop = asyncio.get_running_loop()
+    pool = _pools.get(loop)
+    if pool is None:
+        pool = _pools[loop] = build_sandbox_pool()
+    return pool
 
 
 class E2BExecutionBackend(ExecutionBackend):
+    def __init__(self, pool: SandboxPool | None = None):
+        self._pool = pool
+
     async def execute_model(self, *, code: str, input_data: dict, metadata: dict | None = None) -> ExecutionResult:
+        pool = self._pool or get_sandbox_pool()
+        try:
+            async with pool.lease() as lease:
+                return await self._run_job(lease, code=code, input_data=input_data, metadata=metadata)
+        except SandboxRuntimeError as exc:
+            return ExecutionResult(
+                passed=False,
+                stdout=exc.stdout,
+                stderr=exc.stderr or 'Failed to install CPMpy inside the E2B sandbox.',
+                exit_code=exc.exit_code,
+                error_type=FailureType.RUNTIME_ERROR,
+            )
+
+    async def _run_job(self, lease: SandboxLease, *, code: str, input_data: dict, metadata: dict | None) -> ExecutionResult:
         settings = get_settings()
-        if not settings.e2b_api_key:
-            raise RuntimeError('E2B execution requested but CPMOD_WEB_E2B_API_KEY is not configured.')
-
-        from e2b_code_interpreter import AsyncSandbox
-
-        sandbox_kwargs = {'api_key': settings.e2b_api_key, 'timeout': settings.execution_timeout_seconds}
-        if settings.e2b_template:
-            sandbox_kwargs['template'] = settings.e2b_template
-
-        sandbox = await AsyncSandbox.create(**sandbox_kwargs)
-        async with sandbox:
-            files, entry_script = build_execution_files(code=code, input_data=input_data, metadata=metadata)
-            for relative_path, content in files.items():
-                await sandbox.files.write(f'/home/user/{relative_path}', content)
-            install = await sandbox.commands.run(
-                'python -m pip install --quiet cpmpy numpy',
-                timeout=min(max(settings.execution_timeout_seconds * 2, 60), 180),
+        sandbox = lease.sandbox
+        files, guard_argv, guard_env = build_execution_files(
+            code=code,
+            input_data=input_data,
+            metadata=metadata,
+            solver_time_limit_seconds=solver_time_limit(settings.execution_timeout_seconds),
+        )
+        for relative_path, content in files.items():
+            await sandbox.files.write(f'{JOB_DIR}/{relative_path}', content)
+        from e2b import CommandExitException
+
+        try:
+            result = await sandbox.commands.run(
+                shlex.join(['python', *guard_argv]),
+                cwd=JOB_DIR,
+                envs=guard_env,
+                timeout=settings.execution_timeout_seconds,
+            )
+        except CommandExitException as exc:
+            # E2B raises on any non-zero exit. The model crashed but the sandbox is fine, and the
+            # exception carries the command's own stdout/stderr/exit code.
+            result = exc
+        except Exception as exc:  # pragma: no cover - network/runtime dependent
+            # Timeouts and transport errors: the command may still be running, so never hand this
+            # sandbox to another job.
+            lease.discard()
+            message = str(exc)
+            error_type = FailureType.TIMEOUT if 'timeout' in message.lower() else FailureType.RUNTIME_ERROR
+            return ExecutionResult(
+                passed=False,
+                stdout='',
+                stderr=message,
+                exit_code=124 if error_type == FailureType.TIMEOUT else 1,
+                error_type=error_type,
+                timeout_seconds=settings.execution_timeout_seconds if error_type == FailureType.TIMEOUT else None,
+            )
+        stdout = result.stdout or ''
+        solver_status, stderr = split_solver_status(result.stderr or '')
+        status = (solver_status or {}).get('status')
+        if result.exit_code != 0:
+            return ExecutionResult(
+                passed=False,
+                stdout=stdout,
+                stderr=stderr,
+                exit_code=int(result.exit_code),
+                error_type=FailureType.TIMEOUT if 'timeout' in stderr.lower() else FailureType.RUNTIME_ERROR,
+                timeout_seconds=settings.execution_timeout_seconds if 'timeout' in stderr.lower() else None,
+                solver_status=status,
             )
-            if install.exit_code != 0:
-                return ExecutionResult(
-                    passed=False,
-                    stdout=install.stdout or '',
-                    stderr=install.stderr or 'Failed to install CPMpy inside the E2B sandbox.',
-                    exit_code=int(install.exit_code),
-                    error_type=FailureType.RUNTIME_ERROR,
-                )
-            try:
-                result = await sandbox.commands.run(f'python /home/user/{entry_script}', timeout=settings.execution_timeout_seconds)
-            except Exception as exc:  # pragma: no cover - network/runtime dependent
-                message = str(exc)
-                error_type = FailureType.TIMEOUT if 'timeout' in message.lower() else FailureType.RUNTIME_ERROR
-                return ExecutionResult(
-                    passed=False,
-                    stdout='',
-                    stderr=message,
-                    exit_code=124 if error_type == FailureType.TIMEOUT else 1,
-                    error_type=error_type,
-                    timeout_seconds=settings.execution_timeout_seconds if error_type == FailureType.TIMEOUT else None,
-                )
-            stdout = result.stdout or ''
-            stderr = result.stderr or ''
-            if result.exit_code != 0:
-                return ExecutionResult(
-                    passed=False,
-                    stdout=stdout,
-                    stderr=stderr,
-                    exit_code=int(result.exit_code),
-                    error_type=FailureType.TIMEOUT if 'timeout' in stderr.lower() else FailureType.RUNTIME_ERROR,
-                    timeout_seconds=settings.execution_timeout_seconds if 'timeout' in stderr.lower() else None,
-                )
-            try:
-                parsed = json.loads(stdout)
-            except json.JSONDecodeError:
-                return ExecutionResult(
-                    passed=False,
-                    stdout=stdout,
-                    stderr=stderr,
-                    exit_code=int(result.exit_code),
-                    error_type=FailureType.OUTPUT_FORMAT,
-                )
+        try:
+            parsed = json.loads(stdout)
+        except json.JSONDecodeError:
             return ExecutionResult(
-                passed=True,
+                passed=False,
                 stdout=stdout,
                 stderr=stderr,
                 exit_code=int(result.exit_code),
-                parsed_output=parsed,
+                error_type=FailureType.OUTPUT_FORMAT,
+                solver_status=status,
             )
+        return ExecutionResult(
+            passed=True,
+            stdout=stdout,
+            stderr=stderr,
+            exit_code=int(result.exit_code),
+            parsed_output=parsed,
+            solver_status=status,
+        )
@@ -1,16 +1,35 @@
 from __future__ import annotations
 
+import functools
 import json
 from textwrap import dedent
 from typing import Any
 
+from ....shared.solver_guard import (
+    GUARD_PATH,
+    TIME_LIMIT_ENV,
+    TIMEOUT_INCUMBENT,
+    solver_time_limit,
+    solver_time_margin,
+    split_solver_status,
+)
+
+GUARD_FILENAME = 'solver_guard.py'
+
 
 def execution_mode_from_metadata(metadata: dict[str, Any] | None) -> str:
     mode = str((metadata or {}).get('execution_mode') or 'script').strip().lower()
     return mode if mode in {'script', 'build_model'} else 'script'
 
 
-def build_execution_files(*, code: str, input_data: dict[str, Any], metadata: dict[str, Any] | None) -> tuple[dict[str, str], str]:
+def build_execution_files(
+    *,
+    code: str,
+    input_data: dict[str, Any],
+    metadata: dict[str, Any] | None,
+    solver_time_limit_seconds: float | None = None,
+) -> tuple[dict[str, str], list[str], dict[str, str]]:
+    """Files to write into the job directory, the guard's argv (relative to it) and extra env vars."""
     metadata = metadata or {}
     mode = execution_mode_from_metadata(metadata)
     files = {
@@ -20,9 +39,14 @@ def build_execution_files(*, code: str, input_data: dict[str, Any], metadata: di
     if mode == 'build_model':
         files['uploaded_model.py'] = code
         files['runner.py'] = _build_model_runner()
-        return files, 'runner.py'
-    files['model.py'] = code
-    return files, 'model.py'
+        target = 'runner.py'
+    else:
+        files['model.py'] = code
+        target = 'model.py'
+    # The sandbox runs the same guard file as the benchmark, configured through its CLI and env var.
+    files[GUARD_FILENAME] = _solver_guard_source()
+    env = {TIME_LIMIT_ENV: f'{solver_time_limit_seconds:.3f}'} if solver_time_limit_seconds else {}
+    return files, [GUARD_FILENAME, target], env
 
 
 def execution_contract_text(metadata: dict[str, Any] | None) -> str:
@@ -159,3 +183,8 @@ def _build_model_runner() -> str:
             main()
         """
     ).strip() + "\n"
+
+
+@functools.lru_cache(maxsize=1)
+def _solver_guard_source() -> str:
+    return GUARD_PATH.read_text(encoding='utf-8')
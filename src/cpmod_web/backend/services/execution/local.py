@@ -2,13 +2,20 @@ from __future__ import annotations
 
 import asyncio
 import json
+import os
 import tempfile
 from pathlib import Path
 
 from ...config import get_settings
 from ...models.domain import ExecutionResult, FailureType
 from .base import ExecutionBackend
-from .harness import build_execution_files
+from .harness import (
+    TIMEOUT_INCUMBENT,
+    build_execution_files,
+    solver_time_limit,
+    solver_time_margin,
+    split_solver_status,
+)
 
 
 class LocalExecutionBackend(ExecutionBackend):
@@ -16,36 +23,66 @@ class LocalExecutionBackend(ExecutionBackend):
         settings = get_settings()
         runtime_root = Path(settings.local_executor_workdir)
         runtime_root.mkdir(parents=True, exist_ok=True)
+        timeout_seconds = settings.execution_timeout_seconds
 
         with tempfile.TemporaryDirectory(dir=runtime_root) as tmp_dir:
             workdir = Path(tmp_dir)
-            files, entry_script = build_execution_files(code=code, input_data=input_data, metadata=metadata)
+            files, guard_argv, guard_env = build_execution_files(
+                code=code,
+                input_data=input_data,
+                metadata=metadata,
+                solver_time_limit_seconds=solver_time_limit(timeout_seconds),
+            )
             for relative_path, content in files.items():
                 (workdir / relative_path).write_text(content)
 
             proc = await asyncio.create_subprocess_exec(
                 'python3',
-                entry_script,
+                *guard_argv,
                 cwd=str(workdir),
+                env={**os.environ, **guard_env},
                 stdout=asyncio.subprocess.PIPE,
                 stderr=asyncio.subprocess.PIPE,
             )
-            try:
-                stdout_b, stderr_b = await asyncio.wait_for(proc.communicate(), timeout=settings.execution_timeout_seconds)
-            except asyncio.TimeoutError:
-                proc.kill()
-                await proc.wait()
+            communicate = asyncio.ensure_future(proc.communicate())
+            done, _ = await asyncio.wait({communicate}, timeout=timeout_seconds)
+            timed_out = not done
+            if timed_out:
+                # SIGTERM first so the guard can flush an incumbent the model already printed.
+                proc.terminate()
+                try:
+                    await asyncio.wait_for(asyncio.shield(communicate), timeout=solver_time_margin(timeout_seconds))
+                except asyncio.TimeoutError:
+                    proc.kill()
+            stdout_b, stderr_b = await communicate
+
+            stdout = stdout_b.decode('utf-8')
+            solver_status, stderr = split_solver_status(stderr_b.decode('utf-8'))
+            status = (solver_status or {}).get('status')
+
+            if timed_out:
+                try:
+                    parsed = json.loads(stdout)
+                except json.JSONDecodeError:
+                    return ExecutionResult(
+                        passed=False,
+                        stdout=stdout,
+                        stderr=stderr or 'Execution timed out.',
+                        exit_code=124,
+                        error_type=FailureType.TIMEOUT,
+                        timeout_seconds=timeout_seconds,
+                        solver_status=status,
+                    )
                 return ExecutionResult(
-                    passed=False,
-                    stdout='',
-                    stderr='Execution timed out.',
+                    passed=True,
+                    stdout=stdout,
+                    stderr=stderr,
                     exit_code=124,
-                    error_type=FailureType.TIMEOUT,
-                    timeout_seconds=settings.execution_timeout_seconds,
+                    parsed_output=parsed,
+                    timeout_seconds=timeout_seconds,
+                    solver_status=TIMEOUT_INCUMBENT,
                 )
 
-            stdout = stdout_b.decode('utf-8')
-            stderr = stderr_b.decode('utf-8')
             if proc.returncode != 0:
                 return ExecutionResult(
                     passed=False,
@@ -53,6 +90,7 @@ class LocalExecutionBackend(ExecutionBackend):
                     stderr=stderr,
                     exit_code=int(proc.returncode),
                     error_type=FailureType.RUNTIME_ERROR,
+                    solver_status=status,
                 )
 
             try:
@@ -64,6 +102,7 @@ class LocalExecutionBackend(ExecutionBackend):
                     stderr=stderr,
                     exit_code=int(proc.returncode or 0),
                     error_type=FailureType.OUTPUT_FORMAT,
+                    solver_status=status,
                 )
 
             return ExecutionResult(
@@ -72,4 +111,5 @@ class LocalExecutionBackend(ExecutionBackend):
                 stderr=stderr,
                 exit_code=int(proc.returncode or 0),
                 parsed_output=parsed,
+                solver_status=status,
             )
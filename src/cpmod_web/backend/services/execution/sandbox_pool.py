@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Awaitable, Callable
+
+logger = logging.getLogger(__name__)
+
+SandboxHook = Callable[[Any], Awaitable[None]]
+
+
+class SandboxLease:
+    """A sandbox checked out of a ``SandboxPool``; call ``discard`` if it must not be reused."""
+
+    def __init__(self, sandbox: Any):
+        self.sandbox = sandbox
+        self.reusable = True
+
+    def discard(self) -> None:
+        self.reusable = False
+
+
+class SandboxPool:
+    """Keeps up to ``max_idle`` prepared sandboxes warm between jobs.
+
+    ``create`` makes a new sandbox and ``prepare`` provisions it once (e.g. installs the runtime).
+    Before a warm sandbox is handed out again it must pass ``health_check``. Sandboxes idle for longer
+    than ``max_idle_seconds`` are killed instead. ``reset`` clears job state when a sandbox comes back.
+    All hooks take the sandbox, so the pool itself knows nothing about E2B.
+    """
+
+    def __init__(
+        self,
+        create: Callable[[], Awaitable[Any]],
+        *,
+        max_idle: int,
+        max_idle_seconds: float,
+        prepare: SandboxHook | None = None,
+        health_check: SandboxHook | None = None,
+        reset: SandboxHook | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._create = create
+        self.max_idle = max_idle
+        self.max_idle_seconds = max_idle_seconds
+        self._prepare = prepare
+        self._health_check = health_check
+        self._reset = reset
+        self._clock = clock
+        self._idle: deque[tuple[Any, float]] = deque()
+        self.stats = {'created': 0, 'reused': 0, 'expired': 0, 'unhealthy': 0, 'discarded': 0}
+
+    @property
+    def idle_count(self) -> int:
+        return len(self._idle)
+
+    @asynccontextmanager
+    async def lease(self) -> AsyncIterator[SandboxLease]:
+        lease = SandboxLease(await self.acquire())
+        try:
+            yield lease
+        except BaseException:
+            lease.discard()
+            raise
+        finally:
+            await self.release(lease.sandbox, reusable=lease.reusable)
+
+    async def acquire(self) -> Any:
+        await self._expire_idle()
+        while self._idle:
+            # Most recently used first, so the oldest idle sandboxes age out.
+            sandbox, _ = self._idle.pop()
+            try:
+                if self._health_check is not None:
+                    await self._health_check(sandbox)
+            except Exception as exc:
+                logger.info('Discarding unhealthy pooled sandbox: %s', exc)
+                self.stats['unhealthy'] += 1
+                await _kill(sandbox)
+                continue
+            self.stats['reused'] += 1
+            return sandbox
+
+        sandbox = await self._create()
+        self.stats['created'] += 1
+        if self._prepare is not None:
+            try:
+                await self._prepare(sandbox)
+            except BaseException:
+                await _kill(sandbox)
+                raise
+        return sandbox
+
+    async def release(self, sandbox: Any, *, reusable: bool = True) -> None:
+        if reusable and self.max_idle > 0:
+            try:
+                if self._reset is not None:
+                    await self._reset(sandbox)
+            except Exception as exc:
+                logger.info('Discarding pooled sandbox that failed to reset: %s', exc)
+                reusable = False
+            await self._expire_idle()
+            if reusable and len(self._idle) < self.max_idle:
+                self._idle.append((sandbox, self._clock()))
+                return
+        self.stats['discarded'] += 1
+        await _kill(sandbox)
+
+    async def close(self) -> None:
+        idle, self._idle = list(self._idle), deque()
+        await asyncio.gather(*(_kill(sandbox) for sandbox, _ in idle))
+
+    async def _expire_idle(self) -> None:
+        now = self._clock()
+        stale = [sandbox for sandbox, idle_since in self._idle if now - idle_since > self.max_idle_seconds]
+        if not stale:
+            return
+        self._idle = deque(entry for entry in self._idle if now - entry[1] <= self.max_idle_seconds)
+        self.stats['expired'] += len(stale)
+        await asyncio.gather(*(_kill(sandbox) for sandbox in stale))
+
+
+async def _kill(sandbox: Any) -> None:
+    try:
+        await sandbox.kill()
+    except Exception:
+        logger.debug('Failed to kill sandbox.', exc_info=True)
@@ -13,7 +13,8 @@ from ..models.domain import ArtifactType, ExecutionResult, FailureType
 from .dependency_policy import scan_supported_imports, supported_runtime_description
 from .execution.harness import execution_mode_from_metadata
 from .execution.factory import get_execution_backend
-from .storage_service import StorageService
+from .asset_cache import content_sha256
+from .storage_service import StorageService, serialize_json
 
 
 def _parse_key_names(raw: str) -> list[str]:
@@ -147,6 +148,9 @@ async def create_model_package_with_validation(
             'model_storage_path': model_storage_path,
             'problem_description_storage_path': description_storage_path,
             'input_data_storage_path': input_data_storage_path,
+            'model_sha256': content_sha256(model_code),
+            'problem_description_sha256': content_sha256(problem_description),
+            'input_data_sha256': content_sha256(serialize_json(input_data)),
             'metadata': metadata,
             'validation_status': 'running',
         }
@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from fastapi import HTTPException, Query, Response, status
+
+from ..db.queries import decode_cursor, encode_cursor
+
+MAX_PAGE_SIZE = 500
+NEXT_CURSOR_HEADER = 'X-Next-Cursor'
+
+
+@dataclass(frozen=True)
+class PageParams:
+    # ``limit`` is None when the client did not ask for paging; the full list is returned as before.
+    limit: int | None
+    cursor: str | None
+
+    @property
+    def fetch_limit(self) -> int | None:
+        # One extra row tells us whether another page exists without a count query.
+        return None if self.limit is None else self.limit + 1
+
+
+def page_params(
+    limit: int | None = Query(None, ge=1, le=MAX_PAGE_SIZE),
+    cursor: str | None = Query(None),
+) -> PageParams:
+    if cursor:
+        try:
+            decode_cursor(cursor)
+        except ValueError as exc:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
+    return PageParams(limit=limit, cursor=cursor)
+
+
+def finish_page(rows: list[dict], page: PageParams, response: Response) -> list[dict]:
+    """Trim the look-ahead row and advertise the next page's cursor in ``X-Next-Cursor``."""
+    if page.limit is not None and len(rows) > page.limit:
+        rows = rows[: page.limit]
+        response.headers[NEXT_CURSOR_HEADER] = encode_cursor(rows[-1])
+    return rows
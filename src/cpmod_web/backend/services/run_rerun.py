@@ -0,0 +1,143 @@
+from __future__ import annotations
+
+import posixpath
+from datetime import datetime, timezone
+from typing import Any
+from uuid import uuid4
+
+from ..config import get_settings
+from ..db import queries
+from ..models.domain import ArtifactType, RunStatus
+from .model_catalog import infer_run_selection
+from .storage_service import StorageService
+
+# Stage names accepted by the rerun API, mapped to the graph node the cloned run restarts at.
+RERUN_STAGES: dict[str, str] = {
+    'planning': 'planning',
+    'modifying': 'modification',
+    'executing': 'execution',
+    'validating': 'semantic_validation',
+}
+RERUNNABLE_STATUSES = {RunStatus.COMPLETED.value, RunStatus.NEEDS_REVIEW.value, RunStatus.FAILED.value}
+
+_NODE_ORDER = ['planning', 'modification', 'execution', 'semantic_validation']
+# State each node writes; a rerun clears it for the restart node and every node after it.
+_NODE_OUTPUT_KEYS = {
+    'planning': ('planner_output', 'planner_feedback', 'planner_validator_output', 'planner_validator_status', 'planner_validation_attempts'),
+    'modification': ('generated_code', 'generated_model_artifact_path'),
+    'execution': ('execution_output', 'execution_ok', 'execution_error', 'execution_attempts'),
+    'semantic_validation': ('validator_output', 'validator_status', 'validator_feedback', 'validator_attempts', 'change_summary', 'invariants'),
+}
+# State a node needs from earlier stages, with how to describe it when it is missing.
+_NODE_REQUIREMENTS = {
+    'planning': {'parser_output': 'parser output'},
+    'modification': {'planner_output': 'plan'},
+    'execution': {'generated_code': 'generated model'},
+    'semantic_validation': {'generated_code': 'generated model', 'execution_ok': 'successful execution'},
+}
+# Artifacts copied into the clone so its record shows what the restart was seeded with.
+_SEED_ARTIFACT_TYPES = {
+    'execution': (ArtifactType.GENERATED_MODEL,),
+    'semantic_validation': (ArtifactType.GENERATED_MODEL, ArtifactType.EXECUTION_LOG),
+}
+
+
+def build_rerun_state(state: dict[str, Any], from_stage: str) -> tuple[dict[str, Any], str]:
+    """Return the state a rerun starts from and the graph node it starts at.
+
+    Raises ``ValueError`` when the stage is unknown or ``state`` lacks what that stage needs.
+    """
+    node = RERUN_STAGES.get(from_stage)
+    if node is None:
+        raise ValueError(f'Cannot rerun from {from_stage!r}; expected one of {", ".join(RERUN_STAGES)}.')
+    if not state.get('base_model_code'):
+        raise ValueError('The source run has no stored workflow state to rerun from.')
+    for key, description in _NODE_REQUIREMENTS[node].items():
+        if not state.get(key):
+            raise ValueError(f'Cannot rerun from {from_stage}: the source run has no stored {description}.')
+
+    seeded = dict(state)
+    for restart_node in _NODE_ORDER[_NODE_ORDER.index(node):]:
+        for key in _NODE_OUTPUT_KEYS[restart_node]:
+            seeded.pop(key, None)
+    seeded.pop('final_status', None)
+    seeded.pop('failure_type', None)
+    settings = get_settings()
+    seeded['max_planner_validation_loops'] = settings.max_planner_validation_loops
+    seeded['max_execution_loops'] = settings.max_execution_loops
+    seeded['max_validator_loops'] = settings.max_validator_loops
+    return seeded, node
+
+
+def _seed_artifacts(run: dict[str, Any], *, node: str, state: dict[str, Any]) -> list[dict[str, Any]]:
+    """Latest artifact of each type the restart node builds on, preferring the one ``state`` points at."""
+    wanted = {artifact_type.value for artifact_type in _SEED_ARTIFACT_TYPES.get(node, ())}
+    if not wanted:
+        return []
+    model_path = state.get('generated_model_artifact_path')
+    latest: dict[str, dict[str, Any]] = {}
+    for artifact in queries.list_run_artifacts(run['id']):
+        artifact_type = artifact.get('type')
+        if artifact_type not in wanted or not artifact.get('storage_path'):
+            continue
+        current = latest.get(artifact_type)
+        if current is not None and current.get('storage_path') == model_path:
+            continue
+        latest[artifact_type] = artifact
+    return list(latest.values())
+
+
+def create_rerun(run: dict[str, Any], from_stage: str) -> dict[str, Any]:
+    """Clone a finished run as a pending run that resumes at ``from_stage``.
+
+    The clone reuses the source run's stored state, so the stages before ``from_stage`` are not
+    paid for again. Artifacts the restart builds on are copied under the new run.
+    """
+    if run['status'] not in RERUNNABLE_STATUSES:
+        raise ValueError('Only finished runs can be rerun.')
+    settings = get_settings()
+    storage = StorageService()
+    state = dict(run.get('state_json') or {})
+    if not state.get('generated_code') and state.get('generated_model_artifact_path'):
+        state['generated_code'] = storage.download_text(bucket=settings.artifacts_bucket, path=state['generated_model_artifact_path'])
+    seeded, node = build_rerun_state(state, from_stage)
+
+    rerun_id = str(uuid4())
+    seeded['run_id'] = rerun_id
+    artifact_rows: list[dict[str, Any]] = []
+    for artifact in _seed_artifacts(run, node=node, state=seeded):
+        target = f"runs/{rerun_id}/{artifact['type']}/{posixpath.basename(artifact['storage_path'])}"
+        storage.copy_path(bucket=settings.artifacts_bucket, from_path=artifact['storage_path'], to_path=target)
+        if artifact['storage_path'] == seeded.get('generated_model_artifact_path'):
+            seeded['generated_model_artifact_path'] = target
+        artifact_rows.append(
+            {
+                'run_id': rerun_id,
+                'type': artifact['type'],
+                'storage_path': target,
+                'metadata': {**(artifact.get('metadata') or {}), 'copied_from_run_id': run['id']},
+                'created_at': datetime.now(timezone.utc).isoformat(),
+            }
+        )
+
+    model_preset, model_provider, model_name, api_key_provider = infer_run_selection(run)
+    rerun = queries.create_workflow_run(
+        {
+            'id': rerun_id,
+            'change_request_id': run['change_request_id'],
+            'status': RunStatus.PENDING.value,
+            'model_config': model_preset,
+            'model_preset': model_preset,
+            'model_provider': model_provider,
+            'model_name': model_name,
+            'api_key_provider': api_key_provider,
+            'clarification_questions': [],
+            'clarification_answers': [],
+            'state_json': seeded,
+            'resume_from_stage': node,
+            'rerun_of_run_id': run['id'],
+            'rerun_from_stage': from_stage,
+        }
+    )
+    queries.add_run_artifacts(artifact_rows)
+    return rerun
@@ -2,52 +2,101 @@ from __future__ import annotations
 
 from ..config import get_settings
 from ..db import queries
+from .artifact_uploader import is_compressed
 from .model_catalog import infer_run_selection
 from .storage_service import StorageService
 
+EMBEDDED_KEYS = ('change_request', 'run_events', 'run_artifacts')
 
-def serialize_run(run: dict, *, include_details: bool = True) -> dict:
-    storage = StorageService()
-    settings = get_settings()
-    change_request = queries.get_change_request(run['change_request_id'])
-    model_package = queries.get_model_package(change_request['model_package_id']) if change_request else None
+
+def _runtime_input(change_request: dict | None) -> tuple[str, str | None, str | None]:
+    model_package = (change_request or {}).get('model_package')
     runtime_input_source = 'change_request_override' if change_request and change_request.get('override_input_data_storage_path') else 'base'
-    runtime_input_path = (
-        change_request.get('override_input_data_storage_path')
-        if runtime_input_source == 'change_request_override' and change_request
-        else model_package.get('input_data_storage_path') if model_package else None
-    )
-    runtime_input_filename = (
-        change_request.get('override_input_data_filename')
-        if runtime_input_source == 'change_request_override' and change_request
-        else model_package.get('input_data_filename') if model_package else None
-    )
-    model_preset, model_provider, model_name, api_key_provider = infer_run_selection(run)
-    artifacts = queries.list_run_artifacts(run['id']) if include_details else []
+    if runtime_input_source == 'change_request_override':
+        return runtime_input_source, change_request['override_input_data_storage_path'], change_request.get('override_input_data_filename')
+    if model_package:
+        return runtime_input_source, model_package.get('input_data_storage_path'), model_package.get('input_data_filename')
+    return runtime_input_source, None, None
+
+
+def attach_artifact_urls(artifacts: list[dict], signed_urls: dict[str, str | None]) -> list[dict]:
+    """Give each artifact a ``signed_url``, or a ``content_url`` on this API for gzipped ones.
+
+    A signed URL serves the stored bytes as-is, so compressed artifacts are read through the
+    content route instead, which un-gzips them and restores the original content type.
+    """
     for artifact in artifacts:
-        if artifact.get('storage_path'):
-            artifact['signed_url'] = storage.create_signed_url(bucket=settings.artifacts_bucket, path=artifact['storage_path'])
-    payload = {
-        **run,
-        'project_id': change_request.get('project_id') if change_request else None,
-        'model_package_id': change_request.get('model_package_id') if change_request else None,
-        'model_package_filename': model_package.get('filename') if model_package else None,
-        'change_request_summary': change_request.get('what_should_change') if change_request else None,
-        'runtime_input_source': runtime_input_source,
-        'runtime_input_filename': runtime_input_filename,
-        'runtime_input_file_url': (
-            storage.create_signed_url(bucket=settings.models_bucket, path=runtime_input_path)
-            if runtime_input_path
-            else None
-        ),
-        'model_preset': model_preset,
-        'model_provider': model_provider,
-        'model_name': model_name,
-        'api_key_provider': api_key_provider,
-        'credential_source': 'user_saved',
-        'clarification_questions': run.get('clarification_questions') or [],
-        'clarification_answers': run.get('clarification_answers') or [],
-        'events': queries.list_run_events(run['id']) if include_details else [],
-        'artifacts': artifacts,
-    }
-    return payload
+        if not artifact.get('storage_path'):
+            continue
+        if is_compressed(artifact):
+            artifact['signed_url'] = None
+            artifact['content_url'] = f"/runs/{artifact['run_id']}/artifacts/{artifact['id']}/content"
+        else:
+            artifact['signed_url'] = signed_urls.get(artifact['storage_path'])
+    return artifacts
+
+
+def signable_artifact_paths(artifacts: list[dict]) -> list[str]:
+    return [artifact['storage_path'] for artifact in artifacts if artifact.get('storage_path') and not is_compressed(artifact)]
+
+
+def _with_joins(runs: list[dict], *, include_details: bool) -> list[dict]:
+    """Runs carrying the embedded change request (and events/artifacts), fetching any that lack them in one query."""
+    needed = 'run_events' if include_details else 'change_request'
+    missing = [run['id'] for run in runs if needed not in run]
+    if not missing:
+        return runs
+    joined = {run['id']: run for run in queries.list_workflow_runs_joined(missing, include_details=include_details)}
+    return [joined.get(run['id'], run) if needed not in run else run for run in runs]
+
+
+def serialize_runs(runs: list[dict], *, include_details: bool = True) -> list[dict]:
+    """Serialize runs with a constant number of round-trips: one joined select and one signing call per bucket."""
+    if not runs:
+        return []
+    settings = get_settings()
+    storage = StorageService()
+    runs = _with_joins(runs, include_details=include_details)
+
+    input_paths = [_runtime_input(run.get('change_request'))[1] for run in runs]
+    artifact_paths = signable_artifact_paths(
+        [artifact for run in runs for artifact in (run.get('run_artifacts') or [] if include_details else [])]
+    )
+    input_urls = storage.create_signed_urls(bucket=settings.models_bucket, paths=[path for path in input_paths if path])
+    artifact_urls = storage.create_signed_urls(bucket=settings.artifacts_bucket, paths=artifact_paths)
+
+    payloads = []
+    for run in runs:
+        change_request = run.get('change_request')
+        model_package = (change_request or {}).get('model_package')
+        runtime_input_source, runtime_input_path, runtime_input_filename = _runtime_input(change_request)
+        model_preset, model_provider, model_name, api_key_provider = infer_run_selection(run)
+        artifacts = sorted(run.get('run_artifacts') or [], key=lambda item: item.get('created_at') or '') if include_details else []
+        attach_artifact_urls(artifacts, artifact_urls)
+        events = sorted(run.get('run_events') or [], key=lambda item: item.get('created_at') or '') if include_details else []
+        payloads.append(
+            {
+                **{key: value for key, value in run.items() if key not in EMBEDDED_KEYS},
+                'project_id': change_request.get('project_id') if change_request else None,
+                'model_package_id': change_request.get('model_package_id') if change_request else None,
+                'model_package_filename': model_package.get('filename') if model_package else None,
+                'change_request_summary': change_request.get('what_should_change') if change_request else None,
+                'runtime_input_source': runtime_input_source,
+                'runtime_input_filename': runtime_input_filename,
+                'runtime_input_file_url': input_urls.get(runtime_input_path) if runtime_input_path else None,
+                'model_preset': model_preset,
+                'model_provider': model_provider,
+                'model_name': model_name,
+                'api_key_provider': api_key_provider,
+                'credential_source': 'user_saved',
+                'clarification_questions': run.get('clarification_questions') or [],
+                'clarification_answers': run.get('clarification_answers') or [],
+                'events': events,
+                'artifacts': artifacts,
+            }
+        )
+    return payloads
+
+
+def serialize_run(run: dict, *, include_details: bool = True) -> dict:
+    return serialize_runs([run], include_details=include_details)[0]
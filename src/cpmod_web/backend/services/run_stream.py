@@ -0,0 +1,191 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+from typing import Any, AsyncIterator
+
+from ..config import get_settings
+from ..db import queries
+from ..db.supabase_client import create_supabase_admin_async
+from ..models.domain import RunStatus
+from .blocking_io import run_blocking
+from .run_serialization import attach_artifact_urls, signable_artifact_paths
+from .storage_service import StorageService
+
+logger = logging.getLogger(__name__)
+REALTIME_CHANNEL = 'api-run-stream'
+TERMINAL_STATUSES = {RunStatus.COMPLETED.value, RunStatus.NEEDS_REVIEW.value, RunStatus.FAILED.value}
+EVENT_PAGE_SIZE = 200
+HEARTBEAT_SECONDS = 15.0
+# How often a stream re-checks its run when no realtime notification arrives.
+LIVE_FALLBACK_SECONDS = 15.0
+POLL_FALLBACK_SECONDS = 2.5
+# Backoff before re-subscribing after the realtime channel fails; doubles up to the maximum.
+RESUBSCRIBE_BASE_SECONDS = 2.0
+RESUBSCRIBE_MAX_SECONDS = 60.0
+FAILED_CHANNEL_STATUSES = {'CHANNEL_ERROR', 'TIMED_OUT', 'CLOSED'}
+
+
+class RunChangeBroker:
+    """Fans Supabase realtime changes on a run's rows out to the streams watching that run.
+
+    Notifications only wake a stream early; every stream re-reads its run on wake, so a missed or
+    duplicated notification never loses or repeats data. A failed subscribe (or a channel that
+    later errors or closes) is retried with exponential backoff while streams are watching; with
+    none watching, the next ``subscribe`` starts over.
+    """
+
+    def __init__(self) -> None:
+        self.live = False
+        self._waiters: dict[str, set[asyncio.Event]] = {}
+        self._client: Any = None
+        self._starting: asyncio.Task[None] | None = None
+        self._failures = 0
+        self._restart_pending = False
+
+    def subscribe(self, run_id: str) -> asyncio.Event:
+        waiter = asyncio.Event()
+        self._waiters.setdefault(run_id, set()).add(waiter)
+        if self._starting is None:
+            self._starting = asyncio.create_task(self._start())
+        return waiter
+
+    def unsubscribe(self, run_id: str, waiter: asyncio.Event) -> None:
+        waiters = self._waiters.get(run_id)
+        if waiters is not None:
+            waiters.discard(waiter)
+            if not waiters:
+                del self._waiters[run_id]
+
+    def publish(self, run_id: str | None) -> None:
+        for waiter in self._waiters.get(run_id or '', ()):
+            waiter.set()
+
+    async def _start(self) -> None:
+        try:
+            self._client = await create_supabase_admin_async()
+            channel = self._client.channel(REALTIME_CHANNEL)
+            for table, event in (('run_events', 'INSERT'), ('run_artifacts', 'INSERT'), ('workflow_runs', 'UPDATE')):
+                channel.on_postgres_changes(event, schema='public', table=table, callback=self._on_change)
+            await channel.subscribe(self._on_status)
+        except Exception:
+            logger.exception('Realtime run stream notifications unavailable; streams will poll.')
+            self._schedule_restart()
+
+    def _schedule_restart(self) -> None:
+        self.live = False
+        if self._restart_pending:
+            return
+        self._restart_pending = True
+        delay = min(RESUBSCRIBE_MAX_SECONDS, RESUBSCRIBE_BASE_SECONDS * 2**self._failures)
+        self._failures += 1
+        self._starting = asyncio.get_running_loop().create_task(self._restart_after(delay))
+
+    async def _restart_after(self, delay: float) -> None:
+        client, self._client = self._client, None
+        if client is not None:
+            try:
+                await client.remove_all_channels()
+            except Exception:
+                logger.debug('Could not close the failed realtime client.', exc_info=True)
+        await asyncio.sleep(delay)
+        self._restart_pending = False
+        if not self._waiters:
+            self._starting = None
+            return
+        await self._start()
+
+    def _on_change(self, payload: dict[str, Any]) -> None:
+        record = (payload.get('data') or {}).get('record') or payload.get('new') or {}
+        self.publish(record.get('run_id') or record.get('id'))
+
+    def _on_status(self, status: Any, error: Exception | None = None) -> None:
+        name = str(getattr(status, 'value', status))
+        self.live = name == 'SUBSCRIBED'
+        if self.live:
+            self._failures = 0
+            return
+        logger.warning('Realtime run stream notifications %s (%s); streams will poll.', status, error)
+        if name in FAILED_CHANNEL_STATUSES:
+            self._schedule_restart()
+
+
+_broker: RunChangeBroker | None = None
+
+
+def get_run_change_broker() -> RunChangeBroker:
+    global _broker
+    if _broker is None:
+        _broker = RunChangeBroker()
+    return _broker
+
+
+def _sse(event: str, data: Any, *, event_id: str | None = None) -> str:
+    lines = [f'event: {event}']
+    if event_id:
+        lines.append(f'id: {event_id}')
+    lines.append(f'data: {json.dumps(data, default=str)}')
+    return '\n'.join(lines) + '\n\n'
+
+
+def _sign_artifacts(artifacts: list[dict]) -> list[dict]:
+    urls = StorageService().create_signed_urls(bucket=get_settings().artifacts_bucket, paths=signable_artifact_paths(artifacts))
+    return attach_artifact_urls(artifacts, urls)
+
+
+async def stream_run(run_id: str, *, after: str | None = None) -> AsyncIterator[str]:
+    """Server-sent events for a run: ``run_event`` and ``artifact`` rows as they are written and
+    ``status`` whenever the run row changes, ending with ``end`` once the run is terminal.
+
+    ``run_event`` ids are pagination cursors, so a reconnect with ``Last-Event-ID`` resumes after
+    the last event the client saw. Artifacts and the current status are always resent on connect.
+    """
+    broker = get_run_change_broker()
+    waiter = broker.subscribe(run_id)
+    event_cursor = after
+    seen_artifacts: set[str] = set()
+    last_status: dict[str, Any] | None = None
+    idle_seconds = 0.0
+    try:
+        while True:
+            waiter.clear()
+            events = await run_blocking(queries.list_run_events, run_id, limit=EVENT_PAGE_SIZE, cursor=event_cursor)
+            for event in events:
+                event_cursor = queries.encode_cursor(event)
+                yield _sse('run_event', event, event_id=event_cursor)
+
+            artifacts = [
+                artifact
+                for artifact in await run_blocking(queries.list_run_artifacts, run_id)
+                if artifact['id'] not in seen_artifacts
+            ]
+            if artifacts:
+                for artifact in await run_blocking(_sign_artifacts, artifacts):
+                    seen_artifacts.add(artifact['id'])
+                    yield _sse('artifact', artifact)
+
+            status = await run_blocking(queries.get_workflow_run_status, run_id)
+            if status is None:
+                yield _sse('end', {'reason': 'not_found'})
+                return
+            if status != last_status:
+                last_status = status
+                yield _sse('status', status)
+            if len(events) == EVENT_PAGE_SIZE:
+                continue
+            if status['status'] in TERMINAL_STATUSES:
+                yield _sse('end', {'status': status['status']})
+                return
+
+            fallback = LIVE_FALLBACK_SECONDS if broker.live else POLL_FALLBACK_SECONDS
+            try:
+                await asyncio.wait_for(waiter.wait(), timeout=fallback)
+                idle_seconds = 0.0
+            except asyncio.TimeoutError:
+                idle_seconds += fallback
+                if idle_seconds >= HEARTBEAT_SECONDS:
+                    idle_seconds = 0.0
+                    yield ': keep-alive\n\n'
+    finally:
+        broker.unsubscribe(run_id, waiter)
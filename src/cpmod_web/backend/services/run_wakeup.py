@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import Any
+
+from ..config import get_settings
+from ..db.supabase_client import create_supabase_admin_async
+
+logger = logging.getLogger(__name__)
+REALTIME_CHANNEL = 'worker-pending-runs'
+
+
+class LocalRunWakeup:
+    """In-process wakeup signal; also the stand-in used when no realtime feed is available.
+
+    ``live`` says whether ``notify`` is actually being driven. While it is false the worker
+    keeps polling at its short interval instead of trusting notifications.
+    """
+
+    def __init__(self, *, live: bool = True):
+        self.live = live
+        self._event = asyncio.Event()
+
+    async def start(self) -> None:
+        return None
+
+    async def close(self) -> None:
+        return None
+
+    def notify(self, run_id: str | None = None) -> None:
+        self._event.set()
+
+    async def wait(self, timeout: float) -> bool:
+        """Wait for a notification or ``timeout`` seconds; returns whether one arrived."""
+        try:
+            await asyncio.wait_for(self._event.wait(), timeout)
+        except asyncio.TimeoutError:
+            return False
+        self._event.clear()
+        return True
+
+
+class SupabaseRealtimeWakeup(LocalRunWakeup):
+    """Wakes the worker from a Supabase realtime subscription on pending ``workflow_runs`` rows."""
+
+    def __init__(self) -> None:
+        super().__init__(live=False)
+        self._client: Any = None
+        self._channel: Any = None
+
+    async def start(self) -> None:
+        try:
+            self._client = await create_supabase_admin_async()
+            channel = self._client.channel(REALTIME_CHANNEL)
+            # New runs are inserted as pending; clarification resumes flip an existing row back to pending.
+            for event in ('INSERT', 'UPDATE'):
+                channel.on_postgres_changes(
+                    event,
+                    schema='public',
+                    table='workflow_runs',
+                    filter='status=eq.pending',
+                    callback=self._on_change,
+                )
+            self._channel = await channel.subscribe(self._on_status)
+        except Exception:
+            logger.exception('Realtime run notifications unavailable; falling back to polling.')
+            self.live = False
+
+    async def close(self) -> None:
+        if self._client is not None and self._channel is not None:
+            try:
+                await self._client.remove_channel(self._channel)
+            except Exception:
+                logger.debug('Failed to remove realtime channel.', exc_info=True)
+
+    def _on_change(self, payload: dict[str, Any]) -> None:
+        record = (payload.get('data') or {}).get('record') or payload.get('new') or {}
+        self.notify(record.get('id'))
+
+    def _on_status(self, status: Any, error: Exception | None = None) -> None:
+        state = str(getattr(status, 'value', status))
+        was_live = self.live
+        self.live = state == 'SUBSCRIBED'
+        if self.live and not was_live:
+            logger.info('Subscribed to realtime run notifications.')
+            # Anything queued while the feed was down is picked up on the next claim.
+            self.notify()
+        elif was_live and not self.live:
+            logger.warning('Realtime run notifications %s (%s); falling back to polling.', state.lower(), error)
+
+
+def get_run_wakeup() -> LocalRunWakeup:
+    if get_settings().worker_wakeup == 'realtime':
+        return SupabaseRealtimeWakeup()
+    return LocalRunWakeup(live=False)
@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Protocol
+
+from ..config import get_settings
+
+
+class SignedUrlCache(Protocol):
+    """Backend for caching signed storage URLs keyed by ``(bucket, path, expires_in)``.
+
+    ``get`` must only return URLs that are still good for at least ``min_ttl`` seconds. A shared
+    backend (Redis, memcached, ...) can be plugged in with ``set_signed_url_cache``.
+    """
+
+    def get(self, key: tuple[str, str, int], *, min_ttl: float) -> str | None: ...
+
+    def set(self, key: tuple[str, str, int], url: str, *, expires_at: float) -> None: ...
+
+    def discard(self, bucket: str, paths: list[str]) -> None: ...
+
+
+class InMemorySignedUrlCache:
+    """Bounded LRU of signed URLs for one process."""
+
+    def __init__(self, max_entries: int = 4096):
+        self.max_entries = max_entries
+        self._entries: OrderedDict[tuple[str, str, int], tuple[str, float]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: tuple[str, str, int], *, min_ttl: float) -> str | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            url, expires_at = entry
+            if expires_at - time.time() < min_ttl:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return url
+
+    def set(self, key: tuple[str, str, int], url: str, *, expires_at: float) -> None:
+        if self.max_entries <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (url, expires_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def discard(self, bucket: str, paths: list[str]) -> None:
+        removed = set(paths)
+        with self._lock:
+            for key in [key for key in self._entries if key[0] == bucket and key[1] in removed]:
+                del self._entries[key]
+
+
+_override: SignedUrlCache | None = None
+
+
+@lru_cache(maxsize=1)
+def _default_cache() -> InMemorySignedUrlCache:
+    return InMemorySignedUrlCache(max_entries=get_settings().signed_url_cache_max_entries)
+
+
+def get_signed_url_cache() -> SignedUrlCache:
+    return _override if _override is not None else _default_cache()
+
+
+def set_signed_url_cache(cache: SignedUrlCache | None) -> None:
+    """Install a shared cache backend, or ``None`` to go back to the in-process LRU."""
+    global _override
+    _override = cache
+
+
+def refresh_margin(expires_in: int) -> float:
+    """Seconds before expiry at which a cached URL stops being handed out."""
+    return min(float(get_settings().signed_url_refresh_margin_seconds), expires_in / 2)
@@ -1,11 +1,28 @@
 from __future__ import annotations
 
+import gzip
 import json
+import time
 from pathlib import Path
 from typing import Any
 
 from ..config import get_settings
 from ..db.supabase_client import get_supabase_admin
+from .signed_url_cache import get_signed_url_cache, refresh_margin
+
+
+def serialize_json(payload: dict[str, Any]) -> str:
+    """The exact text ``upload_json`` stores, so callers can hash what ends up in storage."""
+    return json.dumps(payload, indent=2)
+
+
+def decode_text(data: bytes | bytearray | str) -> str:
+    if not isinstance(data, (bytes, bytearray)):
+        return str(data)
+    if data[:2] == b'\x1f\x8b':
+        # Large run artifacts are stored gzipped.
+        data = gzip.decompress(data)
+    return data.decode('utf-8')
 
 
 class StorageService:
@@ -25,25 +42,69 @@ class StorageService:
         return self.upload_bytes(bucket=bucket, path=path, content=content.encode('utf-8'), content_type=content_type)
 
     def upload_json(self, *, bucket: str, path: str, payload: dict[str, Any]) -> str:
-        return self.upload_text(bucket=bucket, path=path, content=json.dumps(payload, indent=2), content_type='application/json')
+        return self.upload_text(bucket=bucket, path=path, content=serialize_json(payload), content_type='application/json')
 
-    def download_text(self, *, bucket: str, path: str) -> str:
+    def copy_path(self, *, bucket: str, from_path: str, to_path: str) -> str:
+        self.client.storage.from_(bucket).copy(from_path, to_path)
+        return to_path
+
+    def download_bytes(self, *, bucket: str, path: str) -> bytes:
         data = self.client.storage.from_(bucket).download(path)
-        return data.decode('utf-8') if isinstance(data, (bytes, bytearray)) else str(data)
+        return bytes(data) if isinstance(data, (bytes, bytearray)) else str(data).encode('utf-8')
+
+    def download_text(self, *, bucket: str, path: str) -> str:
+        return decode_text(self.client.storage.from_(bucket).download(path))
 
     def create_signed_url(self, *, bucket: str, path: str, expires_in: int = 3600) -> str | None:
+        cache = get_signed_url_cache()
+        key = (bucket, path, expires_in)
+        cached = cache.get(key, min_ttl=refresh_margin(expires_in))
+        if cached:
+            return cached
         try:
             response = self.client.storage.from_(bucket).create_signed_url(path, expires_in)
             if isinstance(response, dict):
-                return response.get('signedURL') or response.get('signed_url')
-            return getattr(response, 'get', lambda *_: None)('signedURL')
+                url = response.get('signedURL') or response.get('signed_url')
+            else:
+                url = getattr(response, 'get', lambda *_: None)('signedURL')
         except Exception:
             return None
+        if url:
+            cache.set(key, url, expires_at=time.time() + expires_in)
+        return url
+
+    def create_signed_urls(self, *, bucket: str, paths: list[str], expires_in: int = 3600) -> dict[str, str | None]:
+        """Sign many paths in one request; paths that could not be signed map to ``None``.
+
+        Paths with a cached URL that is not about to expire are served from the cache.
+        """
+        cache = get_signed_url_cache()
+        min_ttl = refresh_margin(expires_in)
+        signed: dict[str, str | None] = {}
+        for path in dict.fromkeys(path for path in paths if path):
+            signed[path] = cache.get((bucket, path, expires_in), min_ttl=min_ttl)
+        missing = [path for path, url in signed.items() if not url]
+        if not missing:
+            return signed
+        try:
+            response = self.client.storage.from_(bucket).create_signed_urls(missing, expires_in)
+        except Exception:
+            return signed
+        expires_at = time.time() + expires_in
+        for item in response or []:
+            entry = item if isinstance(item, dict) else getattr(item, '__dict__', {})
+            if entry.get('path') in signed and not entry.get('error'):
+                url = entry.get('signedURL') or entry.get('signedUrl') or entry.get('signed_url')
+                signed[entry['path']] = url
+                if url:
+                    cache.set((bucket, entry['path'], expires_in), url, expires_at=expires_at)
+        return signed
 
     def delete_paths(self, *, bucket: str, paths: list[str]) -> None:
         clean_paths = [path for path in paths if path]
         if not clean_paths:
             return
+        get_signed_url_cache().discard(bucket, clean_paths)
         try:
             self.client.storage.from_(bucket).remove(clean_paths)
         except Exception:
@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from ..config import get_settings
+from ..db import queries
+from ..middleware.auth import AuthenticatedUser, get_current_user
+from ..routers import runs
+from ..services import storage_service
+from ..services.artifact_uploader import encode_artifact
+
+RUN_ID = 'run-1'
+USER_ID = 'user-1'
+
+
+class FakeBucket:
+    def __init__(self, objects: dict[str, bytes]):
+        self.objects = objects
+
+    def download(self, path: str) -> bytes:
+        return self.objects[path]
+
+    def create_signed_urls(self, paths: list[str], expires_in: int) -> list[dict]:
+        return [{'path': path, 'signedURL': f'https://storage.test/{path}?token=signed'} for path in paths]
+
+
+class FakeStorage:
+    def __init__(self, objects: dict[str, bytes]):
+        self.bucket = FakeBucket(objects)
+
+    def from_(self, bucket: str) -> FakeBucket:
+        return self.bucket
+
+
+class FakeClient:
+    def __init__(self, objects: dict[str, bytes]):
+        self.storage = FakeStorage(objects)
+
+
+def _artifact(artifact_id: str, artifact_type: str, filename: str, content: str, content_type: str) -> tuple[dict, bytes]:
+    filename, body, _, metadata = encode_artifact(filename, content, content_type)
+    row = {
+        'id': artifact_id,
+        'run_id': RUN_ID,
+        'type': artifact_type,
+        'storage_path': f'runs/{RUN_ID}/{artifact_type}/{filename}',
+        'metadata': metadata,
+        'created_at': '2026-01-01T00:00:00+00:00',
+    }
+    return row, body
+
+
+@pytest.fixture
+def diff_text() -> str:
+    lines = ''.join(f'+line {index}\n' for index in range(get_settings().artifact_gzip_min_bytes // 8))
+    return f'--- model.py\n+++ model.py\n{lines}'
+
+
+@pytest.fixture
+def client(monkeypatch: pytest.MonkeyPatch, diff_text: str) -> TestClient:
+    diff, diff_body = _artifact('artifact-diff', 'diff', 'model.diff', diff_text, 'text/plain')
+    model, model_body = _artifact('artifact-model', 'generated_model', 'model.py', 'print(1)\n', 'text/x-python')
+    artifacts = [diff, model]
+    objects = {diff['storage_path']: diff_body, model['storage_path']: model_body}
+    run = {
+        'id': RUN_ID,
+        'change_request_id': 'cr-1',
+        'status': 'completed',
+        'change_request': {'id': 'cr-1', 'project_id': 'project-1'},
+        'run_events': [],
+        'run_artifacts': [dict(artifact) for artifact in artifacts],
+    }
+
+    monkeypatch.setattr(storage_service, 'get_supabase_admin', lambda: FakeClient(objects))
+    monkeypatch.setattr(queries, 'get_workflow_run', lambda run_id: dict(run) if run_id == RUN_ID else None)
+    monkeypatch.setattr(queries, 'get_change_request', lambda change_request_id: run['change_request'])
+    monkeypatch.setattr(queries, 'get_project', lambda *, project_id, user_id: {'id': project_id} if user_id == USER_ID else None)
+    monkeypatch.setattr(
+        queries,
+        'get_run_artifact',
+        lambda *, run_id, artifact_id: next((artifact for artifact in artifacts if artifact['id'] == artifact_id), None),
+    )
+
+    app = FastAPI()
+    app.include_router(runs.router)
+    app.dependency_overrides[get_current_user] = lambda: AuthenticatedUser(id=USER_ID)
+    return TestClient(app)
+
+
+def test_compressed_artifact_is_served_decoded_through_the_viewer_path(client: TestClient, diff_text: str):
+    run = client.get(f'/runs/{RUN_ID}').json()
+    diff = next(artifact for artifact in run['artifacts'] if artifact['type'] == 'diff')
+    assert diff['storage_path'].endswith('.gz')
+    assert diff['signed_url'] is None
+
+    response = client.get(diff['content_url'])
+
+    assert response.status_code == 200
+    assert response.headers['content-type'].startswith('text/plain')
+    assert 'filename="model.diff"' in response.headers['content-disposition']
+    assert response.text == diff_text
+
+
+def test_plain_artifact_keeps_its_signed_url(client: TestClient):
+    run = client.get(f'/runs/{RUN_ID}').json()
+    model = next(artifact for artifact in run['artifacts'] if artifact['type'] == 'generated_model')
+
+    assert model['signed_url'].startswith('https://storage.test/')
+    assert model['content_url'] is None
+    assert client.get(f"/runs/{RUN_ID}/artifacts/{model['id']}/content").text == 'print(1)\n'
+
+
+def test_artifact_content_is_scoped_to_the_run_owner(client: TestClient):
+    client.app.dependency_overrides[get_current_user] = lambda: AuthenticatedUser(id='someone-else')
+
+    assert client.get(f'/runs/{RUN_ID}/artifacts/artifact-diff/content').status_code == 404
@@ -2,11 +2,14 @@ from __future__ import annotations
 
 import asyncio
 import logging
+from typing import Any
 
 from .config import get_settings
 from .db import queries
 from .db.queries import QueryExecutionError
 from .models.domain import FailureType, RunStatus
+from .services.blocking_io import run_blocking
+from .services.run_wakeup import LocalRunWakeup, get_run_wakeup
 from .workflow.service import run_workflow
 
 POLL_INTERVAL_SECONDS = 2.5
@@ -21,45 +24,88 @@ NOISY_LOGGERS = (
 )
 
 
-async def poll_and_run() -> None:
-    while True:
-        try:
-            run = queries.claim_pending_run()
-            if run:
-                try:
-                    await run_workflow(run['id'])
-                except Exception as exc:
-                    logger.exception('Workflow run %s failed.', run['id'])
-                    try:
-                        queries.update_workflow_run(
-                            run['id'],
-                            {
-                                'status': RunStatus.FAILED.value,
-                                'failure_type': FailureType.INTERNAL_ERROR.value,
-                                'last_error': str(exc),
-                            },
-                        )
-                        queries.add_run_event(
-                            {
-                                'run_id': run['id'],
-                                'stage': 'worker',
-                                'outcome': 'failed',
-                                'failure_type': FailureType.INTERNAL_ERROR.value,
-                                'message': str(exc),
-                                'attempt': 1,
-                                'payload': {},
-                            }
-                        )
-                    except Exception:
-                        logger.exception('Failed to persist worker failure state for run %s.', run['id'])
-        except QueryExecutionError as exc:
-            if exc.transient:
-                logger.warning('Transient worker poll failure while claiming pending runs: %s', exc)
-            else:
+def _record_worker_failure(run_id: str, exc: Exception) -> None:
+    try:
+        queries.update_workflow_run(
+            run_id,
+            {
+                'status': RunStatus.FAILED.value,
+                'failure_type': FailureType.INTERNAL_ERROR.value,
+                'last_error': str(exc),
+            },
+        )
+        queries.add_run_event(
+            {
+                'run_id': run_id,
+                'stage': 'worker',
+                'outcome': 'failed',
+                'failure_type': FailureType.INTERNAL_ERROR.value,
+                'message': str(exc),
+                'attempt': 1,
+                'payload': {},
+            }
+        )
+    except Exception:
+        logger.exception('Failed to persist worker failure state for run %s.', run_id)
+
+
+async def _run_claimed(run: dict[str, Any], slots: asyncio.Semaphore) -> None:
+    try:
+        await run_workflow(run['id'])
+    except Exception as exc:
+        logger.exception('Workflow run %s failed.', run['id'])
+        await run_blocking(_record_worker_failure, run['id'], exc)
+    finally:
+        slots.release()
+
+
+async def _acquire_slots(slots: asyncio.Semaphore, wanted: int) -> int:
+    # Wait for one free slot, then take whatever else is free right now without blocking.
+    await slots.acquire()
+    acquired = 1
+    while acquired < wanted and not slots.locked():
+        await slots.acquire()
+        acquired += 1
+    return acquired
+
+
+async def poll_and_run(wakeup: LocalRunWakeup | None = None) -> None:
+    settings = get_settings()
+    wakeup = wakeup or get_run_wakeup()
+    await wakeup.start()
+    concurrency = max(1, settings.worker_concurrency)
+    batch_size = max(1, min(settings.worker_claim_batch_size, concurrency))
+    slots = asyncio.Semaphore(concurrency)
+    active: set[asyncio.Task[None]] = set()
+    logger.info('Worker running up to %s workflows at once (claim batch %s).', concurrency, batch_size)
+
+    try:
+        while True:
+            free = await _acquire_slots(slots, batch_size)
+            runs: list[dict[str, Any]] = []
+            try:
+                runs = await run_blocking(queries.claim_pending_runs, free)
+            except QueryExecutionError as exc:
+                if exc.transient:
+                    logger.warning('Transient worker poll failure while claiming pending runs: %s', exc)
+                else:
+                    logger.exception('Worker poll cycle failed while claiming pending runs.')
+            except Exception:
                 logger.exception('Worker poll cycle failed while claiming pending runs.')
-        except Exception:
-            logger.exception('Worker poll cycle failed while claiming pending runs.')
-        await asyncio.sleep(POLL_INTERVAL_SECONDS)
+
+            for run in runs:
+                task = asyncio.create_task(_run_claimed(run, slots), name=f'workflow-run-{run["id"]}')
+                active.add(task)
+                task.add_done_callback(active.discard)
+            for _ in range(free - len(runs)):
+                slots.release()
+
+            # A full batch means more runs are probably queued; claim again as soon as a slot frees up.
+            # Otherwise sleep until a run is queued, polling slowly in case a notification is missed.
+            if len(runs) < free:
+                await wakeup.wait(settings.worker_fallback_poll_seconds if wakeup.live else POLL_INTERVAL_SECONDS)
+    finally:
+        await wakeup.close()
 
 
 if __name__ == '__main__':
@@ -1,9 +1,10 @@
 from __future__ import annotations
 
-from typing import Any
+from typing import Any, Callable
 
 from langgraph.graph import END, START, StateGraph
 
+from ..services.blocking_io import run_blocking
 from .prompts import (
     build_clarification_assessor_prompt,
     build_modifier_prompt,
@@ -23,6 +24,15 @@ from .schemas import (
 from .state import WorkflowState
 
 
+def _offloaded(node: Callable[[WorkflowState], WorkflowState]):
+    """Async wrapper running a node's blocking LLM, PostgREST and storage calls on the I/O pool."""
+
+    async def run_node(state: WorkflowState) -> WorkflowState:
+        return await run_blocking(node, state)
+
+    return run_node
+
+
 def build_graph(runtime: Any, *, start_node: str = 'parsing'):
     graph = StateGraph(WorkflowState)
 
@@ -177,22 +187,26 @@ def build_graph(runtime: Any, *, start_node: str = 'parsing'):
 
     async def execution_node(state: WorkflowState) -> WorkflowState:
         attempt = int(state.get('execution_attempts', 0) or 0) + 1
-        runtime.log_stage('execution', 'started', attempt=attempt)
+        await run_blocking(runtime.log_stage, 'execution', 'started', attempt=attempt)
         result = await runtime.executor.execute_model(
             code=state['generated_code'],
             input_data=state['input_data'],
             metadata=state.get('metadata'),
         )
-        runtime.save_execution_log(result=result, attempt=attempt)
+        await run_blocking(runtime.save_execution_log, result=result, attempt=attempt)
         if result.passed:
-            runtime.log_stage('execution', 'succeeded', attempt=attempt, message='Generated model executed successfully.')
+            message = 'Generated model executed successfully.'
+            if result.solver_status == 'timeout_incumbent':
+                message = 'Generated model hit the solver time limit and returned its best incumbent.'
+            await run_blocking(runtime.log_stage, 'execution', 'succeeded', attempt=attempt, message=message)
             return {
                 'execution_ok': True,
                 'execution_output': result.model_dump(),
                 'execution_error': '',
                 'execution_attempts': attempt,
             }
-        runtime.log_stage(
+        await run_blocking(
+            runtime.log_stage,
             'execution',
             'failed',
             attempt=attempt,
@@ -262,15 +276,15 @@ def build_graph(runtime: Any, *, start_node: str = 'parsing'):
         runtime.log_stage('finalize', 'succeeded', attempt=1, message=f'Run finished with status {final_status}.')
         return {'final_status': final_status, 'failure_type': failure_type}
 
-    graph.add_node('parsing', parsing_node)
-    graph.add_node('clarification_assessment', clarification_node)
-    graph.add_node('pause_for_clarification', pause_node)
-    graph.add_node('planning', planner_node)
-    graph.add_node('plan_validation', plan_validator_node)
-    graph.add_node('modification', modifier_node)
+    graph.add_node('parsing', _offloaded(parsing_node))
+    graph.add_node('clarification_assessment', _offloaded(clarification_node))
+    graph.add_node('pause_for_clarification', _offloaded(pause_node))
+    graph.add_node('planning', _offloaded(planner_node))
+    graph.add_node('plan_validation', _offloaded(plan_validator_node))
+    graph.add_node('modification', _offloaded(modifier_node))
     graph.add_node('execution', execution_node)
-    graph.add_node('semantic_validation', semantic_validator_node)
-    graph.add_node('finalize', finalize_node)
+    graph.add_node('semantic_validation', _offloaded(semantic_validator_node))
+    graph.add_node('finalize', _offloaded(finalize_node))
 
     graph.add_edge(START, start_node)
     if start_node == 'parsing':
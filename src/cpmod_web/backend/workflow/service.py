@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import json
+import logging
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from typing import Any
@@ -8,6 +9,9 @@ from typing import Any
 from ..config import get_settings
 from ..db import queries
 from ..models.domain import ArtifactType, EventOutcome, FailureType, RunStatus
+from ..services.artifact_uploader import ArtifactUploader, encode_artifact
+from ..services.asset_cache import download_asset_text
+from ..services.blocking_io import run_blocking
 from ..services.credential_service import CredentialService
 from ..services.diff_service import build_unified_diff
 from ..services.execution.factory import get_execution_backend
@@ -17,6 +21,8 @@ from ..services.storage_service import StorageService
 from .graph import build_graph
 from .state import WorkflowState
 
+logger = logging.getLogger(__name__)
+
 
 def _utcnow_iso() -> str:
     return datetime.now(timezone.utc).isoformat()
@@ -30,6 +36,7 @@ class ProductWorkflowRuntime:
     storage: StorageService
     llm: LLMService
     executor: Any
+    artifacts: ArtifactUploader
 
     def log_stage(self, stage: str, outcome: str, *, attempt: int = 1, message: str | None = None, failure_type: str | None = None, payload: dict[str, Any] | None = None) -> None:
         queries.add_run_event(
@@ -43,23 +50,33 @@ class ProductWorkflowRuntime:
                 'payload': payload or {},
             }
         )
+        # Stage boundaries are a natural point to publish artifacts whose uploads have landed.
+        self.artifacts.insert_completed()
 
     def _artifact_storage_path(self, artifact_type: ArtifactType, filename: str) -> str:
         return f"runs/{self.run['id']}/{artifact_type.value}/{filename}"
 
     def save_artifact_text(self, *, artifact_type: ArtifactType, filename: str, content: str, metadata: dict[str, Any] | None = None, content_type: str = 'text/plain') -> str:
+        """Queue an artifact for background upload and return the storage path it will have."""
+        filename, body, content_type, encoding_metadata = encode_artifact(filename, content, content_type)
         storage_path = self._artifact_storage_path(artifact_type, filename)
-        self.storage.upload_text(bucket=get_settings().artifacts_bucket, path=storage_path, content=content, content_type=content_type)
-        queries.add_run_artifact(
-            {
+        self.artifacts.enqueue(
+            path=storage_path,
+            body=body,
+            content_type=content_type,
+            row={
                 'run_id': self.run['id'],
                 'type': artifact_type.value,
-                'storage_path': storage_path,
-                'metadata': metadata or {},
-            }
+                'metadata': {**(metadata or {}), **encoding_metadata},
+            },
         )
         return storage_path
 
+    def flush_artifacts(self) -> None:
+        failed = self.artifacts.flush()
+        if failed:
+            logger.warning('Run %s finished with %s artifact(s) that could not be uploaded: %s', self.run['id'], len(failed), ', '.join(failed))
+
     def save_generated_model(self, *, code: str, attempt: int) -> str:
         return self.save_artifact_text(
             artifact_type=ArtifactType.GENERATED_MODEL,
@@ -92,6 +109,7 @@ class ProductWorkflowRuntime:
         self.model_package['parser_output'] = parser_output
 
     def persist_pause(self, *, state: WorkflowState, questions: list[str]) -> None:
+        self.flush_artifacts()
         queries.update_workflow_run(
             self.run['id'],
             {
@@ -112,6 +130,7 @@ class ProductWorkflowRuntime:
                 metadata={'final_status': final_status},
                 content_type='text/plain',
             )
+        self.flush_artifacts()
         queries.update_workflow_run(
             self.run['id'],
             {
@@ -128,10 +147,17 @@ class ProductWorkflowRuntime:
 
 
 def _load_model_package_assets(model_package: dict[str, Any], storage: StorageService) -> tuple[str, str, dict[str, Any]]:
-    settings = get_settings()
-    base_model_code = storage.download_text(bucket=settings.models_bucket, path=model_package['model_storage_path'])
-    problem_description = storage.download_text(bucket=settings.models_bucket, path=model_package['problem_description_storage_path'])
-    input_data = json.loads(storage.download_text(bucket=settings.models_bucket, path=model_package['input_data_storage_path']))
+    bucket = get_settings().models_bucket
+    base_model_code = download_asset_text(storage, bucket=bucket, path=model_package['model_storage_path'], sha256=model_package.get('model_sha256'))
+    problem_description = download_asset_text(
+        storage,
+        bucket=bucket,
+        path=model_package['problem_description_storage_path'],
+        sha256=model_package.get('problem_description_sha256'),
+    )
+    input_data = json.loads(
+        download_asset_text(storage, bucket=bucket, path=model_package['input_data_storage_path'], sha256=model_package.get('input_data_sha256'))
+    )
     return base_model_code, problem_description, input_data
 
 
@@ -139,19 +165,23 @@ def _load_effective_runtime_input(
     *,
     change_request: dict[str, Any],
     model_package: dict[str, Any],
+    base_input_data: dict[str, Any],
     storage: StorageService,
 ) -> tuple[dict[str, Any], str, str]:
-    settings = get_settings()
     if change_request.get('override_input_data_storage_path'):
         input_data = json.loads(
-            storage.download_text(bucket=settings.models_bucket, path=change_request['override_input_data_storage_path'])
+            download_asset_text(
+                storage,
+                bucket=get_settings().models_bucket,
+                path=change_request['override_input_data_storage_path'],
+                sha256=change_request.get('override_input_data_sha256'),
+            )
         )
         return (
             input_data,
             'change_request_override',
             change_request.get('override_input_data_filename') or model_package.get('input_data_filename') or 'input_data.json',
         )
-    base_input_data = json.loads(storage.download_text(bucket=settings.models_bucket, path=model_package['input_data_storage_path']))
     return base_input_data, 'base', model_package.get('input_data_filename') or 'input_data.json'
 
 
@@ -168,7 +198,8 @@ def _merge_resume_state(run: dict[str, Any]) -> WorkflowState:
     return state
 
 
-async def run_workflow(run_id: str) -> dict[str, Any]:
+def _prepare_run(run_id: str) -> tuple[ProductWorkflowRuntime, WorkflowState, str]:
+    """Load everything a run needs with blocking queries and downloads; called on the I/O pool."""
     run = queries.get_workflow_run(run_id)
     if not run:
         raise ValueError(f'Workflow run {run_id} does not exist.')
@@ -193,16 +224,26 @@ async def run_workflow(run_id: str) -> dict[str, Any]:
         api_key=api_key,
     )
     executor = get_execution_backend()
-    runtime = ProductWorkflowRuntime(run=run, change_request=change_request, model_package=model_package, storage=storage, llm=llm, executor=executor)
+    artifacts = ArtifactUploader(storage, bucket=get_settings().artifacts_bucket)
+    runtime = ProductWorkflowRuntime(
+        run=run,
+        change_request=change_request,
+        model_package=model_package,
+        storage=storage,
+        llm=llm,
+        executor=executor,
+        artifacts=artifacts,
+    )
 
     if run.get('resume_from_stage'):
         state: WorkflowState = _merge_resume_state(run)
         start_node = run['resume_from_stage']
     else:
-        base_model_code, problem_description, _ = _load_model_package_assets(model_package, storage)
+        base_model_code, problem_description, base_input_data = _load_model_package_assets(model_package, storage)
         input_data, runtime_input_source, runtime_input_filename = _load_effective_runtime_input(
             change_request=change_request,
             model_package=model_package,
+            base_input_data=base_input_data,
             storage=storage,
         )
         state = {
@@ -227,11 +268,25 @@ async def run_workflow(run_id: str) -> dict[str, Any]:
         start_node = 'parsing'
         queries.update_workflow_run(run['id'], {'status': RunStatus.IN_PROGRESS.value, 'started_at': run.get('started_at') or _utcnow_iso()})
 
+    return runtime, state, start_node
+
+
+async def run_workflow(run_id: str) -> dict[str, Any]:
+    runtime, state, start_node = await run_blocking(_prepare_run, run_id)
     graph = build_graph(runtime, start_node=start_node)
-    result = await graph.ainvoke(state)
+    try:
+        result = await graph.ainvoke(state)
+    finally:
+        # Finalize and pause already flush; this covers runs that end in an exception.
+        await run_blocking(runtime.flush_artifacts)
     if result.get('final_status') == 'awaiting_clarification':
         return result
     if result.get('final_status') in {RunStatus.COMPLETED.value, RunStatus.NEEDS_REVIEW.value, RunStatus.FAILED.value}:
         return result
-    runtime.finalize_run(state=result, final_status=RunStatus.FAILED.value, failure_type=FailureType.INTERNAL_ERROR.value)
+    await run_blocking(
+        runtime.finalize_run,
+        state=result,
+        final_status=RunStatus.FAILED.value,
+        failure_type=FailureType.INTERNAL_ERROR.value,
+    )
     return result
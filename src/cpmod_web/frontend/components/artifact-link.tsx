@@ -0,0 +1,45 @@
+'use client';
+
+import type { MouseEvent, ReactNode } from 'react';
+
+import { api } from '../lib/api';
+import type { RunArtifact } from '../lib/types';
+
+const OBJECT_URL_LIFETIME_MS = 60_000;
+
+// Plain artifacts open straight from their signed URL. Gzipped ones have no signed URL; they are
+// fetched decoded from the API's content route and opened as a blob in the tab reserved on click.
+export function ArtifactLink({ artifact, children }: { artifact: RunArtifact; children: ReactNode }) {
+  if (artifact.signed_url) {
+    return (
+      <a href={artifact.signed_url} target="_blank" rel="noreferrer">
+        {children}
+      </a>
+    );
+  }
+  const contentUrl = artifact.content_url;
+  if (!contentUrl) return null;
+
+  const open = async (event: MouseEvent<HTMLAnchorElement>) => {
+    event.preventDefault();
+    const tab = window.open('', '_blank');
+    try {
+      const url = URL.createObjectURL(await api.getArtifactContent(contentUrl));
+      if (tab) tab.location.href = url;
+      else window.location.href = url;
+      setTimeout(() => URL.revokeObjectURL(url), OBJECT_URL_LIFETIME_MS);
+    } catch {
+      tab?.close();
+    }
+  };
+
+  return (
+    <a href="#" onClick={open}>
+      {children}
+    </a>
+  );
+}
+
+export function hasArtifactLink(artifact: RunArtifact | undefined): artifact is RunArtifact {
+  return Boolean(artifact?.signed_url || artifact?.content_url);
+}
@@ -1,10 +1,11 @@
-export function DiffView({ diffUrl }: { diffUrl: string | null }) {
+import type { RunArtifact } from '../lib/types';
+import { ArtifactLink, hasArtifactLink } from './artifact-link';
+
+export function DiffView({ artifact }: { artifact: RunArtifact | undefined }) {
   return (
     <div className="rounded-xl border border-slate-200 bg-slate-50 p-4 text-sm">
-      {diffUrl ? (
-        <a href={diffUrl} target="_blank" rel="noreferrer">
-          Open unified diff artifact
-        </a>
+      {hasArtifactLink(artifact) ? (
+        <ArtifactLink artifact={artifact}>Open unified diff artifact</ArtifactLink>
       ) : (
         <p className="text-slate-600">No diff artifact available yet.</p>
       )}
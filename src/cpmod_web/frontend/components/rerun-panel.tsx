@@ -0,0 +1,56 @@
+'use client';
+
+import { useState } from 'react';
+
+import { api } from '../lib/api';
+import type { RerunStage, WorkflowRun } from '../lib/types';
+import { Button } from './ui/button';
+import { Select } from './ui/select';
+
+const RERUN_STAGES: { value: RerunStage; label: string }[] = [
+  { value: 'planning', label: 'Planning' },
+  { value: 'modifying', label: 'Modification' },
+  { value: 'executing', label: 'Execution' },
+  { value: 'validating', label: 'Semantic validation' },
+];
+
+export function RerunPanel({ run }: { run: WorkflowRun }) {
+  const [stage, setStage] = useState<RerunStage>('modifying');
+  const [submitting, setSubmitting] = useState(false);
+  const [error, setError] = useState<string | null>(null);
+
+  return (
+    <section className="space-y-3 rounded-xl border border-slate-200 bg-white p-5">
+      <h2 className="text-lg font-semibold">Rerun from a stage</h2>
+      <p className="text-sm text-slate-600">
+        Starts a new run from this run&apos;s stored state. Stages before the one you pick are not repeated.
+      </p>
+      <Select value={stage} onChange={(event) => setStage(event.target.value as RerunStage)}>
+        {RERUN_STAGES.map((option) => (
+          <option key={option.value} value={option.value}>
+            {option.label}
+          </option>
+        ))}
+      </Select>
+      {error ? <p className="text-sm text-rose-700">{error}</p> : null}
+      <Button
+        type="button"
+        disabled={submitting}
+        onClick={async () => {
+          setSubmitting(true);
+          setError(null);
+          try {
+            const rerun = await api.rerunRun(run.id, stage);
+            window.location.href = `/projects/${rerun.project_id ?? run.project_id}/runs/${rerun.id}`;
+          } catch (err) {
+            setError(err instanceof Error ? err.message : 'Unable to start the rerun.');
+          } finally {
+            setSubmitting(false);
+          }
+        }}
+      >
+        Rerun
+      </Button>
+    </section>
+  );
+}
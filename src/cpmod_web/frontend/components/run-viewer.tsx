@@ -1,23 +1,79 @@
 'use client';
 
-import { useQuery } from '@tanstack/react-query';
+import { useEffect } from 'react';
+import { useQuery, useQueryClient } from '@tanstack/react-query';
 
 import { api } from '../lib/api';
-import type { WorkflowRun } from '../lib/types';
+import type { RunStreamMessage, WorkflowRun } from '../lib/types';
 import { Badge } from './ui/badge';
+import { ArtifactLink, hasArtifactLink } from './artifact-link';
 import { ClarificationPanel } from './clarification-panel';
 import { DiffView } from './diff-view';
 import { InvariantsPanel } from './invariants-panel';
+import { RerunPanel } from './rerun-panel';
+
+const STREAM_RETRY_MS = 5000;
+const FINISHED_STATUSES = new Set(['completed', 'needs_review', 'failed']);
+
+function applyRunStreamMessage(run: WorkflowRun, message: RunStreamMessage): WorkflowRun {
+  switch (message.event) {
+    case 'run_event':
+      return run.events.some((event) => event.id === message.data.id) ? run : { ...run, events: [...run.events, message.data] };
+    case 'artifact':
+      return {
+        ...run,
+        artifacts: [...run.artifacts.filter((artifact) => artifact.id !== message.data.id), message.data],
+      };
+    case 'status':
+      return { ...run, ...message.data };
+    default:
+      return run;
+  }
+}
 
 export function RunViewer({ runId }: { runId: string }) {
+  const queryClient = useQueryClient();
   const query = useQuery<WorkflowRun>({
     queryKey: ['run', runId],
     queryFn: () => api.getRun(runId),
-    refetchInterval: (query) => {
-      const status = query.state.data?.status;
-      return status === 'completed' || status === 'failed' || status === 'needs_review' ? false : 2500;
-    },
   });
+  const loaded = query.data !== undefined;
+
+  // One server-sent event stream replaces polling. The first connection replays events from the
+  // start, so nothing written between the initial fetch and the subscription is missed; reconnects
+  // send the last event id seen so the server resumes after it.
+  useEffect(() => {
+    if (!loaded) return;
+    const controller = new AbortController();
+    let retry: ReturnType<typeof setTimeout> | undefined;
+    let ended = false;
+    let lastEventId: string | undefined;
+
+    const connect = () => {
+      api
+        .streamRun(
+          runId,
+          (message, eventId) => {
+            if (eventId) lastEventId = eventId;
+            if (message.event === 'end') ended = true;
+            queryClient.setQueryData<WorkflowRun>(['run', runId], (current) => (current ? applyRunStreamMessage(current, message) : current));
+          },
+          controller.signal,
+          lastEventId,
+        )
+        .catch(() => undefined)
+        .finally(() => {
+          if (controller.signal.aborted || ended) return;
+          retry = setTimeout(connect, STREAM_RETRY_MS);
+        });
+    };
+    connect();
+
+    return () => {
+      controller.abort();
+      if (retry) clearTimeout(retry);
+    };
+  }, [runId, loaded, queryClient]);
 
   if (query.isLoading) return <p>Loading run…</p>;
   if (query.error || !query.data) return <p>Unable to load run.</p>;
@@ -41,6 +97,11 @@ export function RunViewer({ runId }: { runId: string }) {
           Selected model: {run.model_provider} · {run.model_name} · {run.model_preset}
         </p>
         <p className="text-sm text-slate-700">Credential source: saved {run.api_key_provider} key</p>
+        {run.rerun_of_run_id ? (
+          <p className="text-sm text-slate-700">
+            Rerun of <a href={`/projects/${run.project_id}/runs/${run.rerun_of_run_id}`}>an earlier run</a> from {run.rerun_from_stage ?? 'a later stage'}
+          </p>
+        ) : null}
         <p className="mt-2 text-sm text-slate-700">
           Runtime input source: {run.runtime_input_source === 'change_request_override' ? 'Change request override input_data.json' : 'Base model package input_data.json'}
         </p>
@@ -52,6 +113,7 @@ export function RunViewer({ runId }: { runId: string }) {
       </section>
 
       {run.status === 'awaiting_clarification' ? <ClarificationPanel run={run} /> : null}
+      {FINISHED_STATUSES.has(run.status) ? <RerunPanel run={run} /> : null}
 
       <section className="rounded-xl border border-slate-200 bg-white p-5">
         <h2 className="mb-4 text-lg font-semibold">Stage timeline</h2>
@@ -73,21 +135,21 @@ export function RunViewer({ runId }: { runId: string }) {
 
       <section className="grid gap-4 rounded-xl border border-slate-200 bg-white p-5">
         <h2 className="text-lg font-semibold">Artifacts</h2>
-        {generatedModel?.signed_url ? <a href={generatedModel.signed_url} target="_blank">Download generated model</a> : <p className="text-sm text-slate-500">Generated model not available yet.</p>}
+        {hasArtifactLink(generatedModel) ? <ArtifactLink artifact={generatedModel}>Download generated model</ArtifactLink> : <p className="text-sm text-slate-500">Generated model not available yet.</p>}
         {run.artifacts.length ? (
           <div className="grid gap-2 text-sm">
             {run.artifacts.map((artifact) => (
-              artifact.signed_url ? (
-                <a key={artifact.id} href={artifact.signed_url} target="_blank">
+              hasArtifactLink(artifact) ? (
+                <ArtifactLink key={artifact.id} artifact={artifact}>
                   {artifact.type.replaceAll('_', ' ')}
-                </a>
+                </ArtifactLink>
               ) : (
                 <p key={artifact.id} className="text-slate-500">{artifact.type.replaceAll('_', ' ')}</p>
               )
             ))}
           </div>
         ) : null}
-        <DiffView diffUrl={diffArtifact?.signed_url ?? null} />
+        <DiffView artifact={diffArtifact} />
       </section>
 
       {run.last_error ? (
@@ -6,7 +6,9 @@ import type {
   Project,
   Provider,
   ProviderCredentialStatus,
+  RerunStage,
   RunCreatePayload,
+  RunStreamMessage,
   WorkflowRun,
   WorkflowRunSummary,
 } from './types';
@@ -53,6 +55,53 @@ async function requestVoid(path: string, init?: RequestInit): Promise<void> {
   }
 }
 
+async function requestBlob(path: string): Promise<Blob> {
+  const response = await fetch(`${API_URL}${path}`, { headers: await authHeaders(), cache: 'no-store' });
+  if (!response.ok) {
+    throw new Error(await readError(response));
+  }
+  return response.blob();
+}
+
+async function streamEvents<T>(
+  path: string,
+  onMessage: (message: T, eventId: string | undefined) => void,
+  signal: AbortSignal,
+  lastEventId?: string,
+): Promise<void> {
+  const headers = await authHeaders();
+  const response = await fetch(`${API_URL}${path}`, {
+    headers: { Accept: 'text/event-stream', ...(lastEventId ? { 'Last-Event-ID': lastEventId } : {}), ...headers },
+    cache: 'no-store',
+    signal,
+  });
+  if (!response.ok || !response.body) {
+    throw new Error(await readError(response));
+  }
+  const reader = response.body.pipeThrough(new TextDecoderStream()).getReader();
+  let buffer = '';
+  for (;;) {
+    const { value, done } = await reader.read();
+    if (done) return;
+    buffer += value;
+    let boundary = buffer.indexOf('\n\n');
+    while (boundary !== -1) {
+      const block = buffer.slice(0, boundary);
+      buffer = buffer.slice(boundary + 2);
+      let event = 'message';
+      let eventId: string | undefined;
+      const data: string[] = [];
+      for (const line of block.split('\n')) {
+        if (line.startsWith('event:')) event = line.slice(6).trim();
+        else if (line.startsWith('id:')) eventId = line.slice(3).trim();
+        else if (line.startsWith('data:')) data.push(line.slice(5).trim());
+      }
+      if (data.length) onMessage({ event, data: JSON.parse(data.join('\n')) } as unknown as T, eventId);
+      boundary = buffer.indexOf('\n\n');
+    }
+  }
+}
+
 async function readError(response: Response): Promise<string> {
   const raw = await response.text();
   if (!raw) return `Request failed with status ${response.status}.`;
@@ -81,6 +130,15 @@ export const api = {
   deleteChangeRequest: (id: string) => requestVoid(`/change-requests/${id}`, { method: 'DELETE' }),
   createRun: (payload: RunCreatePayload) => request<WorkflowRun>('/runs', { method: 'POST', body: JSON.stringify(payload) }),
   getRun: (runId: string) => request<WorkflowRun>(`/runs/${runId}`),
+  streamRun: (
+    runId: string,
+    onMessage: (message: RunStreamMessage, eventId: string | undefined) => void,
+    signal: AbortSignal,
+    lastEventId?: string,
+  ) => streamEvents<RunStreamMessage>(`/runs/${runId}/stream`, onMessage, signal, lastEventId),
+  getArtifactContent: (contentUrl: string) => requestBlob(contentUrl),
+  rerunRun: (runId: string, fromStage: RerunStage) =>
+    request<WorkflowRun>(`/runs/${runId}/rerun`, { method: 'POST', body: JSON.stringify({ from_stage: fromStage }) }),
   submitClarification: (runId: string, answers: string[]) => request<WorkflowRun>(`/runs/${runId}/clarify`, { method: 'POST', body: JSON.stringify({ answers }) }),
   listModelCatalog: () => request<ModelCatalogEntry[]>('/settings/model-catalog'),
   listProviderCredentials: () => request<ProviderCredentialStatus[]>('/settings/credentials'),
@@ -82,6 +82,7 @@ export interface RunArtifact {
   metadata: Record<string, unknown>;
   created_at?: string | null;
   signed_url?: string | null;
+  content_url?: string | null;
 }
 
 export interface WorkflowRun {
@@ -108,11 +109,33 @@ export interface WorkflowRun {
   completed_at?: string | null;
   failure_type?: string | null;
   last_error?: string | null;
+  rerun_of_run_id?: string | null;
+  rerun_from_stage?: RerunStage | null;
   created_at?: string | null;
   events: RunEvent[];
   artifacts: RunArtifact[];
 }
 
+export type RunStatusUpdate = Pick<
+  WorkflowRun,
+  | 'id'
+  | 'status'
+  | 'failure_type'
+  | 'last_error'
+  | 'clarification_questions'
+  | 'clarification_answers'
+  | 'invariants'
+  | 'change_summary'
+  | 'started_at'
+  | 'completed_at'
+>;
+
+export type RunStreamMessage =
+  | { event: 'run_event'; data: RunEvent }
+  | { event: 'artifact'; data: RunArtifact }
+  | { event: 'status'; data: RunStatusUpdate }
+  | { event: 'end'; data: { status?: RunStatus; reason?: string } };
+
 export interface WorkflowRunSummary {
   id: string;
   change_request_id: string;
@@ -131,8 +154,11 @@ export interface WorkflowRunSummary {
   started_at?: string | null;
   completed_at?: string | null;
   failure_type?: string | null;
+  rerun_of_run_id?: string | null;
 }
 
+export type RerunStage = 'planning' | 'modifying' | 'executing' | 'validating';
+
 export interface RunCreatePayload {
   change_request_id: string;
   model_preset: ModelPreset;
@@ -0,0 +1,241 @@
+"""Run a generated CPMpy model under a solver time budget.
+
+This is the one copy of the guard shared by the thesis benchmark (re-exported from
+``mod-ref-benchmark/solver_guard.py``) and the web backend, which ships this file's text into each
+execution sandbox. It must therefore stay importable and runnable with the standard library alone.
+
+The guard is used in two places:
+
+* Inside the model subprocess (``python solver_guard.py generated_model.py``) it caps every
+  CPMpy ``solve`` call at the time left before the hard timeout, even when the generated code
+  calls plain ``model.solve()``, and reports on stderr whether the solver stopped on that
+  limit with a feasible incumbent.
+* On the host, ``run_guarded_script`` launches the subprocess, sends SIGTERM before SIGKILL when
+  the hard timeout expires and returns whatever the model managed to print. Runners that solve
+  from several threads can call ``set_solver_concurrency`` to cap how many model subprocesses
+  are alive at once across the whole process.
+"""
+
+from __future__ import annotations
+
+import atexit
+import contextlib
+import functools
+import json
+import os
+import runpy
+import signal
+import subprocess
+import sys
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+GUARD_PATH = Path(__file__).resolve()
+TIME_LIMIT_ENV = "CPMOD_SOLVER_TIME_LIMIT"
+STATUS_SENTINEL = "CPMOD_SOLVER_STATUS "
+TIMEOUT_INCUMBENT = "timeout_incumbent"
+TIMEOUT_NO_INCUMBENT = "timeout_no_incumbent"
+
+_GUARD_STATE: dict[str, Any] = {"deadline": None, "last_solve": None}
+_SOLVER_SLOTS: dict[str, threading.BoundedSemaphore | None] = {"semaphore": None}
+
+
+def set_solver_concurrency(limit: int | None) -> None:
+    """Cap concurrent ``run_guarded_script`` subprocesses in this process (None or 0 removes the cap)."""
+    _SOLVER_SLOTS["semaphore"] = threading.BoundedSemaphore(int(limit)) if limit else None
+
+
+def _solver_slot():
+    semaphore = _SOLVER_SLOTS["semaphore"]
+    return semaphore if semaphore is not None else contextlib.nullcontext()
+
+
+def solver_time_margin(timeout: float) -> float:
+    """Seconds reserved between the solver time limit and the hard timeout."""
+    return min(5.0, max(1.0, 0.1 * float(timeout)))
+
+
+def solver_time_limit(timeout: float) -> float:
+    """Solver time limit derived from a hard execution timeout, slightly below it."""
+    return max(float(timeout) - solver_time_margin(timeout), 0.5 * float(timeout))
+
+
+@dataclass
+class GuardedRun:
+    returncode: int
+    stdout: str
+    stderr: str
+    timed_out: bool
+    solver_status: dict[str, Any] | None
+
+    @property
+    def status(self) -> str | None:
+        recorded = (self.solver_status or {}).get("status")
+        if not self.timed_out:
+            return recorded
+        try:
+            json.loads(self.stdout)
+        except json.JSONDecodeError:
+            return TIMEOUT_INCUMBENT if recorded == TIMEOUT_INCUMBENT else TIMEOUT_NO_INCUMBENT
+        return TIMEOUT_INCUMBENT
+
+
+def split_solver_status(stderr: str) -> tuple[dict[str, Any] | None, str]:
+    """Extract the guard's status line from stderr and return it with the remaining stderr."""
+    status: dict[str, Any] | None = None
+    kept: list[str] = []
+    for line in stderr.splitlines(keepends=True):
+        if line.startswith(STATUS_SENTINEL):
+            try:
+                status = json.loads(line[len(STATUS_SENTINEL):])
+            except json.JSONDecodeError:
+                kept.append(line)
+            continue
+        kept.append(line)
+    return status, "".join(kept)
+
+
+def mark_incumbent(model_output: Any, run: GuardedRun) -> Any:
+    """Tag parsed model output recovered from a time-limited solve."""
+    if isinstance(model_output, dict) and run.status == TIMEOUT_INCUMBENT:
+        model_output.setdefault("status", TIMEOUT_INCUMBENT)
+    return model_output
+
+
+def run_guarded_script(*, script_path: Path, cwd: Path, timeout: float | None = None) -> GuardedRun:
+    """Run a model script through the guard, terminating gracefully on timeout."""
+    env = dict(os.environ)
+    env.pop(TIME_LIMIT_ENV, None)
+    if timeout:
+        env[TIME_LIMIT_ENV] = f"{solver_time_limit(timeout):.3f}"
+
+    with _solver_slot():
+        proc = subprocess.Popen(
+            [sys.executable, str(GUARD_PATH), script_path.name],
+            cwd=cwd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            env=env,
+        )
+        timed_out = False
+        try:
+            stdout, stderr = proc.communicate(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            timed_out = True
+            proc.terminate()
+            try:
+                stdout, stderr = proc.communicate(timeout=solver_time_margin(timeout or 0))
+            except subprocess.TimeoutExpired:
+                proc.kill()
+                stdout, stderr = proc.communicate()
+
+    solver_status, stderr = split_solver_status(stderr or "")
+    return GuardedRun(
+        returncode=int(proc.returncode),
+        stdout=stdout or "",
+        stderr=stderr,
+        timed_out=timed_out,
+        solver_status=solver_status,
+    )
+
+
+def _remaining_budget() -> float | None:
+    deadline = _GUARD_STATE["deadline"]
+    if deadline is None:
+        return None
+    return max(deadline - time.perf_counter(), 0.1)
+
+
+def _record_solve(solver: Any, time_limit: float | None) -> None:
+    try:
+        solver_status = solver.status()
+        exitstatus = solver_status.exitstatus.name
+        runtime = float(solver_status.runtime or 0.0)
+    except Exception:
+        return
+
+    try:
+        objective = solver.objective_value()
+        if objective is not None:
+            objective = int(objective) if float(objective).is_integer() else float(objective)
+    except Exception:
+        objective = None
+
+    status = exitstatus.lower()
+    limit_hit = time_limit is not None and runtime >= 0.95 * time_limit
+    if limit_hit and exitstatus == "FEASIBLE":
+        status = TIMEOUT_INCUMBENT
+    elif limit_hit and exitstatus == "UNKNOWN":
+        status = TIMEOUT_NO_INCUMBENT
+    _GUARD_STATE["last_solve"] = {
+        "status": status,
+        "exitstatus": exitstatus,
+        "runtime": round(runtime, 6),
+        "time_limit": time_limit,
+        "objective": objective,
+    }
+
+
+def _wrap_solve(original):
+    @functools.wraps(original)
+    def guarded_solve(self, time_limit=None, *args, **kwargs):
+        budget = _remaining_budget()
+        if budget is not None and (time_limit is None or time_limit > budget):
+            time_limit = budget
+        result = original(self, time_limit, *args, **kwargs)
+        _record_solve(self, time_limit)
+        return result
+
+    guarded_solve.__cpmod_guarded__ = True
+    return guarded_solve
+
+
+def _install_solver_limits() -> None:
+    try:
+        from cpmpy.solvers.utils import SolverLookup
+    except Exception:
+        return
+    for _, solver_cls in SolverLookup.base_solvers():
+        solve = solver_cls.__dict__.get("solve")
+        if solve is None or getattr(solve, "__cpmod_guarded__", False):
+            continue
+        solver_cls.solve = _wrap_solve(solve)
+
+
+def _emit_status(**extra: Any) -> None:
+    payload = dict(_GUARD_STATE["last_solve"] or {})
+    payload.update(extra)
+    if not payload:
+        return
+    sys.stderr.write(STATUS_SENTINEL + json.dumps(payload) + "\n")
+    sys.stderr.flush()
+
+
+def _handle_sigterm(signum, _frame) -> None:
+    sys.stdout.flush()
+    _emit_status(terminated=True)
+    os._exit(128 + signum)
+
+
+def _bootstrap(argv: list[str]) -> None:
+    if not argv:
+        raise SystemExit("usage: solver_guard.py <model.py> [args...]")
+    time_limit = os.environ.get(TIME_LIMIT_ENV)
+    if time_limit:
+        _GUARD_STATE["deadline"] = time.perf_counter() + float(time_limit)
+    signal.signal(signal.SIGTERM, _handle_sigterm)
+    atexit.register(_emit_status)
+    _install_solver_limits()
+
+    target = Path(argv[0]).resolve()
+    sys.argv = [str(target), *argv[1:]]
+    sys.path[0] = str(target.parent)
+    runpy.run_path(str(target), run_name="__main__")
+
+
+if __name__ == "__main__":
+    _bootstrap(sys.argv[1:])
@@ -0,0 +1,19 @@
+create or replace function claim_pending_runs(max_runs int default 1)
+returns setof workflow_runs
+language sql
+as $$
+  update workflow_runs
+  set status = 'in_progress', picked_at = now(), started_at = coalesce(started_at, now())
+  where id in (
+    select id from workflow_runs
+    where status = 'pending'
+    order by created_at asc
+    limit greatest(max_runs, 1)
+    for update skip locked
+  )
+  returning *;
+$$;
+
+create index if not exists workflow_runs_pending_created_at_idx
+  on workflow_runs(created_at)
+  where status = 'pending';
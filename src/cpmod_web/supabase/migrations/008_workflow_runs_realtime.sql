@@ -0,0 +1,14 @@
+do $$
+begin
+  if exists (select 1 from pg_publication where pubname = 'supabase_realtime')
+    and not exists (
+      select 1 from pg_publication_tables
+      where pubname = 'supabase_realtime'
+        and schemaname = 'public'
+        and tablename = 'workflow_runs'
+    )
+  then
+    alter publication supabase_realtime add table workflow_runs;
+  end if;
+end;
+$$;
@@ -0,0 +1,94 @@
+-- The per-owner lookups below are served by the (created_at, id) indexes from 010.
+create index if not exists workflow_runs_status_created_at_idx
+  on workflow_runs(status, created_at desc);
+
+-- Same shape as the backend's RUN_SUMMARY_SELECT embed, minus the checkpointed state.
+create or replace function workflow_run_summary_json(p_run_id uuid)
+returns jsonb
+language sql
+stable
+as $$
+  select (to_jsonb(r) - 'state_json') || jsonb_build_object(
+    'change_request', jsonb_build_object(
+      'id', cr.id,
+      'project_id', cr.project_id,
+      'model_package_id', cr.model_package_id,
+      'what_should_change', cr.what_should_change,
+      'override_input_data_storage_path', cr.override_input_data_storage_path,
+      'override_input_data_filename', cr.override_input_data_filename,
+      'model_package', jsonb_build_object(
+        'id', mp.id,
+        'filename', mp.filename,
+        'input_data_storage_path', mp.input_data_storage_path,
+        'input_data_filename', mp.input_data_filename
+      )
+    )
+  )
+  from workflow_runs r
+  join change_requests cr on cr.id = r.change_request_id
+  join model_packages mp on mp.id = cr.model_package_id
+  where r.id = p_run_id;
+$$;
+
+create or replace function dashboard_overview(p_user_id uuid, p_limit int default 5)
+returns jsonb
+language sql
+stable
+as $$
+  with user_projects as (
+    select id, created_at from projects where user_id = p_user_id
+  ),
+  user_runs as (
+    select r.id, r.status, r.created_at
+    from workflow_runs r
+    join change_requests cr on cr.id = r.change_request_id
+    where cr.project_id in (select id from user_projects)
+  ),
+  run_counts as (
+    select
+      count(*) filter (where status = 'completed') as completed_runs,
+      count(*) filter (where status = 'needs_review') as runs_needing_review,
+      count(*) filter (where status = 'failed') as failed_runs
+    from user_runs
+  )
+  select jsonb_build_object(
+    'counts', jsonb_build_object(
+      'total_projects', (select count(*) from user_projects),
+      'validated_model_packages', (
+        select count(*) from model_packages
+        where project_id in (select id from user_projects) and validation_status = 'validated'
+      ),
+      'completed_runs', (select completed_runs from run_counts),
+      'runs_needing_review', (select runs_needing_review from run_counts),
+      'failed_runs', (select failed_runs from run_counts)
+    ),
+    'recent_projects', coalesce((
+      select jsonb_agg(to_jsonb(p) order by p.created_at desc)
+      from (
+        select * from projects where user_id = p_user_id order by created_at desc limit p_limit
+      ) p
+    ), '[]'::jsonb),
+    'recent_runs', coalesce((
+      select jsonb_agg(workflow_run_summary_json(ur.id) order by ur.created_at desc)
+      from (select id, created_at from user_runs order by created_at desc limit p_limit) ur
+    ), '[]'::jsonb),
+    'runs_awaiting_clarification', coalesce((
+      select jsonb_agg(workflow_run_summary_json(ur.id) order by ur.created_at desc)
+      from (
+        select id, created_at from user_runs
+        where status = 'awaiting_clarification'
+        order by created_at desc
+        limit p_limit
+      ) ur
+    ), '[]'::jsonb),
+    'runs_needing_review', coalesce((
+      select jsonb_agg(workflow_run_summary_json(ur.id) order by ur.created_at desc)
+      from (
+        select id, created_at from user_runs
+        where status = 'needs_review'
+        order by created_at desc
+        limit p_limit
+      ) ur
+    ), '[]'::jsonb)
+  );
+$$;
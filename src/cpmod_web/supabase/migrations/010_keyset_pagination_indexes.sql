@@ -0,0 +1,16 @@
+-- Composite (created_at, id) indexes backing keyset pagination. Their leading columns also serve the
+-- owner/project lookups in 009's dashboard_overview.
+create index if not exists projects_user_id_created_at_id_idx
+  on projects(user_id, created_at desc, id desc);
+
+create index if not exists model_packages_project_id_created_at_id_idx
+  on model_packages(project_id, created_at desc, id desc);
+
+create index if not exists change_requests_project_id_created_at_id_idx
+  on change_requests(project_id, created_at desc, id desc);
+
+create index if not exists workflow_runs_change_request_id_created_at_id_idx
+  on workflow_runs(change_request_id, created_at desc, id desc);
+
+create index if not exists run_events_run_id_created_at_id_idx
+  on run_events(run_id, created_at, id);
@@ -0,0 +1,8 @@
+-- SHA-256 of each stored asset, recorded at upload so workers can serve them from a local cache without asking storage.
+alter table model_packages
+  add column if not exists model_sha256 text,
+  add column if not exists problem_description_sha256 text,
+  add column if not exists input_data_sha256 text;
+
+alter table change_requests
+  add column if not exists override_input_data_sha256 text;
@@ -0,0 +1,12 @@
+-- Lineage for runs cloned from an earlier run and restarted at a later stage.
+alter table workflow_runs
+  add column if not exists rerun_of_run_id uuid references workflow_runs(id) on delete set null,
+  add column if not exists rerun_from_stage text;
+
+alter table workflow_runs
+  drop constraint if exists workflow_runs_rerun_from_stage_check;
+
+alter table workflow_runs
+  add constraint workflow_runs_rerun_from_stage_check check (
+    rerun_from_stage is null or rerun_from_stage in ('planning','modifying','executing','validating')
+  );
@@ -2,12 +2,13 @@ from __future__ import annotations
 
 import argparse
 import datetime
-import importlib.util
 import json
+import os
 import shutil
-import subprocess
 import sys
+import threading
 import traceback
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
@@ -17,46 +18,34 @@ MODREF_DIR = THIS_DIR.parent  # src/mod-ref-benchmark
 if str(MODREF_DIR) not in sys.path:
     sys.path.insert(0, str(MODREF_DIR))
 
+from instance_eval import evaluate_instances, resolve_instances_dir, summarize_instance_eval
+from instance_generators import parse_instance_scales
 from llm_client import LLMClient, LLMConfig
 from llm_prompts import build_single_shot_prompt, extract_output_keys
 from llm_schemas import build_code_schema
 from model_presets import get_model_preset_by_key, select_model_presets
+from reference_oracle import lookup_reference, with_oracle_optimum
+from run_journal import JOURNAL_FILENAME, RunJournal, case_key, open_journal
+from scale_ladder import run_scale_ladder
+from solver_guard import TIMEOUT_NO_INCUMBENT, mark_incumbent, run_guarded_script
+from unit_test_loader import load_verify_func
 
 
-def load_verify_func(unit_test_path: Path):
-    """Dynamically load the verification function from a CR's unit_test.py file."""
-    spec = importlib.util.spec_from_file_location("verify", unit_test_path)
-    if spec is None or spec.loader is None:
-        raise ValueError(f"Could not load unit test module from {unit_test_path}")
-    module = importlib.util.module_from_spec(spec)
-    spec.loader.exec_module(module)
-    verify_funcs = [getattr(module, f) for f in dir(module) if f.endswith("_verify_func")]
-    if not verify_funcs:
-        raise ValueError(f"No *_verify_func found in {unit_test_path}")
-    return verify_funcs[0]
-
-
-def run_python_script(*, script_path: Path, cwd: Path, timeout: int | None = None) -> tuple[dict[str, Any] | None, str, str, int]:
-    """Run a Python script and return parsed JSON, stdout, stderr, and return code."""
-    result = subprocess.run(
-        [sys.executable, script_path.name],
-        cwd=cwd,
-        capture_output=True,
-        text=True,
-        timeout=timeout,
-    )
+def run_python_script(
+    *, script_path: Path, cwd: Path, timeout: int | None = None
+) -> tuple[dict[str, Any] | None, str, str, int, str | None]:
+    """Run a Python script under the solver guard and return parsed JSON, stdout, stderr, return code and solver status."""
+    run = run_guarded_script(script_path=script_path, cwd=cwd, timeout=timeout)
 
-    stdout = result.stdout or ""
-    stderr = result.stderr or ""
-    if result.returncode != 0:
-        return None, stdout, stderr, int(result.returncode)
+    if run.returncode != 0 and not run.timed_out:
+        return None, run.stdout, run.stderr, run.returncode, run.status
 
     try:
-        parsed = json.loads(stdout)
+        parsed = json.loads(run.stdout)
     except json.JSONDecodeError:
-        return None, stdout, stderr, int(result.returncode)
+        return None, run.stdout, run.stderr, run.returncode, run.status
 
-    return parsed, stdout, stderr, int(result.returncode)
+    return mark_incumbent(parsed, run), run.stdout, run.stderr, run.returncode, run.status
 
 
 def is_unit_test_pass(verify_result: Any) -> bool:
@@ -149,14 +138,18 @@ def build_llm_config(*, provider: str, model: str | None, reasoning_effort: str
     )
 
 
-def run_single_case(
-    *,
-    problem_dir: Path,
-    cr_dir: Path,
-    llm: LLMClient,
-    case_root: Path,
-    timeout: int | None,
-) -> dict[str, Any]:
+@dataclass
+class GeneratedCase:
+    """A case whose model has been generated and written to disk, ready for execution."""
+
+    problem_dir: Path
+    cr_dir: Path
+    paths: CasePaths
+    expected_output_keys: list[str]
+
+
+def generate_case(*, problem_dir: Path, cr_dir: Path, llm: LLMClient, case_root: Path) -> GeneratedCase | dict[str, Any]:
+    """Prompt the LLM and write the generated model; returns the final result if the case ends here."""
     problem = problem_dir.name
     cr = cr_dir.name
     paths = prepare_case_dir(case_dir=case_root)
@@ -224,8 +217,32 @@ def run_single_case(
     assert code is not None
     paths.generated_model_path.write_text(code)
     shutil.copy2(cr_input_path, paths.case_dir / "input_data.json")
+    return GeneratedCase(
+        problem_dir=problem_dir,
+        cr_dir=cr_dir,
+        paths=paths,
+        expected_output_keys=expected_output_keys,
+    )
 
-    model_output, stdout, stderr, returncode = run_python_script(
+
+def execute_case(
+    generated: GeneratedCase,
+    *,
+    timeout: int | None,
+    instance_scales: list[int] | None = None,
+    instance_seed: int = 0,
+    eval_instances: bool = False,
+    instances_root: Path | None = None,
+    eval_jobs: int = 1,
+) -> dict[str, Any]:
+    """Run a generated model, verify its output and write the case result."""
+    problem_dir, cr_dir, paths = generated.problem_dir, generated.cr_dir, generated.paths
+    problem, cr = problem_dir.name, cr_dir.name
+    cr_input_path = cr_dir / "input_data.json"
+    cr_unit_test_path = cr_dir / "unit_test.py"
+    expected_output_keys = generated.expected_output_keys
+
+    model_output, stdout, stderr, returncode, solver_status = run_python_script(
         script_path=paths.generated_model_path,
         cwd=paths.case_dir,
         timeout=timeout,
@@ -233,7 +250,9 @@ def run_single_case(
     exec_ok = model_output is not None
     exec_error: str | None = None
     if not exec_ok:
-        if returncode != 0:
+        if solver_status == TIMEOUT_NO_INCUMBENT:
+            exec_error = f"Timed out after {timeout} seconds without a solution."
+        elif returncode != 0:
             exec_error = f"Non-zero exit code {returncode}."
         else:
             exec_error = "Stdout was not valid JSON."
@@ -241,6 +260,7 @@ def run_single_case(
     exec_log = {
         "exec_ok": exec_ok,
         "returncode": returncode,
+        "solver_status": solver_status,
         "stdout": stdout,
         "stderr": stderr,
         "parsed_json": model_output,
@@ -271,6 +291,7 @@ def run_single_case(
     try:
         verify_func = load_verify_func(cr_unit_test_path)
         data_dict = json.loads(cr_input_path.read_text())
+        data_dict = with_oracle_optimum(data_dict, lookup_reference(cr_dir, data_dict))
         unit_test_result = verify_func(data_dict, model_output)
         unit_test_pass = is_unit_test_pass(unit_test_result)
     except Exception as exc:
@@ -289,6 +310,32 @@ def run_single_case(
         )
     )
 
+    scale_ladder_path: str | None = None
+    if unit_test_pass and instance_scales:
+        ladder = run_scale_ladder(
+            problem_dir=problem_dir,
+            cr_dir=cr_dir,
+            model_path=paths.generated_model_path,
+            scales=instance_scales,
+            output_dir=paths.case_dir / "scale_ladder",
+            seed=instance_seed,
+            timeout=timeout,
+        )
+        scale_ladder_path = ladder.get("report_path")
+
+    instance_eval: dict[str, Any] | None = None
+    if eval_instances:
+        instance_eval = summarize_instance_eval(
+            evaluate_instances(
+                cr_dir=cr_dir,
+                model_path=paths.generated_model_path,
+                instances_dir=resolve_instances_dir(cr_dir, instances_root),
+                output_dir=paths.case_dir / "instance_eval",
+                jobs=eval_jobs,
+                timeout=timeout,
+            )
+        )
+
     status = "pass" if unit_test_pass else "fail"
     result = {
         "problem": problem,
@@ -296,6 +343,7 @@ def run_single_case(
         "status": status,
         "stage": "unit_test",
         "exec_ok": True,
+        "solver_status": solver_status,
         "unit_test_pass": unit_test_pass,
         "unit_test_result": unit_test_result,
         "expected_output_keys": expected_output_keys,
@@ -305,12 +353,41 @@ def run_single_case(
         "llm_response_path": str(paths.llm_response_path),
         "execution_log_path": str(paths.exec_log_path),
         "unit_test_log_path": str(paths.unit_test_log_path),
+        "scale_ladder_path": scale_ladder_path,
+        "instance_eval": instance_eval,
         "result_path": str(paths.result_path),
     }
     paths.result_path.write_text(json.dumps(result, indent=2))
     return result
 
 
+def run_single_case(
+    *,
+    problem_dir: Path,
+    cr_dir: Path,
+    llm: LLMClient,
+    case_root: Path,
+    timeout: int | None,
+    instance_scales: list[int] | None = None,
+    instance_seed: int = 0,
+    eval_instances: bool = False,
+    instances_root: Path | None = None,
+    eval_jobs: int = 1,
+) -> dict[str, Any]:
+    generated = generate_case(problem_dir=problem_dir, cr_dir=cr_dir, llm=llm, case_root=case_root)
+    if not isinstance(generated, GeneratedCase):
+        return generated
+    return execute_case(
+        generated,
+        timeout=timeout,
+        instance_scales=instance_scales,
+        instance_seed=instance_seed,
+        eval_instances=eval_instances,
+        instances_root=instances_root,
+        eval_jobs=eval_jobs,
+    )
+
+
 def normalize_model_key(provider: str, model: str) -> str:
     return "".join(ch if ch.isalnum() else "_" for ch in f"{provider}_{model}".lower()).strip("_")
 
@@ -352,6 +429,8 @@ def summarize_case(*, model_spec: dict[str, Any], result: dict[str, Any] | None,
             "llm_response_path": payload.get("llm_response_path"),
             "execution_log_path": payload.get("execution_log_path"),
             "unit_test_log_path": payload.get("unit_test_log_path"),
+            "scale_ladder_path": payload.get("scale_ladder_path"),
+            "instance_eval": payload.get("instance_eval"),
             "result_path": payload.get("result_path"),
         }
     )
@@ -367,7 +446,22 @@ def run_preset_cases(
     only_cr: str | None,
     max_output_tokens: int | None,
     timeout: int | None,
+    instance_scales: list[int] | None = None,
+    instance_seed: int = 0,
+    eval_instances: bool = False,
+    instances_root: Path | None = None,
+    eval_jobs: int = 1,
+    journal: RunJournal | None = None,
+    gen_jobs: int = 1,
+    exec_jobs: int = 1,
 ) -> list[dict[str, Any]]:
+    """Run every case for one preset.
+
+    With ``gen_jobs`` or ``exec_jobs`` above 1 the cases are pipelined: up to ``gen_jobs`` LLM
+    generations are in flight at once and every generated model is handed straight to a pool of
+    ``exec_jobs`` workers that execute and verify it, so LLM latency on one case overlaps with
+    solver time on another. Results are journaled as each case finishes.
+    """
     cfg = build_llm_config(
         provider=model_spec["provider"],
         model=model_spec["model"],
@@ -378,26 +472,104 @@ def run_preset_cases(
     model_output_root = run_root / model_spec["key"]
     model_output_root.mkdir(parents=True, exist_ok=True)
 
-    model_results: list[dict[str, Any]] = []
+    model_results: dict[str, dict[str, Any]] = {}
+    results_lock = threading.Lock()
+    keys: list[str] = []
+    pending: list[tuple[str, Path, Path]] = []
     for problem_dir, cr_dir in iter_cases(problems_root, only_problem, only_cr):
-        print(f"[baseline] Running {model_spec['key']} on {problem_dir.name}/{cr_dir.name} ...", flush=True)
+        key = case_key(model_spec["key"], problem_dir.name, cr_dir.name)
+        keys.append(key)
+        if journal is not None and journal.is_done(key):
+            print(f"[baseline] Skipping {key} (already in journal)", flush=True)
+            continue
+        pending.append((key, problem_dir, cr_dir))
+
+    def record(key: str, summary: dict[str, Any]) -> None:
+        with results_lock:
+            model_results[key] = summary
+        if journal is not None:
+            journal.append(key, summary)
+
+    def runner_failure(problem_dir: Path, cr_dir: Path, exc: Exception) -> dict[str, Any]:
+        return summarize_case(
+            model_spec=model_spec,
+            result={"problem": problem_dir.name, "cr": cr_dir.name},
+            error=exc,
+        )
+
+    execute_kwargs = {
+        "timeout": timeout,
+        "instance_scales": instance_scales,
+        "instance_seed": instance_seed,
+        "eval_instances": eval_instances,
+        "instances_root": instances_root,
+        "eval_jobs": eval_jobs,
+    }
+
+    if gen_jobs <= 1 and exec_jobs <= 1:
+        for key, problem_dir, cr_dir in pending:
+            print(f"[baseline] Running {model_spec['key']} on {problem_dir.name}/{cr_dir.name} ...", flush=True)
+            try:
+                res = run_single_case(
+                    problem_dir=problem_dir,
+                    cr_dir=cr_dir,
+                    llm=llm,
+                    case_root=model_output_root / problem_dir.name / cr_dir.name,
+                    **execute_kwargs,
+                )
+                summary = summarize_case(model_spec=model_spec, result=res)
+            except Exception as exc:
+                summary = runner_failure(problem_dir, cr_dir, exc)
+            record(key, summary)
+        return journal.results(keys) if journal is not None else [model_results[k] for k in keys if k in model_results]
+
+    def generate(problem_dir: Path, cr_dir: Path) -> GeneratedCase | dict[str, Any]:
+        print(f"[baseline] Generating {model_spec['key']} on {problem_dir.name}/{cr_dir.name} ...", flush=True)
+        return generate_case(
+            problem_dir=problem_dir,
+            cr_dir=cr_dir,
+            llm=llm,
+            case_root=model_output_root / problem_dir.name / cr_dir.name,
+        )
+
+    def execute_and_record(key: str, generated: GeneratedCase) -> None:
         try:
-            res = run_single_case(
-                problem_dir=problem_dir,
-                cr_dir=cr_dir,
-                llm=llm,
-                case_root=model_output_root / problem_dir.name / cr_dir.name,
-                timeout=timeout,
-            )
-            summary = summarize_case(model_spec=model_spec, result=res)
+            summary = summarize_case(model_spec=model_spec, result=execute_case(generated, **execute_kwargs))
         except Exception as exc:
-            summary = summarize_case(
-                model_spec=model_spec,
-                result={"problem": problem_dir.name, "cr": cr_dir.name},
-                error=exc,
-            )
-        model_results.append(summary)
-    return model_results
+            summary = runner_failure(generated.problem_dir, generated.cr_dir, exc)
+        print(f"[baseline] Finished {key}: {summary.get('status')}", flush=True)
+        record(key, summary)
+
+    print(
+        f"[baseline] Pipelining {len(pending)} cases for {model_spec['key']}: "
+        f"{gen_jobs} generations and {exec_jobs} executions at a time",
+        flush=True,
+    )
+    with ThreadPoolExecutor(max_workers=max(1, gen_jobs), thread_name_prefix="generate") as gen_pool, ThreadPoolExecutor(
+        max_workers=max(1, exec_jobs), thread_name_prefix="execute"
+    ) as exec_pool:
+        generations = {
+            gen_pool.submit(generate, problem_dir, cr_dir): (key, problem_dir, cr_dir)
+            for key, problem_dir, cr_dir in pending
+        }
+        executions = []
+        for future in as_completed(generations):
+            key, problem_dir, cr_dir = generations[future]
+            try:
+                generated = future.result()
+            except Exception as exc:
+                record(key, runner_failure(problem_dir, cr_dir, exc))
+                continue
+            if isinstance(generated, GeneratedCase):
+                executions.append(exec_pool.submit(execute_and_record, key, generated))
+            else:
+                summary = summarize_case(model_spec=model_spec, result=generated)
+                print(f"[baseline] Finished {key}: {summary.get('status')} at {summary.get('stage')}", flush=True)
+                record(key, summary)
+        for future in executions:
+            future.result()
+
+    return journal.results(keys) if journal is not None else [model_results[k] for k in keys if k in model_results]
 
 
 def main() -> None:
@@ -450,6 +622,46 @@ def main() -> None:
         "--only-cr",
         help="Optional: run only a specific CR folder name (e.g., CR1).",
     )
+    parser.add_argument(
+        "--instance-scale",
+        help="Optional comma-separated scale ladder (e.g., 1,2,4,8). Passing models are re-run with the reference model on generated instances of each scale.",
+    )
+    parser.add_argument(
+        "--instance-seed",
+        type=int,
+        default=0,
+        help="Seed for the scaled instance generators (default: 0).",
+    )
+    parser.add_argument(
+        "--eval-instances",
+        action="store_true",
+        help="Also run each generated model on every instance in the CR's instances/ folder (or --instances-root); CRs without one get a generated set.",
+    )
+    parser.add_argument(
+        "--instances-root",
+        help="Optional root laid out as <problem>/<CR>/*.json to use instead of the CR instances/ folders. Implies --eval-instances.",
+    )
+    parser.add_argument(
+        "--eval-jobs",
+        type=int,
+        help="Instances evaluated concurrently per executing case (default: CPU count divided by --exec-jobs, so all cases together stay within the CPU count).",
+    )
+    parser.add_argument(
+        "--gen-jobs",
+        type=int,
+        default=1,
+        help="LLM generations in flight at once per model. Above 1 (or with --exec-jobs above 1) generation and execution are pipelined (default: 1).",
+    )
+    parser.add_argument(
+        "--exec-jobs",
+        type=int,
+        default=1,
+        help="Generated models executed and verified at once while later cases are still generating (default: 1).",
+    )
+    parser.add_argument(
+        "--resume",
+        help="Path to a journal.jsonl from an earlier run. Cases finished in it are skipped (runner errors are retried) and the run's summaries are rebuilt from it.",
+    )
     args = parser.parse_args()
 
     ad_hoc_mode = any(value is not None for value in (args.provider, args.model, args.reasoning_effort))
@@ -460,11 +672,22 @@ def main() -> None:
     output_root = Path(args.output_root).resolve()
     output_root.mkdir(parents=True, exist_ok=True)
     timeout = int(args.timeout) if args.timeout else None
+    instance_scales = parse_instance_scales(args.instance_scale)
+    instances_root = Path(args.instances_root).resolve() if args.instances_root else None
+    eval_instances = bool(args.eval_instances or instances_root)
+    # Up to --exec-jobs cases evaluate instances at once; split the CPUs between them so the solve
+    # times this runner reports are not skewed by oversubscription.
+    eval_jobs = args.eval_jobs or max(1, (os.cpu_count() or 1) // max(1, args.exec_jobs))
     run_timestamp = datetime.datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
     runs_root = output_root / "runs"
     runs_root.mkdir(parents=True, exist_ok=True)
-    run_root = runs_root / run_timestamp
+    if args.resume:
+        run_root = Path(args.resume).resolve().parent
+        run_timestamp = run_root.name
+    else:
+        run_root = runs_root / run_timestamp
     run_root.mkdir(parents=True, exist_ok=True)
+    journal = open_journal(args.resume, run_root / JOURNAL_FILENAME)
 
     if ad_hoc_mode:
         preset = get_model_preset_by_key(args.model) if args.model else None
@@ -515,6 +738,14 @@ def main() -> None:
             only_cr=args.only_cr,
             max_output_tokens=args.max_output_tokens,
             timeout=timeout,
+            instance_scales=instance_scales,
+            instance_seed=args.instance_seed,
+            eval_instances=eval_instances,
+            instances_root=instances_root,
+            eval_jobs=eval_jobs,
+            journal=journal,
+            gen_jobs=args.gen_jobs,
+            exec_jobs=args.exec_jobs,
         )
         all_results.extend(model_results)
 
@@ -541,8 +772,15 @@ def main() -> None:
         "timestamp": run_timestamp,
         "problems_root": str(problems_root),
         "output_root": str(run_root),
+        "journal_path": str(journal.path),
+        "gen_jobs": args.gen_jobs,
+        "exec_jobs": args.exec_jobs,
         "max_output_tokens": args.max_output_tokens,
         "timeout": timeout,
+        "instance_scales": instance_scales,
+        "instance_seed": args.instance_seed,
+        "eval_instances": eval_instances,
+        "instances_root": str(instances_root) if instances_root else None,
         "selected_models": selected_models,
         "counts": {
             "total": len(all_results),
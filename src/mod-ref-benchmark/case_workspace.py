@@ -0,0 +1,83 @@
+"""Per-case problem workspaces built from links instead of copies.
+
+The batch runners give every case (and every preset or ablation variant) a private
+``<workspace>/<problem>/{base,CR*}`` tree so agents never write into ``problems/``. No workflow
+stage writes the descriptions, reference model or unit test (agents only read them and create
+``generated_model.py`` next to them), so ``build_case_workspace`` hardlinks (or symlinks) those
+and the ``instances/`` files. Only ``input_data.json``, which generated models open from their
+working directory, gets a private copy that a misbehaving model cannot write through to the
+source tree. Everything the workflow writes (``generated_model.py``, logs) is created fresh next
+to the links.
+
+A linked input shares its inode with ``problems/``, so tooling must never edit workspace inputs
+in place; ``--workspace-mode copy`` trades the savings for full isolation.
+
+Only the inputs a case needs are linked; stale outputs left in the source folders
+(``results/``, old ``*_unit_test_*.json`` logs, ``generated_model.py``) are not carried over.
+"""
+
+from __future__ import annotations
+
+import os
+import shutil
+from pathlib import Path
+
+WORKSPACE_MODES = ("hardlink", "symlink", "copy")
+DEFAULT_WORKSPACE_MODE = "hardlink"
+
+# Inputs the agents and unit test read. Anything else in a problem folder is an artefact of an earlier run.
+INPUT_FILENAMES = {"problem_desc.txt", "reference_model.py", "desc.json", "input_data.json", "unit_test.py"}
+INPUT_DIRNAMES = {"instances"}
+# Read by generated models from their working directory, so they get a private copy that a
+# misbehaving model cannot write through to the shared problem tree.
+MATERIALISED_FILENAMES = {"input_data.json"}
+
+
+def _place(source: Path, target: Path, mode: str) -> str:
+    """Link or copy ``source`` to ``target``; returns how it was placed, falling back to a copy."""
+    if mode == "hardlink" and target.name not in MATERIALISED_FILENAMES:
+        try:
+            os.link(source, target)
+            return "hardlink"
+        except OSError:
+            pass
+    elif mode == "symlink" and target.name not in MATERIALISED_FILENAMES:
+        try:
+            target.symlink_to(source.resolve())
+            return "symlink"
+        except OSError:
+            pass
+    shutil.copy2(source, target)
+    return "copy"
+
+
+def _mirror(source_dir: Path, target_dir: Path, mode: str, counts: dict[str, int], *, inputs_only: bool = True) -> None:
+    target_dir.mkdir(parents=True, exist_ok=True)
+    for entry in sorted(source_dir.iterdir()):
+        if entry.is_dir():
+            if not inputs_only or entry.name in INPUT_DIRNAMES:
+                _mirror(entry, target_dir / entry.name, mode, counts, inputs_only=False)
+            continue
+        if inputs_only and entry.name not in INPUT_FILENAMES:
+            continue
+        placed = _place(entry, target_dir / entry.name, mode)
+        counts[placed] = counts.get(placed, 0) + 1
+
+
+def build_case_workspace(
+    problem_dir: Path,
+    cr_dir: Path,
+    workspace_root: Path,
+    mode: str = DEFAULT_WORKSPACE_MODE,
+) -> tuple[Path, dict[str, int]]:
+    """Recreate ``workspace_root/<problem>/{base,<CR>}`` and return its problem dir and per-mode file counts."""
+    if mode not in WORKSPACE_MODES:
+        raise ValueError(f"Unknown workspace mode {mode!r}; expected one of {WORKSPACE_MODES}")
+    if workspace_root.exists():
+        shutil.rmtree(workspace_root)
+
+    workspace_problem_dir = workspace_root / problem_dir.name
+    counts: dict[str, int] = {}
+    _mirror(problem_dir / "base", workspace_problem_dir / "base", mode, counts)
+    _mirror(cr_dir, workspace_problem_dir / cr_dir.name, mode, counts)
+    return workspace_problem_dir, counts
@@ -3,7 +3,6 @@ from __future__ import annotations
 import argparse
 import datetime
 import json
-import shutil
 import sys
 import time
 import traceback
@@ -20,18 +19,15 @@ if str(MODREF_DIR) not in sys.path:
 if str(WORKFLOW_DIR) not in sys.path:
     sys.path.insert(0, str(WORKFLOW_DIR))
 
-from langgraph_workflow.workflow import run_workflow_once  # noqa: E402
+from langgraph_workflow.workflow import plan_workflow_forks, run_workflow_forked, run_workflow_once  # noqa: E402
+from case_workspace import DEFAULT_WORKSPACE_MODE, WORKSPACE_MODES, build_case_workspace  # noqa: E402
 from model_presets import get_model_preset_by_key  # noqa: E402
+from run_journal import JOURNAL_FILENAME, case_key, open_journal  # noqa: E402
 from variant_presets import select_ablation_variants  # noqa: E402
 
 DEFAULT_ABLATION_MODEL_KEY = "openrouter_gemini_3_1_flash_lite_preview"
 
 
-def _ignore_copy(_: str, names: list[str]) -> set[str]:
-    ignored = {"__pycache__", ".DS_Store", "results", "generated_model.py"}
-    return {name for name in names if name in ignored}
-
-
 def _iter_cases(problems_root: Path, only_problem: str | None, only_cr: str | None):
     for problem_dir in sorted(problems_root.iterdir()):
         if not problem_dir.is_dir() or not problem_dir.name.startswith("problem"):
@@ -47,18 +43,6 @@ def _iter_cases(problems_root: Path, only_problem: str | None, only_cr: str | No
             yield problem_dir, cr_dir
 
 
-def _prepare_case_workspace(problem_dir: Path, cr_dir: Path, workspace_root: Path) -> Path:
-    if workspace_root.exists():
-        shutil.rmtree(workspace_root)
-
-    workspace_problem_dir = workspace_root / problem_dir.name
-    workspace_problem_dir.mkdir(parents=True, exist_ok=True)
-
-    shutil.copytree(problem_dir / "base", workspace_problem_dir / "base", ignore=_ignore_copy)
-    shutil.copytree(cr_dir, workspace_problem_dir / cr_dir.name, ignore=_ignore_copy)
-    return workspace_problem_dir
-
-
 def _build_llm_config(preset: dict[str, Any], max_output_tokens: int | None) -> dict[str, Any]:
     return {
         "provider": preset["provider"],
@@ -96,6 +80,9 @@ def _summarize_case(
     run_log: dict[str, Any] | None,
     log_path: Path | None,
     error: Exception | None = None,
+    error_traceback: str | None = None,
+    shared_prefix: dict[str, Any] | None = None,
+    prefix_seconds: float | None = None,
 ) -> dict[str, Any]:
     summary: dict[str, Any] = {
         "model_key": preset["key"],
@@ -113,6 +100,8 @@ def _summarize_case(
         "case_dir": str(case_dir.resolve()),
         "workspace_problem_path": str((case_dir / "workspace" / problem_name).resolve()),
         "docs_url": preset.get("docs_url"),
+        "shared_prefix": shared_prefix,
+        "prefix_seconds": prefix_seconds,
     }
 
     if error is not None:
@@ -121,7 +110,7 @@ def _summarize_case(
                 "status": "fail",
                 "stage": "runner",
                 "error": str(error),
-                "traceback": traceback.format_exc(),
+                "traceback": error_traceback or traceback.format_exc(),
             }
         )
         return summary
@@ -215,6 +204,21 @@ def main() -> None:
         action="append",
         help="Optional ablation variant key to run. Repeat to run more than one variant.",
     )
+    parser.add_argument(
+        "--workspace-mode",
+        choices=WORKSPACE_MODES,
+        default=DEFAULT_WORKSPACE_MODE,
+        help="How case workspaces get the read-only problem inputs: hardlinks, symlinks or full copies (default: hardlink). input_data.json is always copied.",
+    )
+    parser.add_argument(
+        "--resume",
+        help="Path to the journal.jsonl of an earlier ablation run. Cases finished in it are skipped (runner errors are retried) and summaries are rebuilt from it.",
+    )
+    parser.add_argument(
+        "--no-prefix-sharing",
+        action="store_true",
+        help="Run every variant from scratch instead of forking variants from the checkpoints where they diverge.",
+    )
     args = parser.parse_args()
 
     preset = get_model_preset_by_key(args.model_key)
@@ -227,8 +231,13 @@ def main() -> None:
     output_root.mkdir(parents=True, exist_ok=True)
 
     experiment_timestamp = datetime.datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
-    experiment_root = output_root / experiment_timestamp
+    if args.resume:
+        experiment_root = Path(args.resume).resolve().parent
+        experiment_timestamp = experiment_root.name
+    else:
+        experiment_root = output_root / experiment_timestamp
     experiment_root.mkdir(parents=True, exist_ok=True)
+    journal = open_journal(args.resume, experiment_root / JOURNAL_FILENAME)
 
     manifest = {
         "timestamp": experiment_timestamp,
@@ -243,6 +252,12 @@ def main() -> None:
         },
         "executor_timeout": args.executor_timeout,
         "max_output_tokens": args.max_output_tokens,
+        "journal_path": str(journal.path),
+        "workspace_mode": args.workspace_mode,
+        "prefix_sharing": not args.no_prefix_sharing,
+        "shared_prefixes": [] if args.no_prefix_sharing else plan_workflow_forks(
+            [{"key": variant["key"], **_resolve_variant_config(variant, args)} for variant in selected_variants]
+        ),
         "variants": [
             {
                 **variant,
@@ -259,75 +274,143 @@ def main() -> None:
 
     all_results: list[dict[str, Any]] = []
     variant_summaries: list[dict[str, Any]] = []
-
+    effective_configs = {variant["key"]: _resolve_variant_config(variant, args) for variant in selected_variants}
+    variants_by_key = {variant["key"]: variant for variant in selected_variants}
     for variant in selected_variants:
-        effective_config = _resolve_variant_config(variant, args)
-        variant_dir = model_root / variant["key"]
-        variant_dir.mkdir(parents=True, exist_ok=True)
-        variant_results: list[dict[str, Any]] = []
+        (model_root / variant["key"]).mkdir(parents=True, exist_ok=True)
+
+    def record_case(variant: dict[str, Any], problem_dir: Path, cr_dir: Path, case_summary: dict[str, Any]) -> None:
+        case_dir = model_root / variant["key"] / problem_dir.name / cr_dir.name
+        (case_dir / "case_summary.json").write_text(json.dumps(case_summary, indent=2))
+        journal.append(case_key(variant["key"], problem_dir.name, cr_dir.name), case_summary)
 
+    def run_variant_alone(variant: dict[str, Any], problem_dir: Path, cr_dir: Path) -> None:
+        effective_config = effective_configs[variant["key"]]
+        case_dir = model_root / variant["key"] / problem_dir.name / cr_dir.name
+        workspace_problem_dir = case_dir / "workspace" / problem_dir.name
         print(
-            f"[ablations] Running variant {variant['key']} with model {preset['key']} -> {preset['model']}",
+            f"[ablations] Running {variant['key']} on {problem_dir.name}/{cr_dir.name} ...",
             flush=True,
         )
 
-        for problem_dir, cr_dir in _iter_cases(problems_root, args.only_problem, args.only_cr):
-            case_dir = variant_dir / problem_dir.name / cr_dir.name
-            case_dir.mkdir(parents=True, exist_ok=True)
-            workspace_problem_dir = _prepare_case_workspace(problem_dir, cr_dir, case_dir / "workspace")
+        started = time.perf_counter()
+        try:
+            result, run_log, log_path = run_workflow_once(
+                problem_path=str(workspace_problem_dir),
+                cr=cr_dir.name,
+                llm_config=llm_config,
+                max_planner_validation_error_loops=effective_config["max_planner_validation_error_loops"],
+                max_exec_error_loops=effective_config["max_exec_error_loops"],
+                max_validation_error_loops=effective_config["max_validation_error_loops"],
+                executor_timeout=args.executor_timeout,
+                run_output_dir=case_dir,
+                hitl_enabled=False,
+                enable_planner_validator=effective_config["enable_planner_validator"],
+                enable_final_validator=effective_config["enable_final_validator"],
+            )
+            elapsed = time.perf_counter() - started
+            case_summary = _summarize_case(
+                preset=preset,
+                variant=variant,
+                effective_config=effective_config,
+                problem_name=problem_dir.name,
+                cr_name=cr_dir.name,
+                case_dir=case_dir,
+                elapsed_seconds=elapsed,
+                result=result,
+                run_log=run_log,
+                log_path=log_path,
+            )
+        except Exception as exc:
+            elapsed = time.perf_counter() - started
+            case_summary = _summarize_case(
+                preset=preset,
+                variant=variant,
+                effective_config=effective_config,
+                problem_name=problem_dir.name,
+                cr_name=cr_dir.name,
+                case_dir=case_dir,
+                elapsed_seconds=elapsed,
+                result=None,
+                run_log=None,
+                log_path=None,
+                error=exc,
+            )
+        record_case(variant, problem_dir, cr_dir, case_summary)
+
+    def run_variants_forked(pending: list[dict[str, Any]], problem_dir: Path, cr_dir: Path) -> None:
+        print(
+            f"[ablations] Running {len(pending)} variants on {problem_dir.name}/{cr_dir.name} from shared checkpoints ...",
+            flush=True,
+        )
+        fork_variants = []
+        for variant in pending:
+            case_dir = model_root / variant["key"] / problem_dir.name / cr_dir.name
+            fork_variants.append(
+                {
+                    "key": variant["key"],
+                    "problem_path": str(case_dir / "workspace" / problem_dir.name),
+                    "run_output_dir": case_dir,
+                    **effective_configs[variant["key"]],
+                }
+            )
 
+        for outcome in run_workflow_forked(
+            cr=cr_dir.name,
+            llm_config=llm_config,
+            variants=fork_variants,
+            executor_timeout=args.executor_timeout,
+        ):
+            variant = variants_by_key[outcome["key"]]
+            case_summary = _summarize_case(
+                preset=preset,
+                variant=variant,
+                effective_config=effective_configs[variant["key"]],
+                problem_name=problem_dir.name,
+                cr_name=cr_dir.name,
+                case_dir=model_root / variant["key"] / problem_dir.name / cr_dir.name,
+                elapsed_seconds=outcome["seconds"],
+                result=outcome["result"],
+                run_log=outcome["run_log"],
+                log_path=outcome["log_path"],
+                error=outcome["error"],
+                error_traceback=outcome["traceback"],
+                shared_prefix=outcome["shared_prefix"],
+                prefix_seconds=outcome["prefix_seconds"],
+            )
             print(
-                f"[ablations] Running {variant['key']} on {problem_dir.name}/{cr_dir.name} ...",
+                f"[ablations] {variant['key']} on {problem_dir.name}/{cr_dir.name}: {case_summary['status']}",
                 flush=True,
             )
+            record_case(variant, problem_dir, cr_dir, case_summary)
+
+    print(f"[ablations] Running {len(selected_variants)} variants with model {preset['key']} -> {preset['model']}", flush=True)
+    cases = list(_iter_cases(problems_root, args.only_problem, args.only_cr))
+    for problem_dir, cr_dir in cases:
+        pending = []
+        for variant in selected_variants:
+            key = case_key(variant["key"], problem_dir.name, cr_dir.name)
+            if journal.is_done(key):
+                print(f"[ablations] Skipping {key} (already in journal)", flush=True)
+                continue
+            case_dir = model_root / variant["key"] / problem_dir.name / cr_dir.name
+            case_dir.mkdir(parents=True, exist_ok=True)
+            build_case_workspace(problem_dir, cr_dir, case_dir / "workspace", args.workspace_mode)
+            pending.append(variant)
 
-            started = time.perf_counter()
-            try:
-                result, run_log, log_path = run_workflow_once(
-                    problem_path=str(workspace_problem_dir),
-                    cr=cr_dir.name,
-                    llm_config=llm_config,
-                    max_planner_validation_error_loops=effective_config["max_planner_validation_error_loops"],
-                    max_exec_error_loops=effective_config["max_exec_error_loops"],
-                    max_validation_error_loops=effective_config["max_validation_error_loops"],
-                    executor_timeout=args.executor_timeout,
-                    run_output_dir=case_dir,
-                    hitl_enabled=False,
-                    enable_planner_validator=effective_config["enable_planner_validator"],
-                    enable_final_validator=effective_config["enable_final_validator"],
-                )
-                elapsed = time.perf_counter() - started
-                case_summary = _summarize_case(
-                    preset=preset,
-                    variant=variant,
-                    effective_config=effective_config,
-                    problem_name=problem_dir.name,
-                    cr_name=cr_dir.name,
-                    case_dir=case_dir,
-                    elapsed_seconds=elapsed,
-                    result=result,
-                    run_log=run_log,
-                    log_path=log_path,
-                )
-            except Exception as exc:
-                elapsed = time.perf_counter() - started
-                case_summary = _summarize_case(
-                    preset=preset,
-                    variant=variant,
-                    effective_config=effective_config,
-                    problem_name=problem_dir.name,
-                    cr_name=cr_dir.name,
-                    case_dir=case_dir,
-                    elapsed_seconds=elapsed,
-                    result=None,
-                    run_log=None,
-                    log_path=None,
-                    error=exc,
-                )
-
-            (case_dir / "case_summary.json").write_text(json.dumps(case_summary, indent=2))
-            variant_results.append(case_summary)
-            all_results.append(case_summary)
+        if args.no_prefix_sharing or len(pending) < 2:
+            for variant in pending:
+                run_variant_alone(variant, problem_dir, cr_dir)
+        else:
+            run_variants_forked(pending, problem_dir, cr_dir)
+
+    for variant in selected_variants:
+        effective_config = effective_configs[variant["key"]]
+        variant_dir = model_root / variant["key"]
+        variant_results = journal.results(
+            case_key(variant["key"], problem_dir.name, cr_dir.name) for problem_dir, cr_dir in cases
+        )
+        all_results.extend(variant_results)
 
         variant_summary = {
             "model_key": preset["key"],
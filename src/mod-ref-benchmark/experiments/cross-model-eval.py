@@ -3,9 +3,10 @@ from __future__ import annotations
 import argparse
 import datetime
 import json
-import shutil
+import os
 import sys
 import traceback
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any
 
@@ -20,12 +21,10 @@ if str(WORKFLOW_DIR) not in sys.path:
     sys.path.insert(0, str(WORKFLOW_DIR))
 
 from langgraph_workflow.workflow import run_workflow_once  # noqa: E402
-from model_presets import select_model_presets  # noqa: E402
-
-
-def _ignore_copy(_: str, names: list[str]) -> set[str]:
-    ignored = {"__pycache__", ".DS_Store", "results", "generated_model.py"}
-    return {name for name in names if name in ignored}
+from case_workspace import DEFAULT_WORKSPACE_MODE, WORKSPACE_MODES, build_case_workspace  # noqa: E402
+from model_presets import preset_concurrency, select_model_presets  # noqa: E402
+from run_journal import JOURNAL_FILENAME, case_key, open_journal  # noqa: E402
+from solver_guard import set_solver_concurrency  # noqa: E402
 
 
 def _iter_cases(problems_root: Path, only_problem: str | None, only_cr: str | None):
@@ -43,18 +42,6 @@ def _iter_cases(problems_root: Path, only_problem: str | None, only_cr: str | No
             yield problem_dir, cr_dir
 
 
-def _prepare_case_workspace(problem_dir: Path, cr_dir: Path, workspace_root: Path) -> Path:
-    if workspace_root.exists():
-        shutil.rmtree(workspace_root)
-
-    workspace_problem_dir = workspace_root / problem_dir.name
-    workspace_problem_dir.mkdir(parents=True, exist_ok=True)
-
-    shutil.copytree(problem_dir / "base", workspace_problem_dir / "base", ignore=_ignore_copy)
-    shutil.copytree(cr_dir, workspace_problem_dir / cr_dir.name, ignore=_ignore_copy)
-    return workspace_problem_dir
-
-
 def _build_llm_config(preset: dict[str, Any], max_output_tokens: int | None) -> dict[str, Any]:
     return {
         "provider": preset["provider"],
@@ -173,6 +160,27 @@ def main() -> None:
         action="append",
         help="Optional preset key to run. Repeat to run more than one model.",
     )
+    parser.add_argument(
+        "--preset-jobs",
+        type=int,
+        help="Override the per-preset case concurrency (default: each preset's max_concurrency).",
+    )
+    parser.add_argument(
+        "--max-solvers",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Global cap on simultaneously running model subprocesses across all presets (default: CPU count).",
+    )
+    parser.add_argument(
+        "--workspace-mode",
+        choices=WORKSPACE_MODES,
+        default=DEFAULT_WORKSPACE_MODE,
+        help="How case workspaces get the read-only problem inputs: hardlinks, symlinks or full copies (default: hardlink). input_data.json is always copied.",
+    )
+    parser.add_argument(
+        "--resume",
+        help="Path to the journal.jsonl of an earlier evaluation. Cases finished in it are skipped (runner errors are retried) and summaries are rebuilt from it.",
+    )
     args = parser.parse_args()
 
     selected_presets = select_model_presets(args.only_model)
@@ -182,8 +190,13 @@ def main() -> None:
     output_root.mkdir(parents=True, exist_ok=True)
 
     eval_timestamp = datetime.datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
-    eval_root = output_root / eval_timestamp
+    if args.resume:
+        eval_root = Path(args.resume).resolve().parent
+        eval_timestamp = eval_root.name
+    else:
+        eval_root = output_root / eval_timestamp
     eval_root.mkdir(parents=True, exist_ok=True)
+    journal = open_journal(args.resume, eval_root / JOURNAL_FILENAME)
 
     manifest = {
         "timestamp": eval_timestamp,
@@ -196,65 +209,79 @@ def main() -> None:
         "executor_timeout": args.executor_timeout,
         "max_output_tokens": args.max_output_tokens,
         "selected_models": selected_presets,
+        "journal_path": str(journal.path),
+        "workspace_mode": args.workspace_mode,
+        "preset_concurrency": {preset["key"]: args.preset_jobs or preset_concurrency(preset) for preset in selected_presets},
+        "max_solvers": args.max_solvers,
     }
     (eval_root / "experiment_manifest.json").write_text(json.dumps(manifest, indent=2))
 
-    all_results: list[dict[str, Any]] = []
+    cases = list(_iter_cases(problems_root, args.only_problem, args.only_cr))
 
-    for preset in selected_presets:
-        preset_dir = eval_root / preset["key"]
-        preset_dir.mkdir(parents=True, exist_ok=True)
-        model_results: list[dict[str, Any]] = []
+    def run_case(preset: dict[str, Any], llm_config: dict[str, Any], problem_dir: Path, cr_dir: Path) -> None:
+        key = case_key(preset["key"], problem_dir.name, cr_dir.name)
+        case_dir = eval_root / preset["key"] / problem_dir.name / cr_dir.name
+        case_dir.mkdir(parents=True, exist_ok=True)
+        workspace_problem_dir = build_case_workspace(problem_dir, cr_dir, case_dir / "workspace", args.workspace_mode)[0]
 
-        llm_config = _build_llm_config(preset, args.max_output_tokens)
-        print(f"[cross-model-eval] Running preset {preset['key']} -> {preset['model']}", flush=True)
+        print(
+            f"[cross-model-eval] Running {preset['key']} on {problem_dir.name}/{cr_dir.name} ...",
+            flush=True,
+        )
+        try:
+            result, run_log, log_path = run_workflow_once(
+                problem_path=str(workspace_problem_dir),
+                cr=cr_dir.name,
+                llm_config=llm_config,
+                max_planner_validation_error_loops=args.max_planner_validation_error_loops,
+                max_exec_error_loops=args.max_exec_error_loops,
+                max_validation_error_loops=args.max_validation_error_loops,
+                executor_timeout=args.executor_timeout,
+                run_output_dir=case_dir,
+                hitl_enabled=False,
+            )
+            case_summary = _summarize_case(
+                preset=preset,
+                problem_name=problem_dir.name,
+                cr_name=cr_dir.name,
+                case_dir=case_dir,
+                result=result,
+                run_log=run_log,
+                log_path=log_path,
+            )
+        except Exception as exc:
+            case_summary = _summarize_case(
+                preset=preset,
+                problem_name=problem_dir.name,
+                cr_name=cr_dir.name,
+                case_dir=case_dir,
+                result=None,
+                run_log=None,
+                log_path=None,
+                error=exc,
+            )
 
-        for problem_dir, cr_dir in _iter_cases(problems_root, args.only_problem, args.only_cr):
-            case_dir = preset_dir / problem_dir.name / cr_dir.name
-            case_dir.mkdir(parents=True, exist_ok=True)
-            workspace_problem_dir = _prepare_case_workspace(problem_dir, cr_dir, case_dir / "workspace")
+        (case_dir / "case_summary.json").write_text(json.dumps(case_summary, indent=2))
+        journal.append(key, case_summary)
 
-            print(
-                f"[cross-model-eval] Running {preset['key']} on {problem_dir.name}/{cr_dir.name} ...",
-                flush=True,
-            )
-            try:
-                result, run_log, log_path = run_workflow_once(
-                    problem_path=str(workspace_problem_dir),
-                    cr=cr_dir.name,
-                    llm_config=llm_config,
-                    max_planner_validation_error_loops=args.max_planner_validation_error_loops,
-                    max_exec_error_loops=args.max_exec_error_loops,
-                    max_validation_error_loops=args.max_validation_error_loops,
-                    executor_timeout=args.executor_timeout,
-                    run_output_dir=case_dir,
-                    hitl_enabled=False,
-                )
-                case_summary = _summarize_case(
-                    preset=preset,
-                    problem_name=problem_dir.name,
-                    cr_name=cr_dir.name,
-                    case_dir=case_dir,
-                    result=result,
-                    run_log=run_log,
-                    log_path=log_path,
-                )
-            except Exception as exc:
-                case_summary = _summarize_case(
-                    preset=preset,
-                    problem_name=problem_dir.name,
-                    cr_name=cr_dir.name,
-                    case_dir=case_dir,
-                    result=None,
-                    run_log=None,
-                    log_path=None,
-                    error=exc,
-                )
+    def run_preset(preset: dict[str, Any]) -> list[dict[str, Any]]:
+        preset_dir = eval_root / preset["key"]
+        preset_dir.mkdir(parents=True, exist_ok=True)
+        llm_config = _build_llm_config(preset, args.max_output_tokens)
+        case_keys = [case_key(preset["key"], problem_dir.name, cr_dir.name) for problem_dir, cr_dir in cases]
+        pending = [case for case, key in zip(cases, case_keys) if not journal.is_done(key)]
+        workers = args.preset_jobs or preset_concurrency(preset)
+        print(
+            f"[cross-model-eval] Running preset {preset['key']} -> {preset['model']} "
+            f"({len(pending)} cases, {workers} at a time, {len(cases) - len(pending)} already in journal)",
+            flush=True,
+        )
 
-            (case_dir / "case_summary.json").write_text(json.dumps(case_summary, indent=2))
-            model_results.append(case_summary)
-            all_results.append(case_summary)
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            for future in [pool.submit(run_case, preset, llm_config, *case) for case in pending]:
+                future.result()
 
+        model_results = journal.results(case_keys)
         model_summary = {
             "model_key": preset["key"],
             "model_label": preset["label"],
@@ -262,6 +289,7 @@ def main() -> None:
             "model": preset["model"],
             "reasoning_effort": preset.get("reasoning_effort"),
             "docs_url": preset.get("docs_url"),
+            "max_concurrency": workers,
             "counts": {
                 "total": len(model_results),
                 "pass": sum(1 for item in model_results if item.get("status") == "pass"),
@@ -270,6 +298,17 @@ def main() -> None:
             "results": model_results,
         }
         (preset_dir / "model_summary.json").write_text(json.dumps(model_summary, indent=2))
+        print(f"[cross-model-eval] Finished preset {preset['key']}", flush=True)
+        return model_results
+
+    # Presets talk to independent providers, so they run side by side; solver subprocesses from
+    # all of them share the --max-solvers slots.
+    set_solver_concurrency(args.max_solvers)
+    with ThreadPoolExecutor(max_workers=max(1, len(selected_presets))) as pool:
+        preset_futures = [pool.submit(run_preset, preset) for preset in selected_presets]
+        all_results: list[dict[str, Any]] = []
+        for future in preset_futures:
+            all_results.extend(future.result())
 
     overall_summary = {
         "timestamp": eval_timestamp,
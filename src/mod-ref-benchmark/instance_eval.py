@@ -0,0 +1,200 @@
+"""Evaluate a generated model against a directory of instances for its CR.
+
+Passing the shipped ``input_data.json`` says little about other instances, so
+``evaluate_instances`` runs the final ``generated_model.py`` on every ``*.json`` in an instance
+directory (by default ``CR*/instances/``). No CR ships that folder, so when it is absent a seeded
+set is generated from the CR's ``input_data.json`` with ``instance_generators`` (written under the
+evaluation's output directory, never into ``problems/``). Instances run concurrently, each in its
+own guarded subprocess with at most ``jobs`` alive at once, and every output is checked with the
+CR unit test. The summary records the pass rate and the distribution of solve times.
+"""
+
+from __future__ import annotations
+
+import json
+import shutil
+import statistics
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any
+
+from instance_generators import generate_instance, supports_problem
+from reference_oracle import INSTANCES_DIRNAME, OracleStore, lookup_reference, with_oracle_optimum
+from scale_ladder import run_and_verify
+from unit_test_loader import load_verify_func
+
+GENERATED_INSTANCE_SCALES = (1, 2, 4)
+GENERATED_INSTANCE_SEEDS = (0, 1, 2)
+
+
+def resolve_instances_dir(cr_dir: Path, instances_root: Path | None = None) -> Path:
+    """``<instances_root>/<problem>/<CR>`` when a root is given, else ``<cr_dir>/instances``."""
+    if instances_root is not None:
+        return instances_root / cr_dir.parent.name / cr_dir.name
+    return cr_dir / INSTANCES_DIRNAME
+
+
+def generate_instance_set(
+    cr_dir: Path,
+    target_dir: Path,
+    *,
+    scales: tuple[int, ...] = GENERATED_INSTANCE_SCALES,
+    seeds: tuple[int, ...] = GENERATED_INSTANCE_SEEDS,
+) -> list[Path]:
+    """Write seeded instances grown from the CR's ``input_data.json`` into ``target_dir``.
+
+    Scale 1 is the shipped instance and is written once; a scale the generator cannot build is
+    skipped with a warning rather than failing the evaluation.
+    """
+    problem, cr = cr_dir.parent.name, cr_dir.name
+    template = json.loads((cr_dir / "input_data.json").read_text())
+    target_dir.mkdir(parents=True, exist_ok=True)
+    written: list[Path] = []
+    for scale in scales:
+        for seed in seeds if scale > 1 else seeds[:1]:
+            try:
+                data = generate_instance(problem, cr, template, scale, seed)
+            except ValueError as exc:
+                print(f"[instance-eval] {problem}/{cr}: skipping scale {scale} seed {seed}: {exc}", flush=True)
+                continue
+            path = target_dir / f"scale{scale}_seed{seed}.json"
+            path.write_text(json.dumps(data))
+            written.append(path)
+    return written
+
+
+def timing_stats(seconds: list[float]) -> dict[str, float | None]:
+    if not seconds:
+        return {"min": None, "median": None, "mean": None, "p90": None, "max": None}
+    ordered = sorted(seconds)
+    p90_index = min(len(ordered) - 1, int(round(0.9 * (len(ordered) - 1))))
+    return {
+        "min": round(ordered[0], 4),
+        "median": round(statistics.median(ordered), 4),
+        "mean": round(statistics.fmean(ordered), 4),
+        "p90": round(ordered[p90_index], 4),
+        "max": round(ordered[-1], 4),
+    }
+
+
+def _evaluate_one(
+    *,
+    instance_path: Path,
+    cr_dir: Path,
+    model_path: Path,
+    workspace: Path,
+    verify_func,
+    timeout: float | None,
+    oracle: OracleStore | None,
+) -> dict[str, Any]:
+    entry: dict[str, Any] = {"instance": instance_path.name}
+    try:
+        data = json.loads(instance_path.read_text())
+        workspace.mkdir(parents=True, exist_ok=True)
+        (workspace / "input_data.json").write_text(json.dumps(data))
+        shutil.copy2(model_path, workspace / "generated_model.py")
+
+        record = lookup_reference(cr_dir, data, oracle)
+        data = with_oracle_optimum(data, record)
+        entry["reference_seconds"] = (record or {}).get("seconds")
+        entry.update(
+            run_and_verify(
+                script_path=workspace / "generated_model.py",
+                cwd=workspace,
+                data=data,
+                verify_func=verify_func,
+                timeout=timeout,
+            )
+        )
+    except Exception as exc:
+        entry.update({"exec_ok": False, "unit_test_pass": False, "error": str(exc)})
+    return entry
+
+
+def evaluate_instances(
+    *,
+    cr_dir: Path,
+    model_path: Path,
+    instances_dir: Path,
+    output_dir: Path,
+    jobs: int = 1,
+    timeout: float | None = None,
+    oracle: OracleStore | None = None,
+) -> dict[str, Any]:
+    """Run ``model_path`` on every instance in ``instances_dir`` and summarise the outcomes.
+
+    A missing ``instances_dir`` is replaced by a generated set (see ``generate_instance_set``).
+
+    The report is written to ``output_dir/instance_eval.json`` and returned.
+    """
+    output_dir.mkdir(parents=True, exist_ok=True)
+    report_path = output_dir / "instance_eval.json"
+    report: dict[str, Any] = {
+        "problem": cr_dir.parent.name,
+        "cr": cr_dir.name,
+        "instances_dir": str(instances_dir),
+        "jobs": jobs,
+        "timeout": timeout,
+    }
+
+    if not instances_dir.is_dir() and supports_problem(cr_dir.parent.name):
+        instances_dir = output_dir / "generated_instances"
+        generate_instance_set(cr_dir, instances_dir)
+        report.update({"instances_dir": str(instances_dir), "instances_generated": True})
+    instance_paths = sorted(instances_dir.glob("*.json")) if instances_dir.is_dir() else []
+    if not instance_paths:
+        report.update({"error": f"No instances found in {instances_dir}", "counts": {"total": 0, "pass": 0, "fail": 0}})
+        report_path.write_text(json.dumps(report, indent=2))
+        report["report_path"] = str(report_path)
+        return report
+
+    verify_func = load_verify_func(cr_dir / "unit_test.py")
+    print(
+        f"[instance-eval] {cr_dir.parent.name}/{cr_dir.name}: {len(instance_paths)} instances, {jobs} at a time",
+        flush=True,
+    )
+    with ThreadPoolExecutor(max_workers=max(1, jobs)) as pool:
+        results = list(
+            pool.map(
+                lambda path: _evaluate_one(
+                    instance_path=path,
+                    cr_dir=cr_dir,
+                    model_path=model_path,
+                    workspace=output_dir / path.stem,
+                    verify_func=verify_func,
+                    timeout=timeout,
+                    oracle=oracle,
+                ),
+                instance_paths,
+            )
+        )
+
+    passed = [r for r in results if r.get("unit_test_pass")]
+    report.update(
+        {
+            "counts": {"total": len(results), "pass": len(passed), "fail": len(results) - len(passed)},
+            "pass_rate": round(len(passed) / len(results), 4),
+            "timeouts": sum(1 for r in results if r.get("timed_out")),
+            "seconds": timing_stats([r["seconds"] for r in results if r.get("seconds") is not None]),
+            "pass_seconds": timing_stats([r["seconds"] for r in passed if r.get("seconds") is not None]),
+            "results": results,
+        }
+    )
+    report_path.write_text(json.dumps(report, indent=2))
+    report["report_path"] = str(report_path)
+    return report
+
+
+def summarize_instance_eval(report: dict[str, Any] | None) -> dict[str, Any] | None:
+    """Compact view of an ``evaluate_instances`` report for run summaries."""
+    if report is None:
+        return None
+    return {
+        "counts": report.get("counts"),
+        "instances_generated": report.get("instances_generated", False),
+        "pass_rate": report.get("pass_rate"),
+        "timeouts": report.get("timeouts"),
+        "seconds": report.get("seconds"),
+        "error": report.get("error"),
+        "report_path": report.get("report_path"),
+    }
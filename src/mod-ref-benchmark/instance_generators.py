@@ -0,0 +1,608 @@
+"""Seeded, parametric instance generators for the benchmark problem families.
+
+Every CR ships a single small ``input_data.json``. ``generate_instance`` grows that instance
+by an integer ``scale`` while keeping the CR's schema (so the reference model, the generated
+model and the unit test all read it unchanged). Scale 1 returns the shipped instance.
+
+Most families are grown by replicating the shipped instance ``scale`` times with disjoint
+ids and shuffling/jittering the parts that do not affect feasibility, so a scaled instance is
+feasible whenever the shipped one is. Car sequencing, bus driver scheduling and RCPSP are
+generated from scratch around a planted solution instead (car sequencing reads its demand, and
+for CR2 a loosened gap limit, off the planted sequence). ``ref_opt_val`` is dropped from scaled
+instances because the shipped optimum no longer applies.
+"""
+
+from __future__ import annotations
+
+import copy
+import random
+from typing import Any, Callable
+
+Instance = dict[str, Any]
+Generator = Callable[[Instance, str, int, random.Random], Instance]
+
+
+def _shuffled(rng: random.Random, n: int) -> list[int]:
+    order = list(range(n))
+    rng.shuffle(order)
+    return order
+
+
+def _jitter(rng: random.Random, value: int, spread: float = 0.1) -> int:
+    delta = max(1, int(abs(value) * spread))
+    return max(1, value + rng.randint(-delta, delta))
+
+
+# ---------------------------------------------------------------------------
+# problem1: car sequencing
+# ---------------------------------------------------------------------------
+
+
+def _car_sequencing_fits(data: Instance, cr: str, seq: list[int], n_cars: int) -> bool:
+    """Whether the newest car in ``seq`` keeps the capacity (and, for CR1, adjacency) constraints."""
+    i = len(seq) - 1
+    t = seq[i]
+    # CR3 relaxes each capacity window by one violation, so the planted sequence may use it.
+    slack = 1 if cr == "CR3" else 0
+    for o, needed in enumerate(data["requires"][t]):
+        start = i - data["per_slots"][o] + 1
+        # The references only check windows starting before n_cars - per_slots; a partial window
+        # at the front is a prefix of the first one and can be pruned early.
+        if needed and start < n_cars - data["per_slots"][o]:
+            window = seq[max(0, start) : i + 1]
+            if sum(data["requires"][u][o] for u in window) > data["at_most"][o] + slack:
+                return False
+    if cr == "CR1" and i > 0 and seq[i - 1] == t:
+        return False
+    return True
+
+
+def _tightest_gap_limit(seq: list[int], n_types: int, floor: int) -> int:
+    """Smallest gap limit (at least ``floor``) such that every type occurs in each checked window of ``seq``."""
+    n_cars = len(seq)
+    for gap in range(floor, n_cars + 1):
+        if all(len(set(seq[s : s + gap])) == n_types for s in range(n_cars - gap)):
+            return gap
+    return n_cars
+
+
+def _plant_car_sequence(data: Instance, cr: str, n_cars: int, rng: random.Random, max_steps: int = 200_000) -> list[int] | None:
+    """Randomised depth-first search for a sequence of ``n_cars`` cars that meets the CR's hard constraints.
+
+    Types are tried in a random order weighted by how far each is below its share of the scaled
+    template demand, so the planted mix stays close to the shipped one.
+    """
+    n_types = len(data["demand"])
+    targets = [d * n_cars / max(sum(data["demand"]), 1) for d in data["demand"]]
+    counts = [0] * n_types
+    seq: list[int] = []
+    choices: list[list[int]] = []
+    steps = 0
+
+    def candidates() -> list[int]:
+        keyed = [(rng.random() ** (1.0 / (max(targets[t] - counts[t], 0.0) + 0.05)), t) for t in range(n_types)]
+        return [t for _, t in sorted(keyed, reverse=True)]
+
+    choices.append(candidates())
+    while len(seq) < n_cars:
+        steps += 1
+        if steps > max_steps:
+            return None
+        if not choices[-1]:
+            choices.pop()
+            if not seq:
+                return None
+            counts[seq.pop()] -= 1
+            continue
+        t = choices[-1].pop(0)
+        seq.append(t)
+        if _car_sequencing_fits(data, cr, seq, n_cars):
+            counts[t] += 1
+            choices.append(candidates())
+        else:
+            seq.pop()
+    return seq
+
+
+def _car_sequencing(data: Instance, cr: str, scale: int, rng: random.Random) -> Instance:
+    # Multiplying the demand alone keeps the station capacities fixed and quickly makes the
+    # instance infeasible, so the demand is read off a planted feasible sequence instead.
+    n_cars = sum(data["demand"]) * scale
+    for _ in range(20):
+        planted = _plant_car_sequence(data, cr, n_cars, rng)
+        if planted is not None:
+            break
+    else:
+        raise ValueError(f"Could not plant a feasible car sequence of {n_cars} cars for {cr}")
+    out = dict(data)
+    out["demand"] = [planted.count(t) for t in range(len(data["demand"]))]
+    if cr == "CR2":
+        # The shipped gap limit is only satisfiable for the shipped length (type 0 fits nowhere but
+        # the unchecked tail), so it is loosened to the tightest value the planted sequence meets.
+        out["gap_limit"] = _tightest_gap_limit(planted, len(out["demand"]), data["gap_limit"])
+    return out
+
+
+# ---------------------------------------------------------------------------
+# problem2: template design
+# ---------------------------------------------------------------------------
+
+
+def _template_design(data: Instance, cr: str, scale: int, rng: random.Random) -> Instance:
+    lo, hi = min(data["demand"]), max(data["demand"])
+    n_var = data["n_var"] * scale
+    out = dict(data)
+    out["n_var"] = n_var
+    out["n_slots"] = data["n_slots"] * scale
+    out["demand"] = sorted(rng.randint(lo, hi) for _ in range(n_var))
+    return out
+
+
+# ---------------------------------------------------------------------------
+# problem3: bus driver scheduling (planted exact cover)
+# ---------------------------------------------------------------------------
+
+
+def _partition(rng: random.Random, items: list[int], max_len: int) -> list[list[int]]:
+    items = list(items)
+    rng.shuffle(items)
+    blocks: list[list[int]] = []
+    while items:
+        size = rng.randint(1, max_len)
+        blocks.append(sorted(items[:size]))
+        items = items[size:]
+    return blocks
+
+
+def _bus_driver(data: Instance, cr: str, scale: int, rng: random.Random) -> Instance:
+    n_tasks = data["n_tasks"] * scale
+    max_len = max(len(s) for s in data["shifts"])
+    coverage = 2 if cr == "CR1" else 1
+
+    planted: list[list[int]] = []
+    for _ in range(coverage):
+        planted.extend(_partition(rng, list(range(n_tasks)), max_len))
+    n_extra = max(len(data["shifts"]) * scale - len(planted), 0)
+    extra = [sorted(rng.sample(range(n_tasks), rng.randint(1, min(max_len, n_tasks)))) for _ in range(n_extra)]
+
+    shifts = planted + extra
+    order = _shuffled(rng, len(shifts))
+    out = dict(data)
+    out["n_tasks"] = n_tasks
+    out["shifts"] = [shifts[i] for i in order]
+
+    if "shift_costs" in data:
+        lo, hi = min(data["shift_costs"]), max(data["shift_costs"])
+        out["shift_costs"] = [rng.randint(lo, hi) for _ in shifts]
+    if "shift_durations" in data:
+        lo, hi = min(data["shift_durations"]), max(data["shift_durations"])
+        durations = [rng.randint(lo, hi) for _ in shifts]
+        planted_duration = sum(durations[i] for i, j in enumerate(order) if j < len(planted))
+        out["shift_durations"] = durations
+        out["H"] = max(data["H"] * scale, planted_duration)
+    return out
+
+
+# ---------------------------------------------------------------------------
+# problem4: warehouse location
+# ---------------------------------------------------------------------------
+
+
+def _warehouse_location(data: Instance, cr: str, scale: int, rng: random.Random) -> Instance:
+    supply = data["supply_cost"]
+    n_stores, n_wh = len(supply), len(data["capacities"])
+    top = max(max(row) for row in supply)
+
+    rows: list[list[int]] = []
+    allowed: list[list[int]] = []
+    for copy_idx in range(scale):
+        for i in range(n_stores):
+            row: list[int] = []
+            allowed_row: list[int] = []
+            for other in range(scale):
+                for j in range(n_wh):
+                    if other == copy_idx:
+                        row.append(supply[i][j])
+                        allowed_row.append(data["allowed"][i][j] if "allowed" in data else 1)
+                    else:
+                        row.append(rng.randint(top, 2 * top))
+                        allowed_row.append(1 if rng.random() < 0.1 else 0)
+            rows.append(row)
+            allowed.append(allowed_row)
+
+    order = _shuffled(rng, len(rows))
+    out = dict(data)
+    out["supply_cost"] = [rows[i] for i in order]
+    out["capacities"] = list(data["capacities"]) * scale
+    if "allowed" in data:
+        out["allowed"] = [allowed[i] for i in order]
+    if "revenue" in data:
+        revenue = [_jitter(rng, v) for v in data["revenue"] * scale]
+        out["revenue"] = [revenue[i] for i in order]
+    if "capacity_expanded" in data:
+        out["capacity_expanded"] = list(data["capacity_expanded"]) * scale
+        out["upgrade_cost"] = [_jitter(rng, v) for v in data["upgrade_cost"] * scale]
+    return out
+
+
+# ---------------------------------------------------------------------------
+# problem7: social golfers
+# ---------------------------------------------------------------------------
+
+
+def _social_golfers(data: Instance, cr: str, scale: int, rng: random.Random) -> Instance:
+    out = dict(data)
+    if cr == "CR2":
+        # Every pair must meet twice, so more groups would make the instance infeasible;
+        # grow the number of rounds instead.
+        out["n_rounds"] = data["n_rounds"] * scale
+    else:
+        out["n_groups"] = data["n_groups"] * scale
+    if "k_min_distinct" in data:
+        n_players = out["n_groups"] * out["n_per_group"]
+        reachable = out["n_rounds"] * (out["n_per_group"] - 1)
+        out["k_min_distinct"] = min(data["k_min_distinct"], reachable, n_players - 1)
+    return out
+
+
+# ---------------------------------------------------------------------------
+# problem8: RCPSP (planted serial schedule)
+# ---------------------------------------------------------------------------
+
+
+def _rcpsp(data: Instance, cr: str, scale: int, rng: random.Random) -> Instance:
+    capacities = data["capacities"]
+    real_jobs = data["jobs"][1:-1]
+    d_lo = min(job[0] for job in real_jobs)
+    d_hi = max(job[0] for job in real_jobs)
+    n_real = len(real_jobs) * scale
+    sink = n_real + 1
+
+    durations = [0] + [rng.randint(max(d_lo, 1), d_hi) for _ in range(n_real)] + [0]
+    demands = [[0] * len(capacities)]
+    demands += [[rng.randint(0, cap) for cap in capacities] for _ in range(n_real)]
+    demands.append([0] * len(capacities))
+
+    successors: list[list[int]] = [[] for _ in range(sink + 1)]
+    has_pred = [False] * (sink + 1)
+    for i in range(1, n_real + 1):
+        later = list(range(i + 1, min(i + 6, n_real + 1)))
+        chosen = sorted(rng.sample(later, min(len(later), rng.randint(1, 2)))) if later else []
+        successors[i] = chosen or [sink]
+        for j in successors[i]:
+            has_pred[j] = True
+    successors[0] = [i for i in range(1, n_real + 1) if not has_pred[i]]
+
+    # Serial schedule in index order, which is topological. Optional idle gaps host the CR3
+    # maintenance windows.
+    windows_template = data.get("unavailable_windows", [])
+    gap_len = max((w[2] - w[1] for w in windows_template), default=0)
+    gap_after = set(rng.sample(range(1, n_real + 1), min(len(windows_template) * scale, n_real)))
+    starts = [0] * (sink + 1)
+    windows: list[list[int]] = []
+    t = 0
+    for i in range(1, n_real + 1):
+        starts[i] = t
+        t += durations[i]
+        if i in gap_after:
+            windows.append([rng.randrange(len(capacities)), t, t + gap_len])
+            t += gap_len
+    starts[sink] = t
+    horizon = max(t + t // 10 + 1, data["horizon"])
+
+    out = dict(data)
+    out.pop("ref_opt_val", None)
+    out["horizon"] = horizon
+    out["jobs"] = [[durations[i], successors[i], demands[i]] for i in range(sink + 1)]
+
+    if "deadlines" in data:
+        earliest = [0] * (sink + 1)
+        for i in range(sink + 1):
+            for j in successors[i]:
+                earliest[j] = max(earliest[j], earliest[i] + durations[i])
+        out["deadlines"] = [0] + [
+            earliest[i] + durations[i] + rng.randint(0, max(d_hi, 1) * 2) for i in range(1, sink + 1)
+        ]
+    if "max_delays" in data:
+        out["max_delays"] = [
+            [i, j, max(starts[j] - starts[i] - durations[i], 0) + rng.randint(0, d_hi)]
+            for i in range(sink + 1)
+            for j in successors[i]
+        ]
+    if "unavailable_windows" in data:
+        out["unavailable_windows"] = windows
+    return out
+
+
+# ---------------------------------------------------------------------------
+# problem9: vessel loading (copies stacked along the deck length)
+# ---------------------------------------------------------------------------
+
+
+def _vessel_deck(data: Instance, cr: str, scale: int, rng: random.Random) -> Instance:
+    n = data["n_containers"]
+    margin = max((v for row in data["separation"] for v in row), default=0)
+    stride = data["deck_length"] + margin
+
+    out = dict(data)
+    out["deck_length"] = data["deck_length"] * scale + margin * (scale - 1)
+    out["n_containers"] = n * scale
+    order = _shuffled(rng, n * scale)
+    for key in ("width", "length", "classes"):
+        values = list(data[key]) * scale
+        out[key] = [values[i] for i in order]
+    if "priority" in data:
+        values = [_jitter(rng, v) for v in data["priority"] * scale]
+        out["priority"] = [values[i] for i in order]
+    if "restricted_regions" in data:
+        out["restricted_regions"] = [
+            [rx, ry + copy_idx * stride, rw, rl]
+            for copy_idx in range(scale)
+            for rx, ry, rw, rl in data["restricted_regions"]
+        ]
+    return out
+
+
+# ---------------------------------------------------------------------------
+# problem10: nurse-patient assignment (copies with disjoint zones)
+# ---------------------------------------------------------------------------
+
+
+def _nurse_assignment(data: Instance, cr: str, scale: int, rng: random.Random) -> Instance:
+    zones = data["patient_zone"]
+    n_zones = max(zones) + 1
+    n_patients = len(zones)
+    order = _shuffled(rng, n_patients * scale)
+
+    out = dict(data)
+    out["n_nurses"] = data["n_nurses"] * scale
+    patient_zone = [z + copy_idx * n_zones for copy_idx in range(scale) for z in zones]
+    out["patient_zone"] = [patient_zone[i] for i in order]
+    if "patient_type" in data:
+        patient_type = list(data["patient_type"]) * scale
+        out["patient_type"] = [patient_type[i] for i in order]
+        out["workload_by_type_nurse"] = [list(row) * scale for row in data["workload_by_type_nurse"]]
+    if "patient_acuity" in data:
+        acuity = list(data["patient_acuity"]) * scale
+        out["patient_acuity"] = [acuity[i] for i in order]
+    if "zone_distance" in data:
+        base = data["zone_distance"]
+        far = max(max(row) for row in base)
+        size = n_zones * scale
+        dist = [[0] * size for _ in range(size)]
+        for a in range(scale):
+            for b in range(a, scale):
+                offset = 0 if a == b else far + rng.randint(1, max(far, 1))
+                for z1 in range(n_zones):
+                    for z2 in range(n_zones):
+                        if a == b:
+                            d = base[z1][z2]
+                        else:
+                            d = base[z1][z2] + offset
+                        dist[a * n_zones + z1][b * n_zones + z2] = d
+                        dist[b * n_zones + z2][a * n_zones + z1] = d
+        out["zone_distance"] = dist
+    return out
+
+
+# ---------------------------------------------------------------------------
+# problem11: rotating rostering
+# ---------------------------------------------------------------------------
+
+
+def _rostering(data: Instance, cr: str, scale: int, rng: random.Random) -> Instance:
+    out = dict(data)
+    out["n_weeks"] = data["n_weeks"] * scale
+    out["requirements"] = [[v * scale for v in row] for row in data["requirements"]]
+    return out
+
+
+# ---------------------------------------------------------------------------
+# problem12: steel mill slab design
+# ---------------------------------------------------------------------------
+
+
+def _steel_mill(data: Instance, cr: str, scale: int, rng: random.Random) -> Instance:
+    n_colors = max(o["color"] for o in data["orders"])
+    orders = [
+        {"size": o["size"], "color": o["color"] + copy_idx * n_colors}
+        for copy_idx in range(scale)
+        for o in data["orders"]
+    ]
+    out = dict(data)
+    out["orders"] = [orders[i] for i in _shuffled(rng, len(orders))]
+    if "forbidden_pairs" in data:
+        out["forbidden_pairs"] = [
+            [a + copy_idx * n_colors, b + copy_idx * n_colors]
+            for copy_idx in range(scale)
+            for a, b in data["forbidden_pairs"]
+        ]
+    return out
+
+
+# ---------------------------------------------------------------------------
+# problem13: bookshelf design
+# ---------------------------------------------------------------------------
+
+
+def _bookshelf(data: Instance, cr: str, scale: int, rng: random.Random) -> Instance:
+    lengths = [length * scale for length in data["lengths"]]
+    rng.shuffle(lengths)
+    out = dict(data)
+    out["lengths"] = lengths
+    if "book_groups" in data:
+        groups = [dict(g) for g in data["book_groups"] * scale]
+        rng.shuffle(groups)
+        out["book_groups"] = groups
+    return out
+
+
+# ---------------------------------------------------------------------------
+# problem14: tank allocation (copies of the tank layout)
+# ---------------------------------------------------------------------------
+
+
+def _tank_allocation(data: Instance, cr: str, scale: int, rng: random.Random) -> Instance:
+    n_tanks, n_cargos = data["num_tanks"], data["num_cargos"]
+    relabel: list[dict[int, int]] = []
+    for copy_idx in range(scale):
+        perm = _shuffled(rng, n_cargos)
+        relabel.append({c + 1: perm[c] + 1 + copy_idx * n_cargos for c in range(n_cargos)})
+
+    def tank(copy_idx: int, t: int) -> int:
+        return t + copy_idx * n_tanks
+
+    out = dict(data)
+    out["num_tanks"] = n_tanks * scale
+    out["num_cargos"] = n_cargos * scale
+    out["capacities"] = list(data["capacities"]) * scale
+    out["neighbours"] = [[tank(k, nb) for nb in row] for k in range(scale) for row in data["neighbours"]]
+    out["impossible_cargos"] = [
+        sorted(relabel[k][c] for c in row) for k in range(scale) for row in data["impossible_cargos"]
+    ]
+    out["incompatibilities"] = [
+        sorted([relabel[k][a], relabel[k][b]]) for k in range(scale) for a, b in data["incompatibilities"]
+    ]
+
+    volume = [0] * (n_cargos * scale)
+    discharge = [0] * (n_cargos * scale)
+    for k in range(scale):
+        for c in range(1, n_cargos + 1):
+            volume[relabel[k][c] - 1] = data["volume_to_ship"][c - 1]
+            if "discharge_order" in data:
+                discharge[relabel[k][c] - 1] = data["discharge_order"][c - 1] + k * n_cargos
+    out["volume_to_ship"] = volume
+    if "discharge_order" in data:
+        out["discharge_order"] = discharge
+        out["accessibility_pairs"] = [
+            [tank(k, a), tank(k, b)] for k in range(scale) for a, b in data["accessibility_pairs"]
+        ]
+    if "balance_rules" in data:
+        out["balance_rules"] = [
+            {
+                "section_a": [tank(k, t) for t in rule["section_a"]],
+                "section_b": [tank(k, t) for t in rule["section_b"]],
+                "tolerance": rule["tolerance"],
+            }
+            for k in range(scale)
+            for rule in data["balance_rules"]
+        ]
+    if "splittable_tanks" in data:
+        out["splittable_tanks"] = [tank(k, t) for k in range(scale) for t in data["splittable_tanks"]]
+    return out
+
+
+# ---------------------------------------------------------------------------
+# problem15: winner determination (copies plus cross-copy bids)
+# ---------------------------------------------------------------------------
+
+
+def _winner_determination(data: Instance, cr: str, scale: int, rng: random.Random) -> Instance:
+    n_items = data["n_items"]
+    total_items = n_items * scale
+
+    def shift(items: list[int], k: int) -> list[int]:
+        return [item + k * n_items for item in items]
+
+    bids: list[dict[str, Any]] = []
+    for k in range(scale):
+        for b, items in enumerate(data["bid_items"]):
+            bid: dict[str, Any] = {"value": _jitter(rng, data["bid_values"][b]), "items": shift(items, k)}
+            if "bid_quantities" in data:
+                bid["quantities"] = list(data["bid_quantities"][b])
+            if "bid_variants" in data:
+                bid["variants"] = [shift(v, k) for v in data["bid_variants"][b]]
+            bids.append(bid)
+
+    per_item = sum(data["bid_values"]) / max(sum(len(i) for i in data["bid_items"]), 1)
+    max_len = max(len(i) for i in data["bid_items"])
+    for _ in range(len(data["bid_items"]) * (scale - 1) // 2):
+        items = sorted(rng.sample(range(1, total_items + 1), min(rng.randint(2, max(max_len, 2)), total_items)))
+        bid = {"value": _jitter(rng, int(per_item * len(items)), 0.2), "items": items}
+        if "bid_quantities" in data:
+            bid["quantities"] = [1] * len(items)
+        if "bid_variants" in data:
+            bid["variants"] = [items]
+        bids.append(bid)
+
+    rng.shuffle(bids)
+    out = dict(data)
+    out["n_items"] = total_items
+    out["bid_values"] = [bid["value"] for bid in bids]
+    out["bid_items"] = [bid["items"] for bid in bids]
+    if "bid_quantities" in data:
+        out["bid_quantities"] = [bid["quantities"] for bid in bids]
+        out["item_capacities"] = list(data["item_capacities"]) * scale
+    if "bid_variants" in data:
+        out["bid_variants"] = [bid["variants"] for bid in bids]
+    if "reserve_values" in data:
+        out["reserve_values"] = [_jitter(rng, v) for v in data["reserve_values"] * scale]
+    return out
+
+
+# ---------------------------------------------------------------------------
+# Registry
+# ---------------------------------------------------------------------------
+
+
+GENERATORS: dict[str, tuple[str, Generator, Callable[[Instance], int]]] = {
+    "problem1": ("car sequencing", _car_sequencing, lambda d: sum(d["demand"])),
+    "problem2": ("template design", _template_design, lambda d: d["n_var"]),
+    "problem3": ("bus driver scheduling", _bus_driver, lambda d: d["n_tasks"]),
+    "problem4": ("warehouse location", _warehouse_location, lambda d: len(d["supply_cost"])),
+    "problem7": (
+        "social golfers",
+        _social_golfers,
+        lambda d: d["n_groups"] * d["n_per_group"] * d["n_rounds"],
+    ),
+    "problem8": ("RCPSP", _rcpsp, lambda d: len(d["jobs"])),
+    "problem9": ("vessel deck loading", _vessel_deck, lambda d: d["n_containers"]),
+    "problem10": ("nurse assignment", _nurse_assignment, lambda d: len(d["patient_zone"])),
+    "problem11": ("rotating rostering", _rostering, lambda d: d["n_days_per_week"] * d["n_weeks"]),
+    "problem12": ("steel mill slab design", _steel_mill, lambda d: len(d["orders"])),
+    "problem13": ("bookshelf design", _bookshelf, lambda d: sum(d["lengths"])),
+    "problem14": ("tank allocation", _tank_allocation, lambda d: d["num_tanks"]),
+    "problem15": ("winner determination", _winner_determination, lambda d: len(d["bid_values"])),
+}
+
+
+def parse_instance_scales(text: str | None) -> list[int]:
+    """Parse a ``--instance-scale`` value such as ``"1,2,4,8"`` into sorted unique scales."""
+    if not text:
+        return []
+    scales: set[int] = set()
+    for part in text.split(","):
+        part = part.strip()
+        if not part:
+            continue
+        value = int(part)
+        if value < 1:
+            raise ValueError(f"Instance scales must be >= 1, got {value}")
+        scales.add(value)
+    return sorted(scales)
+
+
+def supports_problem(problem: str) -> bool:
+    return problem in GENERATORS
+
+
+def instance_size(problem: str, data: Instance) -> int | None:
+    """Family-specific size measure (cars, tasks, jobs, ...) used to report solve time against size."""
+    entry = GENERATORS.get(problem)
+    if entry is None:
+        return None
+    return int(entry[2](data))
+
+
+def generate_instance(problem: str, cr: str, template: Instance, scale: int, seed: int = 0) -> Instance:
+    """Return a copy of ``template`` grown by ``scale`` for the given problem family and CR."""
+    if scale < 1:
+        raise ValueError(f"Instance scale must be >= 1, got {scale}")
+    if problem not in GENERATORS:
+        raise ValueError(f"No instance generator for {problem}")
+    if scale == 1:
+        return copy.deepcopy(template)
+    rng = random.Random(f"{problem}/{cr}/{scale}/{seed}")
+    out = GENERATORS[problem][1](copy.deepcopy(template), cr, scale, rng)
+    out.pop("ref_opt_val", None)
+    return out
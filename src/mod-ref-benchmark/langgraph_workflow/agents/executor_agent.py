@@ -5,30 +5,39 @@ import subprocess
 import sys
 from pathlib import Path
 
+THIS_DIR = Path(__file__).resolve().parent
+MODREF_DIR = THIS_DIR.parent.parent
+if str(MODREF_DIR) not in sys.path:
+    sys.path.insert(0, str(MODREF_DIR))
+
+from solver_guard import mark_incumbent, run_guarded_script
+
 
 def run_model(model_path: Path, timeout: int | None = None) -> dict:
     """
     Execute a Python model file from its containing directory and parse JSON stdout.
-    Raises RuntimeError on non-zero exit, ValueError on JSON parse issues.
+    Solver calls are capped slightly below ``timeout``; output recovered from a time-limited
+    solve is tagged with ``"status": "timeout_incumbent"``.
+    Raises RuntimeError on non-zero exit, ValueError on JSON parse issues and
+    subprocess.TimeoutExpired when the model produced nothing before the hard timeout.
     """
-    model_dir = model_path.parent
-    model_file = model_path.name
-
-    result = subprocess.run(
-        [sys.executable, model_file],
-        cwd=model_dir,
-        capture_output=True,
-        text=True,
-        timeout=timeout,
-    )
+    run = run_guarded_script(script_path=model_path, cwd=model_path.parent, timeout=timeout)
+
+    if run.timed_out:
+        try:
+            return mark_incumbent(json.loads(run.stdout), run)
+        except json.JSONDecodeError:
+            raise subprocess.TimeoutExpired(
+                [sys.executable, model_path.name], timeout, output=run.stdout, stderr=run.stderr
+            ) from None
 
-    if result.returncode != 0:
-        raise RuntimeError(f"Execution failed (code {result.returncode}):\n{result.stderr}")
+    if run.returncode != 0:
+        raise RuntimeError(f"Execution failed (code {run.returncode}):\n{run.stderr}")
 
     try:
-        return json.loads(result.stdout)
+        return mark_incumbent(json.loads(run.stdout), run)
     except json.JSONDecodeError as exc:
-        raise ValueError(f"Model output is not valid JSON: {exc}\nStdout:\n{result.stdout}") from exc
+        raise ValueError(f"Model output is not valid JSON: {exc}\nStdout:\n{run.stdout}") from exc
 
 
 def run_executor_agent(
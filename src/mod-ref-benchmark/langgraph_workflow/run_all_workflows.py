@@ -3,8 +3,11 @@ from __future__ import annotations
 import argparse
 import datetime
 import json
+import os
 import sys
+import time
 import traceback
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import Any
 
@@ -13,10 +16,58 @@ MODREF_DIR = THIS_DIR.parent  # src/mod-ref-benchmark
 if str(MODREF_DIR) not in sys.path:
     sys.path.insert(0, str(MODREF_DIR))
 
+from case_workspace import DEFAULT_WORKSPACE_MODE, WORKSPACE_MODES, build_case_workspace  # noqa: E402
+from instance_eval import evaluate_instances, resolve_instances_dir, summarize_instance_eval  # noqa: E402
+from instance_generators import parse_instance_scales  # noqa: E402
 from llm_client import DEFAULT_OPENAI_MODEL, DEFAULT_OPENAI_REASONING_EFFORT  # noqa: E402
+from run_journal import case_key, open_journal  # noqa: E402
+from scale_ladder import run_scale_ladder  # noqa: E402
 from workflow import build_llm_config, run_workflow_once  # noqa: E402
 
 
+COMPLEXITY_LABEL_RANK = {"low": 1, "medium": 2, "high": 3}
+
+
+def _iter_cases(problems_root: Path, only_problem: str | None, only_cr: str | None):
+    for problem_dir in sorted(problems_root.iterdir()):
+        if not problem_dir.is_dir() or not problem_dir.name.startswith("problem"):
+            continue
+        if only_problem and problem_dir.name != only_problem:
+            continue
+
+        for cr_dir in sorted(problem_dir.iterdir()):
+            if not cr_dir.is_dir() or not cr_dir.name.startswith("CR"):
+                continue
+            if only_cr and cr_dir.name != only_cr:
+                continue
+            yield problem_dir, cr_dir
+
+
+def case_complexity(cr_dir: Path) -> tuple[int, int]:
+    """Scheduling weight from the ``complexity`` block of the CR's desc.json.
+
+    Orders by difficulty label first, then by the size of the base model plus the parts the CR
+    touches. CRs without metadata sort last.
+    """
+    try:
+        complexity = json.loads((cr_dir / "desc.json").read_text()).get("complexity") or {}
+    except (OSError, json.JSONDecodeError):
+        return (0, 0)
+    base = complexity.get("base_model") or {}
+    impact = complexity.get("cr_impact") or {}
+    size = sum(
+        int(value or 0)
+        for value in (
+            base.get("decision_variable_count"),
+            base.get("constraint_count"),
+            impact.get("affected_decision_variables"),
+            impact.get("affected_constraints"),
+        )
+        if isinstance(value, (int, float))
+    )
+    return (COMPLEXITY_LABEL_RANK.get(str(complexity.get("difficulty_label", "")).lower(), 0), size)
+
+
 def main():
     parser = argparse.ArgumentParser(description="Run LangGraph workflow across all problems/CRs.")
     parser.add_argument(
@@ -83,8 +134,51 @@ def main():
         "--only-cr",
         help="Optional: run only a specific CR folder name (e.g., CR1).",
     )
+    parser.add_argument(
+        "--instance-scale",
+        help="Optional comma-separated scale ladder (e.g., 1,2,4,8). Passing models are re-run with the reference model on generated instances of each scale.",
+    )
+    parser.add_argument(
+        "--instance-seed",
+        type=int,
+        default=0,
+        help="Seed for the scaled instance generators (default: 0).",
+    )
+    parser.add_argument(
+        "--eval-instances",
+        action="store_true",
+        help="Also run each final generated model on every instance in the CR's instances/ folder (or --instances-root); CRs without one get a generated set.",
+    )
+    parser.add_argument(
+        "--instances-root",
+        help="Optional root laid out as <problem>/<CR>/*.json to use instead of the CR instances/ folders. Implies --eval-instances.",
+    )
+    parser.add_argument(
+        "--eval-jobs",
+        type=int,
+        help="Instances evaluated concurrently per case (default: CPU count divided by --jobs).",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Number of cases to run concurrently (default: 1). With more than one job every case runs in a private copy of its problem folder under the case output directory.",
+    )
+    parser.add_argument(
+        "--workspace-mode",
+        choices=WORKSPACE_MODES,
+        default=DEFAULT_WORKSPACE_MODE,
+        help="How case workspaces get the read-only problem inputs: hardlinks, symlinks or full copies (default: hardlink). input_data.json is always copied.",
+    )
+    parser.add_argument(
+        "--resume",
+        help="Path to a workflow_journal_<timestamp>.jsonl from an earlier run. Cases finished in it are skipped (runner errors are retried) and the summary covers the whole journal.",
+    )
 
     args = parser.parse_args()
+    instance_scales = parse_instance_scales(args.instance_scale)
+    instances_root = Path(args.instances_root).resolve() if args.instances_root else None
+    eval_instances = bool(args.eval_instances or instances_root)
 
     problems_root = Path(args.problems_root)
     output_root = Path(args.output_root)
@@ -97,65 +191,124 @@ def main():
         max_output_tokens=args.max_output_tokens,
     )
 
-    all_results: list[dict[str, Any]] = []
+    batch_timestamp = datetime.datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
+    journal = open_journal(args.resume, output_root / f"workflow_journal_{batch_timestamp}.jsonl")
+    planned = list(_iter_cases(problems_root, args.only_problem, args.only_cr))
+    keys = [case_key(problem_dir.name, cr_dir.name) for problem_dir, cr_dir in planned]
+    cases = [case for case, key in zip(planned, keys) if not journal.is_done(key)]
+    if len(cases) < len(planned):
+        print(f"[workflow-batch] Skipping {len(planned) - len(cases)} cases already in the journal.", flush=True)
+    jobs = max(1, int(args.jobs or 1))
+    isolate = jobs > 1
+    # Split the CPUs between the cases running at once so instance solve times are not skewed.
+    eval_jobs = args.eval_jobs or max(1, (os.cpu_count() or 1) // jobs)
 
-    for problem_dir in sorted(problems_root.iterdir()):
-        if not problem_dir.is_dir() or not problem_dir.name.startswith("problem"):
-            continue
-        if args.only_problem and problem_dir.name != args.only_problem:
-            continue
-
-        for cr_dir in sorted(problem_dir.iterdir()):
-            if not cr_dir.is_dir() or not cr_dir.name.startswith("CR"):
-                continue
-            if args.only_cr and cr_dir.name != args.only_cr:
-                continue
-
-            case_timestamp = datetime.datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
-            case_output_dir = output_root / problem_dir.name / cr_dir.name / case_timestamp
+    def run_case(problem_dir: Path, cr_dir: Path) -> dict[str, Any]:
+        case_timestamp = datetime.datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
+        case_output_dir = output_root / problem_dir.name / cr_dir.name / case_timestamp
+        print(f"[workflow-batch] Running {problem_dir.name}/{cr_dir.name} ...", flush=True)
+        started = time.perf_counter()
+        try:
+            # Inside the try so a workspace failure becomes this case's runner error (retried on
+            # --resume) instead of aborting the whole batch.
             case_output_dir.mkdir(parents=True, exist_ok=True)
-
-            print(f"[workflow-batch] Running {problem_dir.name}/{cr_dir.name} ...")
-            try:
-                result, run_log, log_path = run_workflow_once(
-                    problem_path=str(problem_dir),
-                    cr=cr_dir.name,
-                    llm_config=llm_config,
-                    max_planner_validation_error_loops=args.max_planner_validation_error_loops,
-                    max_exec_error_loops=args.max_exec_error_loops,
-                    max_validation_error_loops=args.max_validation_error_loops,
-                    executor_timeout=args.executor_timeout,
-                    run_output_dir=case_output_dir,
+            workflow_problem_dir = (
+                build_case_workspace(problem_dir, cr_dir, case_output_dir / "workspace", args.workspace_mode)[0]
+                if isolate
+                else problem_dir
+            )
+            result, run_log, log_path = run_workflow_once(
+                problem_path=str(workflow_problem_dir),
+                cr=cr_dir.name,
+                llm_config=llm_config,
+                max_planner_validation_error_loops=args.max_planner_validation_error_loops,
+                max_exec_error_loops=args.max_exec_error_loops,
+                max_validation_error_loops=args.max_validation_error_loops,
+                executor_timeout=args.executor_timeout,
+                run_output_dir=case_output_dir,
+            )
+            status = result.get("unit_test_result", {}).get("status", "fail")
+            generated_model_path = run_log.get("generated_model_path")
+            scale_ladder_path = None
+            if status == "pass" and instance_scales and generated_model_path:
+                ladder = run_scale_ladder(
+                    problem_dir=problem_dir,
+                    cr_dir=cr_dir,
+                    model_path=Path(generated_model_path),
+                    scales=instance_scales,
+                    output_dir=case_output_dir / "scale_ladder",
+                    seed=args.instance_seed,
+                    timeout=args.executor_timeout or None,
                 )
-                all_results.append(
-                    {
-                        "problem": problem_dir.name,
-                        "cr": cr_dir.name,
-                        "status": result.get("unit_test_result", {}).get("status", "fail"),
-                        "planner_validator_status": result.get("planner_validator_status"),
-                        "validator_status": result.get("validator_status"),
-                        "termination_reason": result.get("termination_reason"),
-                        "loop_count": result.get("loop_count"),
-                        "exec_error": result.get("exec_error"),
-                        "unit_test_result_path": result.get("unit_test_result_path"),
-                        "workflow_log_path": str(log_path),
-                        "run_output_dir": str(case_output_dir),
-                        "generated_model_path": run_log.get("generated_model_path"),
-                    }
+                scale_ladder_path = ladder.get("report_path")
+            instance_eval = None
+            if eval_instances and generated_model_path and Path(generated_model_path).exists():
+                instance_eval = summarize_instance_eval(
+                    evaluate_instances(
+                        cr_dir=cr_dir,
+                        model_path=Path(generated_model_path),
+                        instances_dir=resolve_instances_dir(cr_dir, instances_root),
+                        output_dir=case_output_dir / "instance_eval",
+                        jobs=eval_jobs,
+                        timeout=args.executor_timeout or None,
+                    )
                 )
-            except Exception as e:
-                all_results.append(
-                    {
-                        "problem": problem_dir.name,
-                        "cr": cr_dir.name,
-                        "status": "fail",
-                        "stage": "runner",
-                        "error": str(e),
-                        "traceback": traceback.format_exc(),
-                        "run_output_dir": str(case_output_dir),
-                    }
+            return {
+                "problem": problem_dir.name,
+                "cr": cr_dir.name,
+                "status": status,
+                "planner_validator_status": result.get("planner_validator_status"),
+                "validator_status": result.get("validator_status"),
+                "termination_reason": result.get("termination_reason"),
+                "loop_count": result.get("loop_count"),
+                "exec_error": result.get("exec_error"),
+                "unit_test_result_path": result.get("unit_test_result_path"),
+                "workflow_log_path": str(log_path),
+                "run_output_dir": str(case_output_dir),
+                "workspace_problem_path": str(workflow_problem_dir) if isolate else None,
+                "generated_model_path": generated_model_path,
+                "scale_ladder_path": scale_ladder_path,
+                "instance_eval": instance_eval,
+                "duration_seconds": round(time.perf_counter() - started, 2),
+            }
+        except Exception as e:
+            return {
+                "problem": problem_dir.name,
+                "cr": cr_dir.name,
+                "status": "fail",
+                "stage": "runner",
+                "error": str(e),
+                "traceback": traceback.format_exc(),
+                "run_output_dir": str(case_output_dir),
+                "duration_seconds": round(time.perf_counter() - started, 2),
+            }
+
+    def run_and_record(problem_dir: Path, cr_dir: Path) -> dict[str, Any]:
+        case_result = run_case(problem_dir, cr_dir)
+        journal.append(case_key(problem_dir.name, cr_dir.name), case_result)
+        return case_result
+
+    if jobs == 1:
+        for problem_dir, cr_dir in cases:
+            run_and_record(problem_dir, cr_dir)
+    else:
+        # Longest-first: start the most complex CRs first so they do not end up as the tail.
+        order = sorted(range(len(cases)), key=lambda i: case_complexity(cases[i][1]), reverse=True)
+        print(f"[workflow-batch] Scheduling {len(cases)} cases on {jobs} workers (most complex first).", flush=True)
+        finished = 0
+        with ThreadPoolExecutor(max_workers=jobs) as pool:
+            futures = [pool.submit(run_and_record, *cases[i]) for i in order]
+            for future in as_completed(futures):
+                done = future.result()
+                finished += 1
+                print(
+                    f"[workflow-batch] Finished {done['problem']}/{done['cr']}: {done['status']} "
+                    f"({finished}/{len(cases)})",
+                    flush=True,
                 )
 
+    all_results = journal.results(keys)
+
     summary_timestamp = datetime.datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
     summary_path = output_root / f"workflow_summary_{summary_timestamp}.json"
     summary = {
@@ -165,6 +318,13 @@ def main():
         "max_exec_error_loops": args.max_exec_error_loops,
         "max_validation_error_loops": args.max_validation_error_loops,
         "executor_timeout": args.executor_timeout,
+        "jobs": jobs,
+        "journal_path": str(journal.path),
+        "workspace_mode": args.workspace_mode,
+        "instance_scales": instance_scales,
+        "instance_seed": args.instance_seed,
+        "eval_instances": eval_instances,
+        "instances_root": str(instances_root) if instances_root else None,
         "counts": {
             "total": len(all_results),
             "pass": sum(1 for r in all_results if r.get("status") == "pass"),
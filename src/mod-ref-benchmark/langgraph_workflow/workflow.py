@@ -2,12 +2,13 @@ from __future__ import annotations
 
 import argparse
 import datetime
-import importlib.util
 import json
 import sys
+import time
+import traceback
 import uuid
 from pathlib import Path
-from typing import Any, Callable, Dict, Optional, TypedDict
+from typing import Any, Callable, Dict, Iterator, Optional, TypedDict
 
 from langgraph.checkpoint.memory import InMemorySaver
 from langgraph.graph import END, START, StateGraph
@@ -32,17 +33,8 @@ from agents.parser_agent import run_parser_agent
 from agents.planner_agent import run_planner_agent
 from agents.planner_validator_agent import run_planner_validator_agent
 from agents.validator_agent import run_validator_agent
-
-
-def load_verify_func(unit_test_path: Path):
-    """Dynamically load the verification function from a CR's unit_test.py file."""
-    spec = importlib.util.spec_from_file_location("verify", unit_test_path)
-    module = importlib.util.module_from_spec(spec)
-    spec.loader.exec_module(module)
-    verify_funcs = [getattr(module, f) for f in dir(module) if f.endswith("_verify_func")]
-    if not verify_funcs:
-        raise ValueError(f"No *_verify_func found in {unit_test_path}")
-    return verify_funcs[0]
+from reference_oracle import lookup_reference, with_oracle_optimum
+from unit_test_loader import load_verify_func
 
 
 class WorkflowState(TypedDict, total=False):
@@ -479,6 +471,7 @@ def unit_test_node(state: WorkflowState) -> WorkflowState:
             write_log=False,
         )
         input_data = json.loads(input_path.read_text())
+        input_data = with_oracle_optimum(input_data, lookup_reference(cr_dir, input_data))
         verify_func = load_verify_func(unit_test_path)
         result = verify_func(input_data, model_output)
         status = "pass" if _is_unit_test_pass(result) else "fail"
@@ -723,26 +716,22 @@ def build_llm_config(
     }
 
 
-def run_workflow_once(
+def _build_initial_state(
     *,
     problem_path: str,
     cr: str,
     llm_config: Dict[str, Any],
-    max_planner_validation_error_loops: int = 5,
-    max_exec_error_loops: int = 5,
-    max_validation_error_loops: int = 5,
-    executor_timeout: int = 30,
-    run_output_dir: str | Path | None = None,
-    hitl_enabled: bool = False,
-    max_clarification_turns: int = 2,
-    thread_id: str | None = None,
-    checkpointer: Any | None = None,
-    human_input_func: Callable[[str], str] | None = None,
-    enable_planner_validator: bool = True,
-    enable_final_validator: bool = True,
-) -> tuple[WorkflowState, Dict[str, Any], Path]:
-    graph = build_graph(hitl_enabled=hitl_enabled, checkpointer=checkpointer)
-
+    max_planner_validation_error_loops: int,
+    max_exec_error_loops: int,
+    max_validation_error_loops: int,
+    executor_timeout: int,
+    run_output_dir: str | Path | None,
+    hitl_enabled: bool,
+    max_clarification_turns: int,
+    thread_id: str,
+    enable_planner_validator: bool,
+    enable_final_validator: bool,
+) -> WorkflowState:
     if run_output_dir is None:
         out_dir = _default_run_output_dir(problem_path, cr)
     else:
@@ -755,10 +744,7 @@ def run_workflow_once(
     else:
         timeout_value = None
 
-    resolved_thread_id = thread_id or (f"workflow-{uuid.uuid4()}" if hitl_enabled else "")
-    input_func = human_input_func or input
-
-    state: WorkflowState = {
+    return {
         "problem": Path(problem_path).name,
         "problem_path": problem_path,
         "cr": cr,
@@ -777,18 +763,17 @@ def run_workflow_once(
         "run_output_dir": str(out_dir),
         "executor_timeout": timeout_value,
         "hitl_enabled": hitl_enabled,
-        "thread_id": resolved_thread_id,
+        "thread_id": thread_id,
         "enable_planner_validator": enable_planner_validator,
         "enable_final_validator": enable_final_validator,
     }
 
-    result = _invoke_with_optional_hitl(
-        graph,
-        state,
-        hitl_enabled=hitl_enabled,
-        thread_id=resolved_thread_id or None,
-        human_input_func=input_func,
-    )
+
+def _finish_workflow_run(result: WorkflowState, *, thread_id: str | None) -> tuple[WorkflowState, Dict[str, Any], Path]:
+    """Fill skipped-stage placeholders and write the run log; run settings are read back from the state."""
+    enable_planner_validator = _planner_validator_enabled(result)
+    enable_final_validator = _final_validator_enabled(result)
+    out_dir = Path(result["run_output_dir"])
 
     if not enable_planner_validator and result.get("planner_validator_status") is None:
         result["planner_validator_status"] = "skipped"
@@ -810,16 +795,16 @@ def run_workflow_once(
     run_log = {
         "problem": result.get("problem"),
         "cr": result.get("cr"),
-        "llm_config": llm_config,
-        "hitl_enabled": hitl_enabled,
+        "llm_config": result.get("llm_config"),
+        "hitl_enabled": bool(result.get("hitl_enabled")),
         "enable_planner_validator": enable_planner_validator,
         "enable_final_validator": enable_final_validator,
-        "thread_id": resolved_thread_id or None,
-        "max_clarification_turns": max_clarification_turns,
-        "max_planner_validation_error_loops": max_planner_validation_error_loops,
-        "max_exec_error_loops": max_exec_error_loops,
-        "max_validation_error_loops": max_validation_error_loops,
-        "executor_timeout": timeout_value,
+        "thread_id": thread_id or None,
+        "max_clarification_turns": result.get("max_clarification_turns"),
+        "max_planner_validation_error_loops": result.get("max_planner_validation_error_loops"),
+        "max_exec_error_loops": result.get("max_exec_error_loops"),
+        "max_validation_error_loops": result.get("max_validation_error_loops"),
+        "executor_timeout": result.get("executor_timeout"),
         "loop_count": result.get("loop_count"),
         "clarification_turn_count": result.get("clarification_turn_count"),
         "planner_validation_error_count": result.get("planner_validation_error_count"),
@@ -849,6 +834,220 @@ def run_workflow_once(
     return result, run_log, log_path
 
 
+def run_workflow_once(
+    *,
+    problem_path: str,
+    cr: str,
+    llm_config: Dict[str, Any],
+    max_planner_validation_error_loops: int = 5,
+    max_exec_error_loops: int = 5,
+    max_validation_error_loops: int = 5,
+    executor_timeout: int = 30,
+    run_output_dir: str | Path | None = None,
+    hitl_enabled: bool = False,
+    max_clarification_turns: int = 2,
+    thread_id: str | None = None,
+    checkpointer: Any | None = None,
+    human_input_func: Callable[[str], str] | None = None,
+    enable_planner_validator: bool = True,
+    enable_final_validator: bool = True,
+) -> tuple[WorkflowState, Dict[str, Any], Path]:
+    graph = build_graph(hitl_enabled=hitl_enabled, checkpointer=checkpointer)
+
+    resolved_thread_id = thread_id or (f"workflow-{uuid.uuid4()}" if hitl_enabled else "")
+    input_func = human_input_func or input
+
+    state = _build_initial_state(
+        problem_path=problem_path,
+        cr=cr,
+        llm_config=llm_config,
+        max_planner_validation_error_loops=max_planner_validation_error_loops,
+        max_exec_error_loops=max_exec_error_loops,
+        max_validation_error_loops=max_validation_error_loops,
+        executor_timeout=executor_timeout,
+        run_output_dir=run_output_dir,
+        hitl_enabled=hitl_enabled,
+        max_clarification_turns=max_clarification_turns,
+        thread_id=resolved_thread_id,
+        enable_planner_validator=enable_planner_validator,
+        enable_final_validator=enable_final_validator,
+    )
+
+    result = _invoke_with_optional_hitl(
+        graph,
+        state,
+        hitl_enabled=hitl_enabled,
+        thread_id=resolved_thread_id or None,
+        human_input_func=input_func,
+    )
+    return _finish_workflow_run(result, thread_id=resolved_thread_id)
+
+
+# Variant settings read before each stage where ablation variants can diverge. Variants that agree on
+# every key read up to a fork stage can share one run of the graph up to that stage.
+PLANNING_VARIANT_KEYS = ("enable_planner_validator", "max_planner_validation_error_loops")
+SUFFIX_VARIANT_KEYS = ("enable_final_validator", "max_exec_error_loops", "max_validation_error_loops")
+
+
+def planning_signature(variant: Dict[str, Any]) -> tuple[Any, ...]:
+    """Settings that decide the planner/planner-validator path; the loop budget is moot without the validator."""
+    if not variant.get("enable_planner_validator", True):
+        return (False, None)
+    return (True, int(variant.get("max_planner_validation_error_loops", 5)))
+
+
+def plan_workflow_forks(variants: list[Dict[str, Any]]) -> list[Dict[str, Any]]:
+    """Group variants into the shared prefixes ``run_workflow_forked`` executes once.
+
+    Every variant shares the parser run. Variants with the same ``planning_signature`` also share the
+    planner and planner-validator loop and fork right before the modifier; the rest fork before the planner.
+    """
+    groups: dict[tuple[Any, ...], list[str]] = {}
+    for variant in variants:
+        groups.setdefault(planning_signature(variant), []).append(variant["key"])
+
+    plan = []
+    for variant in variants:
+        planning_group = groups[planning_signature(variant)]
+        if len(variants) == 1:
+            shared = None
+        elif len(planning_group) > 1:
+            stages = ["parser", "planner"] + (["planner_validator"] if variant.get("enable_planner_validator", True) else [])
+            shared = {"stages": stages, "fork_before": "modifier", "shared_with": planning_group}
+        else:
+            shared = {"stages": ["parser"], "fork_before": "planner", "shared_with": [v["key"] for v in variants]}
+        plan.append({"key": variant["key"], "shared_prefix": shared})
+    return plan
+
+
+def _fork_and_run(graph: Any, parent_config: dict[str, Any], updates: Dict[str, Any], *, interrupt_before: list[str] | None = None):
+    """Branch a new checkpoint off ``parent_config`` with ``updates`` applied and run it to completion or the interrupt."""
+    fork_config = graph.update_state(parent_config, updates)
+    values = graph.invoke(None, config=fork_config, interrupt_before=interrupt_before)
+    return values, graph.get_state({"configurable": {"thread_id": fork_config["configurable"]["thread_id"]}})
+
+
+def run_workflow_forked(
+    *,
+    cr: str,
+    llm_config: Dict[str, Any],
+    variants: list[Dict[str, Any]],
+    executor_timeout: int = 30,
+) -> Iterator[Dict[str, Any]]:
+    """Run several workflow variants on one case, sharing every stage they have in common.
+
+    Each variant is a dict with ``key``, ``problem_path`` (its own workspace), ``run_output_dir`` and
+    the ``PLANNING_VARIANT_KEYS``/``SUFFIX_VARIANT_KEYS`` settings. The parser runs once in the first
+    variant's workspace; each planning group resumes from that checkpoint and runs up to the modifier,
+    and each variant forks from its group's checkpoint with its own workspace and budgets. The parser,
+    planner and planner-validator write no files, so nothing from the shared prefix is left behind in
+    the first workspace. Outcomes are yielded per variant as they finish, with ``seconds`` split into
+    ``prefix_seconds`` (shared stages) and ``suffix_seconds``.
+    """
+    fork_plan = {entry["key"]: entry["shared_prefix"] for entry in plan_workflow_forks(variants)}
+    graph = build_graph(checkpointer=InMemorySaver())
+    thread_config = {"configurable": {"thread_id": f"fork-{uuid.uuid4()}"}}
+
+    first = variants[0]
+    state = _build_initial_state(
+        problem_path=first["problem_path"],
+        cr=cr,
+        llm_config=llm_config,
+        max_planner_validation_error_loops=first["max_planner_validation_error_loops"],
+        max_exec_error_loops=first["max_exec_error_loops"],
+        max_validation_error_loops=first["max_validation_error_loops"],
+        executor_timeout=executor_timeout,
+        run_output_dir=first["run_output_dir"],
+        hitl_enabled=False,
+        max_clarification_turns=2,
+        thread_id=thread_config["configurable"]["thread_id"],
+        enable_planner_validator=first["enable_planner_validator"],
+        enable_final_validator=first["enable_final_validator"],
+    )
+
+    def outcome(variant, *, result=None, error=None, trace=None, prefix_seconds=0.0, suffix_seconds=0.0):
+        entry: Dict[str, Any] = {
+            "key": variant["key"],
+            "shared_prefix": fork_plan[variant["key"]],
+            "prefix_seconds": round(prefix_seconds, 6),
+            "suffix_seconds": round(suffix_seconds, 6),
+            "seconds": round(prefix_seconds + suffix_seconds, 6),
+            "result": None,
+            "run_log": None,
+            "log_path": None,
+            "error": error,
+            "traceback": trace,
+        }
+        if result is not None:
+            entry["result"], entry["run_log"], entry["log_path"] = _finish_workflow_run(result, thread_id=None)
+        return entry
+
+    started = time.perf_counter()
+    try:
+        graph.invoke(state, config=thread_config, interrupt_before=["planner"])
+        parser_snapshot = graph.get_state(thread_config)
+    except Exception as exc:
+        trace = traceback.format_exc()
+        elapsed = time.perf_counter() - started
+        for variant in variants:
+            yield outcome(variant, error=exc, trace=trace, prefix_seconds=elapsed)
+        return
+    parser_seconds = time.perf_counter() - started
+
+    groups: dict[tuple[Any, ...], list[Dict[str, Any]]] = {}
+    for variant in variants:
+        groups.setdefault(planning_signature(variant), []).append(variant)
+
+    for group in groups.values():
+        started = time.perf_counter()
+        try:
+            _, planning_snapshot = _fork_and_run(
+                graph,
+                parser_snapshot.config,
+                {key: group[0][key] for key in PLANNING_VARIANT_KEYS},
+                interrupt_before=["modifier"],
+            )
+        except Exception as exc:
+            trace = traceback.format_exc()
+            elapsed = time.perf_counter() - started
+            for variant in group:
+                yield outcome(variant, error=exc, trace=trace, prefix_seconds=parser_seconds + elapsed)
+            continue
+        prefix_seconds = parser_seconds + time.perf_counter() - started
+
+        for variant in group:
+            Path(variant["run_output_dir"]).mkdir(parents=True, exist_ok=True)
+            started = time.perf_counter()
+            try:
+                if planning_snapshot.next:
+                    updates = {key: variant[key] for key in SUFFIX_VARIANT_KEYS}
+                    updates.update(
+                        {
+                            "problem": Path(variant["problem_path"]).name,
+                            "problem_path": variant["problem_path"],
+                            "run_output_dir": str(variant["run_output_dir"]),
+                        }
+                    )
+                    result, _ = _fork_and_run(graph, planning_snapshot.config, updates)
+                else:
+                    # The shared prefix already reached END, so every variant in the group ends the same way.
+                    result = {**planning_snapshot.values, "run_output_dir": str(variant["run_output_dir"])}
+                yield outcome(
+                    variant,
+                    result=result,
+                    prefix_seconds=prefix_seconds,
+                    suffix_seconds=time.perf_counter() - started,
+                )
+            except Exception as exc:
+                yield outcome(
+                    variant,
+                    error=exc,
+                    trace=traceback.format_exc(),
+                    prefix_seconds=prefix_seconds,
+                    suffix_seconds=time.perf_counter() - started,
+                )
+
+
 def main():
     parser = argparse.ArgumentParser(description="LangGraph workflow for ModRef agents.")
     parser.add_argument("--problem-path", required=True, help="Path to the problem folder (e.g., problems/problem1)")
@@ -0,0 +1,424 @@
+"""Micro-benchmarks for the non-LLM hot paths of the benchmark runners and the web backend.
+
+Inputs are built from the shipped problems (every base model, CR description, unit test and
+instance under ``problems/``), so two runs on the same tree time the same work. Each benchmark
+is calibrated to batches of at least ``--min-batch-seconds`` and repeated ``--repeat`` times;
+the per-call median is compared against a stored baseline::
+
+    python3 src/mod-ref-benchmark/microbench.py --save-baseline   # record microbench_baseline.json
+    python3 src/mod-ref-benchmark/microbench.py                   # compare, exit 1 on regression
+
+A benchmark regresses when its median exceeds the baseline median by more than its threshold
+(``--threshold`` for most, a looser one for process spawns). The verifiers are timed on the
+passing model outputs recorded in the shipped ``*_unit_test_*.json`` files, so the verifier set
+does not depend on a local oracle cache.
+"""
+
+from __future__ import annotations
+
+import argparse
+import datetime
+import json
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable
+
+MODREF_DIR = Path(__file__).resolve().parent
+SRC_DIR = MODREF_DIR.parent
+for path in (MODREF_DIR, SRC_DIR):
+    if str(path) not in sys.path:
+        sys.path.insert(0, str(path))
+
+import llm_prompts
+import llm_schemas
+from unit_test_loader import load_verify_func
+
+DEFAULT_BASELINE_PATH = MODREF_DIR / "microbench_baseline.json"
+DEFAULT_THRESHOLD = 0.25
+SPAWN_THRESHOLD = 0.5
+
+SAMPLE_PARSER_MAPPING = {
+    "decision_variables": [{"name": "x", "lines": [12, 14], "description": "Main decision matrix."}],
+    "constraints": [{"name": "capacity", "lines": [20, 26], "description": "Capacity per period."}],
+    "objective": {"lines": [30], "description": "Minimise total cost."},
+}
+SAMPLE_PLAN = {
+    "summary": "Add the new constraint after the capacity block and extend the output.",
+    "steps": [
+        {"action": "add_constraint", "location": "after line 26", "details": "Forbid the new pattern."},
+        {"action": "update_output", "location": "print block", "details": "Add the new key."},
+    ],
+}
+
+
+@dataclass(frozen=True)
+class Case:
+    problem: str
+    cr: str
+    base_description: str
+    base_code: str
+    cr_desc: dict[str, Any]
+    cr_code: str
+    input_data: dict[str, Any]
+    cr_dir: Path
+
+
+@dataclass
+class Benchmark:
+    name: str
+    func: Callable[[], Any]
+    threshold: float = DEFAULT_THRESHOLD
+    fixed_number: int | None = None
+
+
+def load_cases(problems_root: Path) -> list[Case]:
+    cases = []
+    for problem_dir in sorted(problems_root.iterdir()):
+        if not problem_dir.is_dir() or not problem_dir.name.startswith("problem"):
+            continue
+        base_dir = problem_dir / "base"
+        for cr_dir in sorted(problem_dir.iterdir()):
+            if not cr_dir.is_dir() or not cr_dir.name.startswith("CR"):
+                continue
+            cases.append(
+                Case(
+                    problem=problem_dir.name,
+                    cr=cr_dir.name,
+                    base_description=(base_dir / "problem_desc.txt").read_text(),
+                    base_code=(base_dir / "reference_model.py").read_text(),
+                    cr_desc=json.loads((cr_dir / "desc.json").read_text()),
+                    cr_code=(cr_dir / "reference_model.py").read_text(),
+                    input_data=json.loads((cr_dir / "input_data.json").read_text()),
+                    cr_dir=cr_dir,
+                )
+            )
+    return cases
+
+
+def shipped_solution(cr_dir: Path) -> dict[str, Any] | None:
+    """Model output from the newest passing unit-test record shipped in ``cr_dir``, if any."""
+    for record_path in sorted(cr_dir.glob("*_unit_test_*.json"), reverse=True):
+        record = json.loads(record_path.read_text())
+        result = record.get("result")
+        passed = (result[0] if isinstance(result, list) and result else result) == "pass"
+        if passed and isinstance(record.get("model_output"), dict):
+            return record["model_output"]
+    return None
+
+
+def _over_cases(cases: list[Case], fn: Callable[[Case], Any]) -> Callable[[], None]:
+    def run() -> None:
+        for case in cases:
+            fn(case)
+
+    return run
+
+
+def build_benchmarks(cases: list[Case], workdir: Path) -> list[Benchmark]:
+    numbered = {id(case): llm_prompts.number_code_lines(case.base_code) for case in cases}
+    parser_schema = llm_schemas.build_parser_schema()
+    planner_schema = llm_schemas.build_planner_schema()
+    planner_validator_schema = llm_schemas.build_planner_validator_schema()
+    validator_schema = llm_schemas.build_validator_schema()
+
+    benchmarks = [
+        Benchmark("number_code_lines", _over_cases(cases, lambda c: llm_prompts.number_code_lines(c.base_code))),
+        Benchmark(
+            "build_single_shot_prompt",
+            _over_cases(
+                cases,
+                lambda c: llm_prompts.build_single_shot_prompt(
+                    base_nl_description=c.base_description,
+                    base_reference_code=c.base_code,
+                    cr_desc=c.cr_desc,
+                    expected_output_keys=llm_prompts.extract_output_keys(c.cr_desc.get("ref_sol_format", {})),
+                ),
+            ),
+        ),
+        Benchmark(
+            "build_parser_prompt",
+            _over_cases(
+                cases,
+                lambda c: llm_prompts.build_parser_prompt(c.base_description, numbered[id(c)], parser_schema),
+            ),
+        ),
+        Benchmark(
+            "build_planner_prompt",
+            _over_cases(
+                cases,
+                lambda c: llm_prompts.build_planner_prompt(
+                    c.base_description, c.cr_desc, numbered[id(c)], SAMPLE_PARSER_MAPPING, planner_schema
+                ),
+            ),
+        ),
+        Benchmark(
+            "build_planner_validator_prompt",
+            _over_cases(
+                cases,
+                lambda c: llm_prompts.build_planner_validator_prompt(
+                    c.base_description,
+                    c.cr_desc,
+                    SAMPLE_PARSER_MAPPING,
+                    SAMPLE_PLAN,
+                    numbered[id(c)],
+                    planner_validator_schema,
+                ),
+            ),
+        ),
+        Benchmark(
+            "build_modifier_prompt",
+            _over_cases(
+                cases,
+                lambda c: llm_prompts.build_modifier_prompt(
+                    c.base_description, c.cr_desc, SAMPLE_PLAN, c.base_code, numbered[id(c)], None, None
+                ),
+            ),
+        ),
+        Benchmark(
+            "build_validator_prompt",
+            _over_cases(
+                cases,
+                lambda c: llm_prompts.build_validator_prompt(
+                    c.base_description,
+                    c.cr_desc,
+                    c.cr_code,
+                    c.cr_code,
+                    llm_prompts.number_code_lines(c.cr_code),
+                    llm_prompts.number_code_lines(c.cr_code),
+                    validator_schema,
+                ),
+            ),
+        ),
+        Benchmark(
+            "build_schemas",
+            lambda: [
+                builder()
+                for builder in (
+                    llm_schemas.build_parser_schema,
+                    llm_schemas.build_planner_schema,
+                    llm_schemas.build_planner_validator_schema,
+                    llm_schemas.build_clarification_assessor_schema,
+                    llm_schemas.build_validator_schema,
+                    llm_schemas.build_code_schema,
+                )
+            ],
+        ),
+        Benchmark(
+            "load_verify_func",
+            _over_cases(cases, lambda c: load_verify_func(c.cr_dir / "unit_test.py")),
+        ),
+    ]
+
+    verify_inputs = [
+        (load_verify_func(case.cr_dir / "unit_test.py"), case.input_data, solution)
+        for case in cases
+        if (solution := shipped_solution(case.cr_dir)) is not None
+    ]
+    if verify_inputs:
+        benchmarks.append(
+            Benchmark(
+                f"verify_funcs[{len(verify_inputs)}]",
+                lambda: [verify(data, solution) for verify, data, solution in verify_inputs],
+            )
+        )
+
+    from langgraph_workflow.agents.executor_agent import run_model
+
+    spawn_dir = workdir / "spawn"
+    spawn_dir.mkdir(parents=True, exist_ok=True)
+    (spawn_dir / "input_data.json").write_text(json.dumps(cases[0].input_data if cases else {}))
+    (spawn_dir / "model.py").write_text(
+        "import json\n"
+        "with open('input_data.json') as handle:\n"
+        "    data = json.load(handle)\n"
+        "print(json.dumps({'keys': sorted(data)}))\n"
+    )
+    benchmarks.append(
+        Benchmark("run_model_spawn", lambda: run_model(spawn_dir / "model.py", timeout=30), SPAWN_THRESHOLD, 3)
+    )
+
+    benchmarks.extend(_web_benchmarks(cases))
+    return benchmarks
+
+
+def _web_benchmarks(cases: list[Case]) -> list[Benchmark]:
+    try:
+        from cpmod_web.backend.services.diff_service import build_unified_diff
+        from cpmod_web.backend.services.execution import harness
+        from cpmod_web.backend.workflow.prompts import number_code_lines as web_number_code_lines
+    except ImportError as exc:
+        print(f"[microbench] Skipping web backend benchmarks: {exc}", flush=True)
+        return []
+
+    build_model_metadata = {"execution_mode": "build_model", "entrypoint_name": "build_model"}
+    return [
+        Benchmark("web.number_code_lines", _over_cases(cases, lambda c: web_number_code_lines(c.base_code))),
+        Benchmark(
+            "web.build_execution_files[script]",
+            _over_cases(
+                cases,
+                lambda c: harness.build_execution_files(
+                    code=c.cr_code, input_data=c.input_data, metadata={}, solver_time_limit_seconds=25.0
+                ),
+            ),
+        ),
+        Benchmark(
+            "web.build_execution_files[build_model]",
+            _over_cases(
+                cases,
+                lambda c: harness.build_execution_files(
+                    code=c.cr_code,
+                    input_data=c.input_data,
+                    metadata=build_model_metadata,
+                    solver_time_limit_seconds=25.0,
+                ),
+            ),
+        ),
+        Benchmark("web._build_model_runner", harness._build_model_runner),
+        Benchmark(
+            "web.build_unified_diff",
+            _over_cases(cases, lambda c: build_unified_diff(before=c.base_code, after=c.cr_code)),
+        ),
+    ]
+
+
+def time_benchmark(benchmark: Benchmark, *, repeat: int, min_batch_seconds: float) -> dict[str, Any]:
+    """Per-call seconds: calibrate a batch size, then time ``repeat`` batches."""
+    number = benchmark.fixed_number
+    if number is None:
+        number = 1
+        while True:
+            started = time.perf_counter()
+            for _ in range(number):
+                benchmark.func()
+            if time.perf_counter() - started >= min_batch_seconds or number >= 1_000_000:
+                break
+            number *= 2
+    else:
+        benchmark.func()
+
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for _ in range(number):
+            benchmark.func()
+        samples.append((time.perf_counter() - started) / number)
+    return {
+        "number": number,
+        "repeat": repeat,
+        "min_us": round(min(samples) * 1e6, 3),
+        "median_us": round(statistics.median(samples) * 1e6, 3),
+        "threshold": benchmark.threshold,
+    }
+
+
+def compare_to_baseline(results: dict[str, dict[str, Any]], baseline: dict[str, Any], threshold: float | None) -> list[dict[str, Any]]:
+    rows = []
+    stored = baseline.get("results") or {}
+    for name, current in results.items():
+        previous = stored.get(name)
+        row = {"name": name, "median_us": current["median_us"], "baseline_us": None, "ratio": None, "regressed": False}
+        if previous and previous.get("median_us"):
+            limit = threshold if threshold is not None and current["threshold"] == DEFAULT_THRESHOLD else current["threshold"]
+            ratio = current["median_us"] / previous["median_us"]
+            row.update(
+                {
+                    "baseline_us": previous["median_us"],
+                    "ratio": round(ratio, 3),
+                    "limit": round(1 + limit, 3),
+                    "regressed": ratio > 1 + limit,
+                }
+            )
+        rows.append(row)
+    return rows
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Micro-benchmark the non-LLM hot paths against a stored baseline.")
+    parser.add_argument(
+        "--problems-root",
+        default=str((MODREF_DIR / "problems").resolve()),
+        help="Root directory containing problem folders (default: src/mod-ref-benchmark/problems).",
+    )
+    parser.add_argument(
+        "--baseline",
+        default=str(DEFAULT_BASELINE_PATH),
+        help="Baseline file (default: src/mod-ref-benchmark/microbench_baseline.json).",
+    )
+    parser.add_argument("--save-baseline", action="store_true", help="Write the results as the new baseline.")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        help=f"Allowed slowdown as a fraction of the baseline median (default: {DEFAULT_THRESHOLD}; spawns use {SPAWN_THRESHOLD}).",
+    )
+    parser.add_argument("--only", action="append", help="Only benchmarks whose name contains this text. Repeatable.")
+    parser.add_argument("--repeat", type=int, default=7, help="Timed batches per benchmark (default: 7).")
+    parser.add_argument(
+        "--min-batch-seconds",
+        type=float,
+        default=0.2,
+        help="Minimum wall time of a calibrated batch (default: 0.2).",
+    )
+    parser.add_argument("--output", help="Optional path to write the results and comparison as JSON.")
+    args = parser.parse_args()
+
+    cases = load_cases(Path(args.problems_root).resolve())
+    with tempfile.TemporaryDirectory(prefix="microbench_") as tmp:
+        benchmarks = build_benchmarks(cases, Path(tmp))
+        if args.only:
+            benchmarks = [b for b in benchmarks if any(text in b.name for text in args.only)]
+
+        results: dict[str, dict[str, Any]] = {}
+        for benchmark in benchmarks:
+            results[benchmark.name] = time_benchmark(
+                benchmark, repeat=args.repeat, min_batch_seconds=args.min_batch_seconds
+            )
+            print(
+                f"[microbench] {benchmark.name}: median {results[benchmark.name]['median_us']:.1f} us "
+                f"(min {results[benchmark.name]['min_us']:.1f} us, {results[benchmark.name]['number']} calls/batch)",
+                flush=True,
+            )
+
+    report = {
+        "created_at": datetime.datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cases": len(cases),
+        "results": results,
+    }
+
+    baseline_path = Path(args.baseline)
+    regressions: list[dict[str, Any]] = []
+    if args.save_baseline:
+        if baseline_path.exists() and args.only:
+            previous = json.loads(baseline_path.read_text())
+            report["results"] = {**(previous.get("results") or {}), **results}
+        baseline_path.write_text(json.dumps(report, indent=2))
+        print(f"[microbench] Baseline saved to {baseline_path}", flush=True)
+    elif baseline_path.exists():
+        comparison = compare_to_baseline(results, json.loads(baseline_path.read_text()), args.threshold)
+        report["comparison"] = comparison
+        for row in comparison:
+            if row["ratio"] is None:
+                print(f"[microbench] {row['name']}: no baseline", flush=True)
+                continue
+            flag = "REGRESSION" if row["regressed"] else "ok"
+            print(f"[microbench] {row['name']}: x{row['ratio']} of baseline (limit x{row['limit']}) {flag}", flush=True)
+        regressions = [row for row in comparison if row["regressed"]]
+    else:
+        print(f"[microbench] No baseline at {baseline_path}; run with --save-baseline to record one.", flush=True)
+
+    if args.output:
+        Path(args.output).write_text(json.dumps(report, indent=2))
+    if regressions:
+        print(f"[microbench] {len(regressions)} regression(s): {', '.join(r['name'] for r in regressions)}", flush=True)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
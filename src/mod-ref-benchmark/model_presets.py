@@ -12,6 +12,7 @@ MODEL_PRESETS: list[dict[str, Any]] = [
         "provider": "openai",
         "model": "gpt-5.4",
         "reasoning_effort": DEFAULT_OPENAI_REASONING_EFFORT,
+        "max_concurrency": 4,
         "docs_url": "https://platform.openai.com/docs/models/compare",
         "pricing_source_url": "https://developers.openai.com/api/docs/models/gpt-5.4-pro",
         "pricing_per_million": {
@@ -26,6 +27,7 @@ MODEL_PRESETS: list[dict[str, Any]] = [
         "provider": "openai",
         "model": "gpt-5.4-mini",
         "reasoning_effort": "none",
+        "max_concurrency": 8,
         "docs_url": "https://platform.openai.com/docs/models/compare",
         "pricing_source_url": "https://developers.openai.com/api/docs/models/gpt-5.4-mini",
         "pricing_per_million": {
@@ -40,6 +42,7 @@ MODEL_PRESETS: list[dict[str, Any]] = [
         "provider": "openrouter",
         "model": "qwen/qwen3-next-80b-a3b-instruct",
         "reasoning_effort": None,
+        "max_concurrency": 4,
         "docs_url": "https://openrouter.ai/qwen/qwen3-next-80b-a3b-instruct/providers",
         "pricing_source_url": "https://openrouter.ai/qwen/qwen3-next-80b-a3b-instruct",
         "pricing_per_million": {
@@ -54,6 +57,7 @@ MODEL_PRESETS: list[dict[str, Any]] = [
         "provider": "openrouter",
         "model": "qwen/qwen3.5-27b",
         "reasoning_effort": "none",
+        "max_concurrency": 4,
         "docs_url": "https://openrouter.ai/compare/qwen/qwen3.5-27b/z-ai/glm-4.7-flash",
         "pricing_source_url": "https://openrouter.ai/qwen/qwen3.5-27b",
         "pricing_per_million": {
@@ -68,6 +72,7 @@ MODEL_PRESETS: list[dict[str, Any]] = [
         "provider": "openrouter",
         "model": "google/gemini-3.1-flash-lite-preview",
         "reasoning_effort": None,
+        "max_concurrency": 6,
         "docs_url": "https://openrouter.ai/google/gemini-3.1-flash-lite-preview",
         "pricing_source_url": "https://openrouter.ai/google/gemini-3.1-flash-lite-preview",
         "pricing_per_million": {
@@ -82,6 +87,7 @@ MODEL_PRESETS: list[dict[str, Any]] = [
         "provider": "openrouter",
         "model": "anthropic/claude-opus-4.6",
         "reasoning_effort": "high",
+        "max_concurrency": 2,
         "docs_url": "https://openrouter.ai/anthropic/claude-opus-4.6/api",
         "pricing_source_url": "https://openrouter.ai/anthropic/claude-opus-4.6",
         "pricing_per_million": {
@@ -96,6 +102,7 @@ MODEL_PRESETS: list[dict[str, Any]] = [
         "provider": "openrouter",
         "model": "qwen/qwen3.5-9b",
         "reasoning_effort": "none",
+        "max_concurrency": 4,
         "docs_url": "https://openrouter.ai/compare/black-forest-labs/flux.2-max/qwen/qwen3.5-9b",
         "pricing_source_url": "https://openrouter.ai/qwen/qwen3.5-9b",
         "pricing_per_million": {
@@ -106,6 +113,18 @@ MODEL_PRESETS: list[dict[str, Any]] = [
     },
 ]
 
+# Fallback per-provider cap on concurrent cases for presets without ``max_concurrency``.
+DEFAULT_PROVIDER_CONCURRENCY: dict[str, int] = {
+    "openai": 4,
+    "openrouter": 4,
+    "ollama": 1,
+}
+
+
+def preset_concurrency(preset: dict[str, Any]) -> int:
+    value = preset.get("max_concurrency") or DEFAULT_PROVIDER_CONCURRENCY.get(preset.get("provider", ""), 1)
+    return max(1, int(value))
+
 
 def select_model_presets(only_keys: list[str] | None = None) -> list[dict[str, Any]]:
     if not only_keys:
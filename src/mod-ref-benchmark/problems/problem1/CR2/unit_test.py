@@ -2,6 +2,8 @@ import traceback
 from collections import Counter
 import numpy as np
 
+from verify_kernels import as_int_array, first_true, window_sums
+
 def handle_assertions(func):
     def wrapper(*args, **kwargs):
         try:
@@ -51,18 +53,18 @@ def cr2_verify_func(data_dict, hypothesis_solution):
         assert actual == expected, f"Error: Expected {expected} of type {t}, got {actual}."
 
     # 3. Option capacity
+    seq_arr = as_int_array(seq)
     for o in range(n_options):
-        for s in range(n_cars - per_slots[o]):
-            window = seq[s:s + per_slots[o]]
-            count = sum(requires[t, o] for t in window)
-            assert count <= at_most[o], (
-                f"Error: Option {o} exceeds limit {at_most[o]} in window starting at {s}."
-            )
+        window_counts = window_sums(requires[seq_arr, o], per_slots[o], n_cars - per_slots[o])
+        s = first_true(window_counts > at_most[o])
+        assert s is None, (
+            f"Error: Option {o} exceeds limit {at_most[o]} in window starting at {s}."
+        )
 
     # 4. CR2 spacing constraint
     for t in range(n_types):
-        for s in range(n_cars - gap_limit):
-            window = seq[s:s + gap_limit]
-            assert t in window, f"Error: Type {t} missing in window {s}-{s+gap_limit}."
+        present = window_sums(seq_arr == t, gap_limit, n_cars - gap_limit)
+        s = first_true(present == 0)
+        assert s is None, f"Error: Type {t} missing in window {s}-{s+gap_limit}."
 
     return "pass"
\ No newline at end of file
@@ -2,6 +2,8 @@ import traceback
 from collections import Counter
 import numpy as np
 
+from verify_kernels import as_int_array, first_true, window_sums
+
 def handle_assertions(func):
     def wrapper(*args, **kwargs):
         try:
@@ -51,19 +53,18 @@ def cr3_verify_func(data_dict, hypothesis_solution):
         assert actual == expected, f"Error: Expected {expected} of type {t}, got {actual}."
 
     # 3. Option consistency
-    for s in range(n_cars):
-        for o in range(n_options):
-            val = requires[seq[s], o]
-            assert val in [0, 1], f"Error: Invalid option flag {val} for type {seq[s]}."
+    seq_arr = as_int_array(seq)
+    flags = requires[seq_arr]
+    bad = first_true((flags != 0) & (flags != 1))
+    if bad is not None:
+        s, o = bad
+        raise AssertionError(f"Error: Invalid option flag {flags[s, o]} for type {seq[s]}.")
 
     # 4. Count constraint violations
     computed_viol = 0
     for o in range(n_options):
-        for s in range(n_cars - per_slots[o]):
-            window = seq[s:s + per_slots[o]]
-            used = sum(requires[t, o] for t in window)
-            if used > at_most[o]:
-                computed_viol += 1
+        used = window_sums(flags[:, o], per_slots[o], n_cars - per_slots[o])
+        computed_viol += int(np.count_nonzero(used > at_most[o]))
 
     # 5. Verify internal consistency
     assert computed_viol == total_violations, (
@@ -1,5 +1,14 @@
 import traceback
 
+import numpy as np
+
+from verify_kernels import (
+    as_int_array,
+    cyclic_offsets,
+    cyclic_window_sums,
+    first_true,
+)
+
 
 def handle_assertions(func):
     def wrapper(*args, **kwargs):
@@ -65,13 +74,16 @@ def cr3_verify_func(data_dict, hypothesis_solution):
             assert 0 <= v <= 3, f"y_roster[{w}][{d}]={v} out of range [0, 3]"
 
     # 3) Constraint 1: link x and y
-    for w in range(n_weeks):
-        for d in range(n_days_per_week):
-            flat = w * n_days_per_week + d
-            assert x_roster[flat] == y_roster[w][d], (
-                f"Link violated at week {w}, day {d}: "
-                f"x_roster[{flat}]={x_roster[flat]} != y_roster[{w}][{d}]={y_roster[w][d]}"
-            )
+    x = as_int_array(x_roster)
+    y = as_int_array(y_roster).reshape(n_weeks, n_days_per_week)
+    flat = first_true(x != y.ravel())
+    if flat is not None:
+        w, d = divmod(flat, n_days_per_week)
+        raise AssertionError(
+            f"Link violated at week {w}, day {d}: "
+            f"x_roster[{flat}]={x_roster[flat]} != y_roster[{w}][{d}]={y_roster[w][d]}"
+        )
+    nxt_shift = np.roll(x, -1)
 
     # 4) Constraint 2: weekend days must match within each week
     for w in range(n_weeks):
@@ -81,65 +93,62 @@ def cr3_verify_func(data_dict, hypothesis_solution):
         )
 
     # 5) Constraint 3: minimum run length
-    for i in range(n_days):
+    ahead = x[cyclic_offsets(n_days, range(2, s_min + 1))]
+    bad = first_true((x != nxt_shift)[:, None] & (ahead != nxt_shift[:, None]))
+    if bad is not None:
+        i, t = bad
         nxt = (i + 1) % n_days
-        if x_roster[i] != x_roster[nxt]:
-            for t in range(1, s_min):
-                pos = (nxt + t) % n_days
-                assert x_roster[pos] == x_roster[nxt], (
-                    f"Min run violated: shift changes at day {i}->{nxt}, "
-                    f"but day {pos} has shift {x_roster[pos]} instead of {x_roster[nxt]}"
-                )
+        pos = (nxt + t + 1) % n_days
+        raise AssertionError(
+            f"Min run violated: shift changes at day {i}->{nxt}, "
+            f"but day {pos} has shift {x_roster[pos]} instead of {x_roster[nxt]}"
+        )
 
     # 6) Constraint 4: maximum run length
-    for i in range(n_days):
-        run_len = sum(
-            1 for t in range(1, s_max)
-            if x_roster[(i + t) % n_days] == x_roster[i]
+    run_len = (x[cyclic_offsets(n_days, range(1, s_max))] == x[:, None]).sum(axis=1)
+    i = first_true((run_len == s_max - 1) & (np.roll(x, -s_max) == x))
+    if i is not None:
+        beyond = (i + s_max) % n_days
+        raise AssertionError(
+            f"Max run violated at day {i}: shift {x_roster[i]} runs "
+            f"at least {s_max + 1} days (beyond day {beyond})"
         )
-        if run_len == s_max - 1:
-            beyond = (i + s_max) % n_days
-            assert x_roster[beyond] != x_roster[i], (
-                f"Max run violated at day {i}: shift {x_roster[i]} runs "
-                f"at least {s_max + 1} days (beyond day {beyond})"
-            )
 
     # 7) Constraint 5: at least 2 rest days in every 2-week window
     window_len = 2 * n_days_per_week
-    for i in range(n_days):
-        rest_count = sum(
-            1 for t in range(window_len)
-            if x_roster[(i + t) % n_days] == OFF
-        )
-        assert rest_count >= 2, (
-            f"Rest day constraint violated starting at day {i}: "
-            f"only {rest_count} rest days in {window_len}-day window (need >= 2)"
-        )
+    rest_counts = cyclic_window_sums(x == OFF, window_len)
+    i = first_true(rest_counts < 2)
+    assert i is None, (
+        f"Rest day constraint violated starting at day {i}: "
+        f"only {rest_counts[i]} rest days in {window_len}-day window (need >= 2)"
+    )
 
     # 8) Constraint 6: forward rotating shift order
-    for i in range(n_days):
+    i = first_true((nxt_shift != OFF) & (x > nxt_shift))
+    if i is not None:
         nxt = (i + 1) % n_days
-        assert x_roster[nxt] == OFF or x_roster[i] <= x_roster[nxt], (
+        raise AssertionError(
             f"Forward order violated at day {i}->{nxt}: "
             f"shift {x_roster[i]} followed by shift {x_roster[nxt]}"
         )
 
     # 9) Constraint 7: shift requirements per weekday
-    for d in range(n_days_per_week):
-        for s in range(n_shifts):
-            count = sum(1 for w in range(n_weeks) if y_roster[w][d] == s)
-            assert count == requirements[d][s], (
-                f"Requirement violated for weekday {d}, shift {s}: "
-                f"got {count}, expected {requirements[d][s]}"
-            )
+    counts = (y[:, :, None] == np.arange(n_shifts)).sum(axis=0)
+    bad = first_true(counts != as_int_array(requirements)[:, :n_shifts])
+    if bad is not None:
+        d, s = bad
+        raise AssertionError(
+            f"Requirement violated for weekday {d}, shift {s}: "
+            f"got {counts[d, s]}, expected {requirements[d][s]}"
+        )
 
     # 10) CR3: no night shift directly after a rest day
-    for i in range(n_days):
+    i = first_true((x == OFF) & (nxt_shift == NIGHT))
+    if i is not None:
         nxt = (i + 1) % n_days
-        if x_roster[i] == OFF:
-            assert x_roster[nxt] != NIGHT, (
-                f"CR3 violated at day {i}->{nxt}: rest day followed directly "
-                f"by a night shift"
-            )
+        raise AssertionError(
+            f"CR3 violated at day {i}->{nxt}: rest day followed directly "
+            f"by a night shift"
+        )
 
     return "pass", "sat"
\ No newline at end of file
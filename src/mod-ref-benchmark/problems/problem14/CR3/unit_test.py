@@ -1,5 +1,7 @@
 import traceback
 
+from verify_kernels import as_int_array, first_true, group_sums
+
 
 def handle_assertions(func):
     def wrapper(*args, **kwargs):
@@ -108,15 +110,11 @@ def cr3_verify_func(data_dict, hypothesis_solution):
             )
 
     # 2) Base exact shipped volume per cargo
-    for c in range(1, num_cargos + 1):
-        shipped = sum(
-            load[t][s]
-            for t in range(num_tanks)
-            for s in range(2)
-            if cargo_in_tank[t][s] == c
-        )
-        assert shipped == volume_to_ship[c - 1], (
-            f"Cargo {c} ships volume {shipped}, expected {volume_to_ship[c - 1]}."
+    shipped = group_sums(cargo_in_tank, load, size=num_cargos + 1)[1:]
+    c = first_true(shipped != as_int_array(volume_to_ship)[:num_cargos])
+    if c is not None:
+        raise AssertionError(
+            f"Cargo {c + 1} ships volume {shipped[c]}, expected {volume_to_ship[c]}."
         )
 
     # 3) Base forbidden cargo-tank assignments
@@ -1,5 +1,7 @@
 import traceback
 
+from verify_kernels import first_invalid_id
+
 
 def handle_assertions(func):
     def wrapper(*args, **kwargs):
@@ -36,12 +38,13 @@ def cr1_verify_func(data_dict, hypothesis_solution):
     assert isinstance(revenue, int), "revenue must be an int"
     assert revenue >= 0, "revenue must be non-negative"
 
-    seen = set()
-    for idx, b in enumerate(selected_bids):
-        assert isinstance(b, int), f"selected_bids[{idx}] must be an int"
-        assert 0 <= b < n_bids, f"selected_bids[{idx}]={b} out of range [0, {n_bids - 1}]"
-        assert b not in seen, f"selected_bids contains duplicate bid index {b}"
-        seen.add(b)
+    invalid = first_invalid_id(selected_bids, 0, n_bids)
+    if invalid is not None:
+        reason, idx = invalid
+        b = selected_bids[idx]
+        assert reason != "type", f"selected_bids[{idx}] must be an int"
+        assert reason != "range", f"selected_bids[{idx}]={b} out of range [0, {n_bids - 1}]"
+        raise AssertionError(f"selected_bids contains duplicate bid index {b}")
 
     # 1) Input consistency checks relevant to the CR
     assert len(bid_items) == n_bids, "bid_items must have the same length as bid_values"
@@ -1,5 +1,7 @@
 import traceback
 
+from verify_kernels import first_duplicate, first_invalid_id
+
 
 def handle_assertions(func):
     def wrapper(*args, **kwargs):
@@ -43,21 +45,25 @@ def cr3_verify_func(data_dict, hypothesis_solution):
     assert reserved_value >= 0, "reserved_value must be non-negative"
     assert total_value >= 0, "total_value must be non-negative"
 
-    selected_set = set()
-    for idx, b in enumerate(selected_bids):
-        assert isinstance(b, int), f"selected_bids[{idx}] must be an int"
-        assert 0 <= b < n_bids, f"selected_bids[{idx}]={b} out of range [0, {n_bids - 1}]"
-        assert b not in selected_set, f"selected_bids contains duplicate bid index {b}"
-        selected_set.add(b)
-
-    reserved_set = set()
-    for idx, item in enumerate(reserved_items):
-        assert isinstance(item, int), f"reserved_items[{idx}] must be an int"
-        assert 1 <= item <= n_items, (
+    invalid = first_invalid_id(selected_bids, 0, n_bids)
+    if invalid is not None:
+        reason, idx = invalid
+        b = selected_bids[idx]
+        assert reason != "type", f"selected_bids[{idx}] must be an int"
+        assert reason != "range", f"selected_bids[{idx}]={b} out of range [0, {n_bids - 1}]"
+        raise AssertionError(f"selected_bids contains duplicate bid index {b}")
+
+    invalid = first_invalid_id(reserved_items, 1, n_items + 1)
+    if invalid is not None:
+        reason, idx = invalid
+        item = reserved_items[idx]
+        assert reason != "type", f"reserved_items[{idx}] must be an int"
+        assert reason != "range", (
             f"reserved_items[{idx}]={item} out of range [1, {n_items}]"
         )
-        assert item not in reserved_set, f"reserved_items contains duplicate item id {item}"
-        reserved_set.add(item)
+        raise AssertionError(f"reserved_items contains duplicate item id {item}")
+    selected_set = set(selected_bids)
+    reserved_set = set(reserved_items)
 
     # 1) Input consistency checks relevant to the CR
     assert len(bid_items) == n_bids, "bid_items must have the same length as bid_values"
@@ -71,13 +77,12 @@ def cr3_verify_func(data_dict, hypothesis_solution):
             assert 1 <= item <= n_items, f"bid_items[{b}] contains invalid item {item}"
 
     # 2) Base compatibility check: accepted bids must be mutually disjoint
-    sold_items = set()
-    for b in selected_bids:
-        for item in bid_items[b]:
-            assert item not in sold_items, (
-                f"Item {item} appears in more than one accepted bid."
-            )
-            sold_items.add(item)
+    sold = [item for b in selected_bids for item in bid_items[b]]
+    repeat = first_duplicate(sold)
+    assert repeat is None, (
+        f"Item {sold[repeat]} appears in more than one accepted bid."
+    )
+    sold_items = set(sold)
 
     # 3) CR3 reservation check: an item may be sold at most once or reserved, but not both
     for item in range(1, n_items + 1):
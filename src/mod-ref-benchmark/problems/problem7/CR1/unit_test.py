@@ -1,5 +1,8 @@
 import traceback
-from itertools import combinations
+
+import numpy as np
+
+from verify_kernels import as_int_array, first_true, group_sums, pair_meeting_counts
 
 
 def handle_assertions(func):
@@ -73,29 +76,25 @@ def cr1_verify_func(data_dict, hypothesis_solution):
         )
 
     # 2) Base constraint checks (group structure)
+    table = as_int_array(schedule0)
     for r in range(n_rounds):
-        counts = [0] * n_groups
-        for p in range(n_players):
-            gid = schedule0[r][p]
-            assert 0 <= gid < n_groups, f"Error: Invalid group id at round {r}, player {p}: {gid}"
-            counts[gid] += 1
-
-        for grp in range(n_groups):
-            assert counts[grp] == n_per_group, (
-                f"Error: Round {r}, group {grp} has size {counts[grp]}, "
-                f"expected {n_per_group}."
-            )
+        p = first_true((table[r] < 0) | (table[r] >= n_groups))
+        assert p is None, (
+            f"Error: Invalid group id at round {r}, player {p}: {schedule0[r][p]}"
+        )
+        counts = group_sums(table[r], size=n_groups)
+        grp = first_true(counts != n_per_group)
+        assert grp is None, (
+            f"Error: Round {r}, group {grp} has size {counts[grp]}, "
+            f"expected {n_per_group}."
+        )
 
     # 3) CR1 objective consistency check
     assert isinstance(reported_repeats, int), "Error: total_repeated_pairings must be an int."
     assert reported_repeats >= 0, "Error: total_repeated_pairings must be non-negative."
 
-    recomputed_repeats = 0
-    for p1, p2 in combinations(range(n_players), 2):
-        pair_meetings = sum(
-            1 for r in range(n_rounds) if schedule0[r][p1] == schedule0[r][p2]
-        )
-        recomputed_repeats += max(pair_meetings - 1, 0)
+    pair_meetings = pair_meeting_counts(table, n_groups)[np.triu_indices(n_players, 1)]
+    recomputed_repeats = int(np.maximum(pair_meetings - 1, 0).sum())
 
     assert recomputed_repeats == reported_repeats, (
         f"Error: reported total_repeated_pairings={reported_repeats}, "
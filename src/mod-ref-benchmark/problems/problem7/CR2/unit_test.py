@@ -1,5 +1,8 @@
 import traceback
-from itertools import combinations
+
+import numpy as np
+
+from verify_kernels import as_int_array, first_true, group_sums, pair_meeting_counts
 
 
 def handle_assertions(func):
@@ -71,28 +74,27 @@ def cr2_verify_func(data_dict, hypothesis_solution):
 
 
     # 2) Base constraints: exact group sizes
+    table = as_int_array(schedule0)
     for r in range(n_rounds):
-        counts = [0] * n_groups
-        for p in range(n_players):
-            gid = schedule0[r][p]
-            assert 0 <= gid < n_groups, (
-                f"Error: Invalid group id at round {r}, player {p}: {gid}"
-            )
-            counts[gid] += 1
-
-        for grp in range(n_groups):
-            assert counts[grp] == n_per_group, (
-                f"Error: Round {r}, group {grp} has size {counts[grp]}, "
-                f"expected {n_per_group}."
-            )
+        p = first_true((table[r] < 0) | (table[r] >= n_groups))
+        assert p is None, (
+            f"Error: Invalid group id at round {r}, player {p}: {schedule0[r][p]}"
+        )
+        counts = group_sums(table[r], size=n_groups)
+        grp = first_true(counts != n_per_group)
+        assert grp is None, (
+            f"Error: Round {r}, group {grp} has size {counts[grp]}, "
+            f"expected {n_per_group}."
+        )
 
     # 3) CR2: every pair meets at least twice
-    for p1, p2 in combinations(range(n_players), 2):
-        meetings = sum(
-            1 for r in range(n_rounds) if schedule0[r][p1] == schedule0[r][p2]
-        )
-        assert meetings >= 2, (
-            f"CR2 violated: pair ({p1}, {p2}) meets {meetings} times, expected at least 2."
+    pair_rows, pair_cols = np.triu_indices(n_players, 1)
+    meetings = pair_meeting_counts(table, n_groups)[pair_rows, pair_cols]
+    k = first_true(meetings < 2)
+    if k is not None:
+        p1, p2 = pair_rows[k], pair_cols[k]
+        raise AssertionError(
+            f"CR2 violated: pair ({p1}, {p2}) meets {meetings[k]} times, expected at least 2."
         )
 
     return "pass"
@@ -1,5 +1,9 @@
 import traceback
 
+import numpy as np
+
+from verify_kernels import as_int_array, first_true, group_sums, pair_meeting_counts
+
 
 def handle_assertions(func):
     def wrapper(*args, **kwargs):
@@ -75,34 +79,27 @@ def cr3_verify_func(data_dict, hypothesis_solution):
         )
 
     # 2) Base constraints: exact group sizes
+    table = as_int_array(schedule0)
     for r in range(n_rounds):
-        counts = [0] * n_groups
-        for p in range(n_players):
-            gid = schedule0[r][p]
-            assert 0 <= gid < n_groups, (
-                f"Error: Invalid group id at round {r}, player {p}: {gid}"
-            )
-            counts[gid] += 1
-
-        for grp in range(n_groups):
-            assert counts[grp] == n_per_group, (
-                f"Error: Round {r}, group {grp} has size {counts[grp]}, "
-                f"expected {n_per_group}."
-            )
+        p = first_true((table[r] < 0) | (table[r] >= n_groups))
+        assert p is None, (
+            f"Error: Invalid group id at round {r}, player {p}: {schedule0[r][p]}"
+        )
+        counts = group_sums(table[r], size=n_groups)
+        grp = first_true(counts != n_per_group)
+        assert grp is None, (
+            f"Error: Round {r}, group {grp} has size {counts[grp]}, "
+            f"expected {n_per_group}."
+        )
 
     # 3) CR3: each golfer meets enough distinct partners
-    for p in range(n_players):
-        distinct_partners = set()
-        for q in range(n_players):
-            if p == q:
-                continue
-            met = any(schedule0[r][p] == schedule0[r][q] for r in range(n_rounds))
-            if met:
-                distinct_partners.add(q)
-
-        assert len(distinct_partners) >= k_min_distinct, (
-            f"CR3 violated: golfer {p} met {len(distinct_partners)} distinct partners, "
-            f"expected at least {k_min_distinct}."
-        )
+    met = pair_meeting_counts(table, n_groups) > 0
+    np.fill_diagonal(met, False)
+    distinct_partners = met.sum(axis=1)
+    p = first_true(distinct_partners < k_min_distinct)
+    assert p is None, (
+        f"CR3 violated: golfer {p} met {distinct_partners[p]} distinct partners, "
+        f"expected at least {k_min_distinct}."
+    )
 
     return "pass"
@@ -1,5 +1,9 @@
 import traceback
 
+import numpy as np
+
+from verify_kernels import as_int_array, first_true, resource_profile
+
 
 def handle_assertions(func):
     def wrapper(*args, **kwargs):
@@ -103,22 +107,21 @@ def cr3_verify_func(data_dict, hypothesis_solution):
 
     # 4) Renewable resource capacity constraints (discrete time check)
     end_time = max(start_times[i] + jobs[i][0] for i in range(n_jobs))
+    usage = resource_profile(
+        start_times,
+        [job[0] for job in jobs],
+        np.reshape(as_int_array([job[2] for job in jobs]), (n_jobs, n_resources)),
+        end_time,
+    )
     for r in range(n_resources):
         cap = capacities[r]
         assert isinstance(cap, int) and cap >= 0, (
             f"Error: capacities[{r}] must be a non-negative int."
         )
-        for t in range(end_time):
-            usage = 0
-            for i in range(n_jobs):
-                s_i = start_times[i]
-                dur_i = jobs[i][0]
-                dem_i = jobs[i][2][r]
-                if s_i <= t < s_i + dur_i:
-                    usage += dem_i
-            assert usage <= cap, (
-                f"Error: Resource {r} exceeds capacity at time {t}: {usage} > {cap}."
-            )
+        t = first_true(usage[:, r] > cap)
+        assert t is None, (
+            f"Error: Resource {r} exceeds capacity at time {t}: {usage[t, r]} > {cap}."
+        )
 
     # 5) objective in reference model is minimize s[-1]
     makespan = start_times[-1]
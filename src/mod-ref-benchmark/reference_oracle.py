@@ -0,0 +1,313 @@
+"""Content-hashed store of reference-model results.
+
+Every record holds what ``CR*/reference_model.py`` produced on one instance: the printed
+solution, the objective value reported by the solver, wall-clock solve time and solver status.
+Records are keyed by a SHA-256 of the reference model source and the canonical instance JSON
+(``ref_opt_val`` excluded), so editing either one invalidates the record while re-running on an
+unchanged instance is a file read.
+
+Build the store up front, in parallel::
+
+    python3 src/mod-ref-benchmark/reference_oracle.py --jobs 8 --instance-scale 1,2,4
+
+Runners and the scale ladder call ``solve_reference``, which only solves on a cache miss.
+Only authoritative records are stored: solves that proved optimality or infeasibility, or found a
+solution to a decision problem without hitting the time limit. A solve that ran out of budget
+(``timeout_incumbent``, ``timeout_no_incumbent``, ``unknown``) depends on the budget rather than
+on the instance, so it is returned to the caller but never cached.
+"""
+
+from __future__ import annotations
+
+import argparse
+import datetime
+import hashlib
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+from typing import Any, Iterator
+
+MODREF_DIR = Path(__file__).resolve().parent
+if str(MODREF_DIR) not in sys.path:
+    sys.path.insert(0, str(MODREF_DIR))
+
+from instance_generators import generate_instance, parse_instance_scales, supports_problem
+from solver_guard import run_guarded_script
+
+DEFAULT_ORACLE_ROOT = MODREF_DIR / "oracle_cache"
+INSTANCES_DIRNAME = "instances"
+
+
+def canonical_instance(data: dict[str, Any]) -> str:
+    payload = {k: v for k, v in data.items() if k != "ref_opt_val"}
+    return json.dumps(payload, sort_keys=True, separators=(",", ":"))
+
+
+def instance_key(reference_source: str, data: dict[str, Any]) -> str:
+    """Content hash identifying one (reference model, instance) pair."""
+    digest = hashlib.sha256()
+    digest.update(reference_source.encode("utf-8"))
+    digest.update(b"\0")
+    digest.update(canonical_instance(data).encode("utf-8"))
+    return digest.hexdigest()
+
+
+class OracleStore:
+    """One JSON file per record under ``root/<key[:2]>/<key>.json``."""
+
+    def __init__(self, root: Path | str = DEFAULT_ORACLE_ROOT):
+        self.root = Path(root)
+
+    def path(self, key: str) -> Path:
+        return self.root / key[:2] / f"{key}.json"
+
+    def get(self, key: str) -> dict[str, Any] | None:
+        path = self.path(key)
+        if not path.exists():
+            return None
+        try:
+            return json.loads(path.read_text())
+        except (OSError, json.JSONDecodeError):
+            return None
+
+    def put(self, record: dict[str, Any]) -> Path:
+        path = self.path(record["key"])
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        with os.fdopen(fd, "w") as handle:
+            json.dump(record, handle, indent=2)
+        os.replace(tmp_name, path)
+        return path
+
+
+def is_authoritative(record: dict[str, Any] | None) -> bool:
+    """Whether a record's solve actually finished, so its result holds for any time budget."""
+    if not record or record.get("timed_out"):
+        return False
+    exitstatus = record.get("exitstatus")
+    if exitstatus in ("OPTIMAL", "UNSATISFIABLE"):
+        return True
+    # A decision problem has no objective; its solver reports FEASIBLE once a solution is found.
+    return (
+        exitstatus == "FEASIBLE"
+        and record.get("objective") is None
+        and record.get("solver_status") == "feasible"
+        and record.get("solution") is not None
+    )
+
+
+def oracle_optimum(record: dict[str, Any] | None) -> int | float | None:
+    """Objective value of a record when the reference solve proved it optimal."""
+    if not record or record.get("exitstatus") != "OPTIMAL":
+        return None
+    return record.get("objective")
+
+
+def with_oracle_optimum(data: dict[str, Any], record: dict[str, Any] | None) -> dict[str, Any]:
+    """Fill a missing ``ref_opt_val`` from the oracle so verifiers can tag optimal solutions."""
+    optimum = oracle_optimum(record)
+    if data.get("ref_opt_val") is not None or not isinstance(optimum, int):
+        return data
+    return {**data, "ref_opt_val": optimum}
+
+
+def solve_reference(
+    *,
+    cr_dir: Path,
+    data: dict[str, Any],
+    store: OracleStore | None = None,
+    timeout: float | None = None,
+    refresh: bool = False,
+    instance_label: str | None = None,
+) -> dict[str, Any]:
+    """Return the oracle record for ``data``, running the CR reference model only on a cache miss."""
+    store = store or OracleStore()
+    reference_path = cr_dir / "reference_model.py"
+    key = instance_key(reference_path.read_text(), data)
+
+    if not refresh:
+        cached = store.get(key)
+        # Stores written before budget-limited solves were excluded may still hold some; re-solve those.
+        if is_authoritative(cached):
+            return {**cached, "cached": True}
+
+    with tempfile.TemporaryDirectory(prefix="oracle_") as tmp:
+        workdir = Path(tmp)
+        (workdir / "input_data.json").write_text(json.dumps(data))
+        shutil.copy2(reference_path, workdir / "reference_model.py")
+        started = time.perf_counter()
+        run = run_guarded_script(script_path=workdir / "reference_model.py", cwd=workdir, timeout=timeout)
+        seconds = time.perf_counter() - started
+
+    solution: Any = None
+    try:
+        solution = json.loads(run.stdout)
+    except json.JSONDecodeError:
+        solution = None
+
+    solver_status = run.solver_status or {}
+    record = {
+        "key": key,
+        "problem": cr_dir.parent.name,
+        "cr": cr_dir.name,
+        "instance": instance_label,
+        "objective": solver_status.get("objective"),
+        "solution": solution,
+        "seconds": round(seconds, 4),
+        "solver_runtime": solver_status.get("runtime"),
+        "solver_status": run.status,
+        "exitstatus": solver_status.get("exitstatus"),
+        "returncode": run.returncode,
+        "timed_out": run.timed_out,
+        "timeout": timeout,
+        "stderr_tail": run.stderr[-2000:] if solution is None else None,
+        "created_at": datetime.datetime.now().isoformat(timespec="seconds"),
+    }
+    # The guard's soft limit fires before the hard timeout, so ``timed_out`` alone misses
+    # budget-limited solves; only records whose solve finished are reference results.
+    record["authoritative"] = is_authoritative(record)
+    if record["authoritative"]:
+        store.put(record)
+    return {**record, "cached": False}
+
+
+def lookup_reference(cr_dir: Path, data: dict[str, Any], store: OracleStore | None = None) -> dict[str, Any] | None:
+    """Cached authoritative record for ``data`` without solving, or None."""
+    store = store or OracleStore()
+    record = store.get(instance_key((cr_dir / "reference_model.py").read_text(), data))
+    return record if is_authoritative(record) else None
+
+
+def iter_cr_instances(cr_dir: Path, scales: list[int] | None = None, seed: int = 0) -> Iterator[tuple[str, dict[str, Any]]]:
+    """Yield ``(label, instance)`` for the shipped instance, ``instances/*.json`` and generated scales."""
+    template = json.loads((cr_dir / "input_data.json").read_text())
+    yield "input_data.json", template
+
+    instances_dir = cr_dir / INSTANCES_DIRNAME
+    if instances_dir.is_dir():
+        for path in sorted(instances_dir.glob("*.json")):
+            yield f"{INSTANCES_DIRNAME}/{path.name}", json.loads(path.read_text())
+
+    problem = cr_dir.parent.name
+    if scales and supports_problem(problem):
+        for scale in scales:
+            if scale == 1:
+                continue
+            yield f"scale_{scale}_seed_{seed}", generate_instance(problem, cr_dir.name, template, scale, seed=seed)
+
+
+def build_oracle(
+    *,
+    problems_root: Path,
+    store: OracleStore,
+    jobs: int = 1,
+    timeout: float | None = None,
+    refresh: bool = False,
+    scales: list[int] | None = None,
+    seed: int = 0,
+    only_problem: str | None = None,
+    only_cr: str | None = None,
+) -> list[dict[str, Any]]:
+    """Solve every (CR, instance) pair missing from the store using ``jobs`` concurrent solves."""
+    tasks: list[tuple[Path, str, dict[str, Any]]] = []
+    for problem_dir in sorted(problems_root.iterdir()):
+        if not problem_dir.is_dir() or not problem_dir.name.startswith("problem"):
+            continue
+        if only_problem and problem_dir.name != only_problem:
+            continue
+        for cr_dir in sorted(problem_dir.iterdir()):
+            if not cr_dir.is_dir() or not cr_dir.name.startswith("CR"):
+                continue
+            if only_cr and cr_dir.name != only_cr:
+                continue
+            if not (cr_dir / "reference_model.py").exists() or not (cr_dir / "input_data.json").exists():
+                continue
+            for label, data in iter_cr_instances(cr_dir, scales, seed):
+                tasks.append((cr_dir, label, data))
+
+    records: list[dict[str, Any]] = []
+    with ThreadPoolExecutor(max_workers=max(1, jobs)) as pool:
+        futures = {
+            pool.submit(
+                solve_reference,
+                cr_dir=cr_dir,
+                data=data,
+                store=store,
+                timeout=timeout,
+                refresh=refresh,
+                instance_label=label,
+            ): (cr_dir, label)
+            for cr_dir, label, data in tasks
+        }
+        for future in as_completed(futures):
+            cr_dir, label = futures[future]
+            try:
+                record = future.result()
+            except Exception as exc:
+                record = {"problem": cr_dir.parent.name, "cr": cr_dir.name, "instance": label, "error": str(exc)}
+            records.append(record)
+            outcome = record.get("error") or record.get("solver_status")
+            if outcome is None:
+                outcome = "solved" if record.get("solution") is not None else "no solution"
+            cached = " (cached)" if record.get("cached") else ""
+            if "error" not in record and not record.get("cached") and not record.get("authoritative"):
+                cached = " (budget-limited, not cached)"
+            print(f"[oracle] {record.get('problem')}/{record.get('cr')} {label}: {outcome}{cached}", flush=True)
+    records.sort(key=lambda r: (str(r.get("problem")), str(r.get("cr")), str(r.get("instance"))))
+    return records
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Build the content-hashed reference-model oracle store.")
+    parser.add_argument(
+        "--problems-root",
+        default=str((MODREF_DIR / "problems").resolve()),
+        help="Root directory containing problem folders (default: src/mod-ref-benchmark/problems).",
+    )
+    parser.add_argument(
+        "--oracle-root",
+        default=str(DEFAULT_ORACLE_ROOT),
+        help="Directory of the oracle store (default: src/mod-ref-benchmark/oracle_cache).",
+    )
+    parser.add_argument("--jobs", type=int, default=os.cpu_count() or 1, help="Concurrent reference solves.")
+    parser.add_argument("--timeout", type=int, default=300, help="Timeout in seconds per reference solve (default: 300).")
+    parser.add_argument("--refresh", action="store_true", help="Re-solve instances that already have a record.")
+    parser.add_argument("--instance-scale", help="Optional comma-separated scales of generated instances to include.")
+    parser.add_argument("--instance-seed", type=int, default=0, help="Seed for the generated instances (default: 0).")
+    parser.add_argument("--only-problem", help="Optional: only a specific problem folder name (e.g., problem1).")
+    parser.add_argument("--only-cr", help="Optional: only a specific CR folder name (e.g., CR1).")
+    args = parser.parse_args()
+
+    store = OracleStore(Path(args.oracle_root).resolve())
+    records = build_oracle(
+        problems_root=Path(args.problems_root).resolve(),
+        store=store,
+        jobs=args.jobs,
+        timeout=args.timeout or None,
+        refresh=args.refresh,
+        scales=parse_instance_scales(args.instance_scale),
+        seed=args.instance_seed,
+        only_problem=args.only_problem,
+        only_cr=args.only_cr,
+    )
+    index_path = store.root / "index.json"
+    store.root.mkdir(parents=True, exist_ok=True)
+    index_path.write_text(
+        json.dumps(
+            [
+                {k: r.get(k) for k in ("key", "problem", "cr", "instance", "objective", "solver_status", "seconds")}
+                for r in records
+            ],
+            indent=2,
+        )
+    )
+    print(f"[oracle] Done. {len(records)} records, index saved to {index_path}", flush=True)
+
+
+if __name__ == "__main__":
+    main()
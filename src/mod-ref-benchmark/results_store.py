@@ -0,0 +1,519 @@
+"""SQLite store of benchmark results with a small query CLI.
+
+The runners leave one pretty-printed JSON file per case (``case_summary.json``, baseline
+``result.json``, ``workflow_summary_*.json`` entries plus the ``*_workflow_log.json`` they point
+to), and every analysis used to walk and re-parse the whole tree. ``ingest`` loads them into one
+indexed SQLite file with a row per case in ``runs`` and a row per stage attempt in ``stages``.
+Files are re-read only when their size or mtime changes, so re-ingesting a grown tree is cheap::
+
+    python3 src/mod-ref-benchmark/results_store.py ingest
+    python3 src/mod-ref-benchmark/results_store.py passk --k 1,3 --by model_key
+    python3 src/mod-ref-benchmark/results_store.py latency --by variant_key --kind ablation
+
+The workflow logs do not record the order of failed attempts, so stage rows number the failed
+attempts of a stage first and its final outcome last.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import sqlite3
+import sys
+from pathlib import Path
+from typing import Any, Iterator
+
+MODREF_DIR = Path(__file__).resolve().parent
+if str(MODREF_DIR) not in sys.path:
+    sys.path.insert(0, str(MODREF_DIR))
+
+from instance_eval import timing_stats
+
+DEFAULT_DB_PATH = MODREF_DIR / "results.sqlite"
+DEFAULT_RESULT_ROOTS = (
+    MODREF_DIR / "baseline" / "results",
+    MODREF_DIR / "langgraph_workflow" / "results",
+    MODREF_DIR / "experiments" / "cross-model-eval" / "results",
+    MODREF_DIR / "experiments" / "ablations" / "results",
+)
+GROUP_COLUMNS = ("kind", "experiment", "model_key", "provider", "model", "variant_key", "problem", "cr")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    path TEXT PRIMARY KEY,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    source_path TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    experiment TEXT,
+    model_key TEXT,
+    provider TEXT,
+    model TEXT,
+    variant_key TEXT,
+    problem TEXT,
+    cr TEXT,
+    status TEXT,
+    passed INTEGER NOT NULL,
+    stage TEXT,
+    termination_reason TEXT,
+    loop_count INTEGER,
+    planner_validation_error_count INTEGER,
+    exec_error_count INTEGER,
+    validation_error_count INTEGER,
+    clarification_turn_count INTEGER,
+    llm_calls INTEGER,
+    seconds REAL,
+    prefix_seconds REAL,
+    workflow_log_path TEXT
+);
+CREATE TABLE IF NOT EXISTS stages (
+    run_id INTEGER NOT NULL REFERENCES runs(id) ON DELETE CASCADE,
+    stage TEXT NOT NULL,
+    attempt INTEGER NOT NULL,
+    outcome TEXT
+);
+CREATE INDEX IF NOT EXISTS runs_source ON runs(source_path);
+CREATE INDEX IF NOT EXISTS runs_model ON runs(model_key, variant_key);
+CREATE INDEX IF NOT EXISTS runs_case ON runs(problem, cr);
+CREATE INDEX IF NOT EXISTS runs_kind ON runs(kind, experiment);
+CREATE INDEX IF NOT EXISTS stages_run ON stages(run_id);
+CREATE INDEX IF NOT EXISTS stages_stage ON stages(stage, outcome);
+"""
+
+RUN_COLUMNS = (
+    "source_path",
+    "kind",
+    "experiment",
+    "model_key",
+    "provider",
+    "model",
+    "variant_key",
+    "problem",
+    "cr",
+    "status",
+    "passed",
+    "stage",
+    "termination_reason",
+    "loop_count",
+    "planner_validation_error_count",
+    "exec_error_count",
+    "validation_error_count",
+    "clarification_turn_count",
+    "llm_calls",
+    "seconds",
+    "prefix_seconds",
+    "workflow_log_path",
+)
+LLM_STAGES = ("parser", "clarification_assessor", "planner", "planner_validator", "modifier", "validator", "generation")
+
+
+def connect(db_path: Path | str = DEFAULT_DB_PATH) -> sqlite3.Connection:
+    conn = sqlite3.connect(str(db_path))
+    conn.execute("PRAGMA foreign_keys = ON")
+    conn.executescript(SCHEMA)
+    return conn
+
+
+def _read_json(path: Path | str | None) -> Any:
+    if not path:
+        return None
+    try:
+        return json.loads(Path(path).read_text())
+    except (OSError, json.JSONDecodeError):
+        return None
+
+
+def _int(value: Any) -> int:
+    try:
+        return int(value or 0)
+    except (TypeError, ValueError):
+        return 0
+
+
+def workflow_stage_rows(log: dict[str, Any], status: str | None) -> list[tuple[str, int, str | None]]:
+    """``(stage, attempt, outcome)`` rows reconstructed from the counters of a workflow run log."""
+    rows: list[tuple[str, int, str | None]] = [("parser", 1, "ok")]
+
+    def add(stage: str, failures: int, failure_outcome: str, final_outcome: str | None) -> None:
+        for attempt in range(1, failures + 1):
+            rows.append((stage, attempt, failure_outcome))
+        if final_outcome is not None:
+            rows.append((stage, failures + 1, final_outcome))
+
+    clarification_turns = _int(log.get("clarification_turn_count"))
+    if log.get("clarification_status"):
+        add("clarification_assessor", clarification_turns, "needs_clarification", log.get("clarification_status"))
+
+    planner_failures = _int(log.get("planner_validation_error_count"))
+    planner_status = log.get("planner_validator_status")
+    if log.get("enable_planner_validator", True) and planner_status not in (None, "skipped"):
+        final = "pass" if planner_status == "pass" else None
+        add("planner_validator", planner_failures, "needs_changes", final)
+        planner_attempts = planner_failures + (1 if final else 0)
+    else:
+        planner_attempts = 1 if log.get("planner_output") is not None else 0
+    for attempt in range(1, planner_attempts + 1):
+        rows.append(("planner", attempt, "ok"))
+
+    loops = _int(log.get("loop_count"))
+    exec_failures = min(_int(log.get("exec_error_count")), loops)
+    for attempt in range(1, loops + 1):
+        rows.append(("modifier", attempt, "ok"))
+    add("executor", exec_failures, "error", None)
+    for attempt in range(exec_failures + 1, loops + 1):
+        rows.append(("executor", attempt, "ok"))
+
+    validator_status = log.get("validator_status")
+    if log.get("enable_final_validator", True) and validator_status not in (None, "skipped"):
+        add("validator", _int(log.get("validation_error_count")), "needs_changes", "pass" if validator_status == "pass" else None)
+
+    if log.get("unit_test_result") is not None:
+        rows.append(("unit_test", 1, status))
+    return rows
+
+
+def baseline_stage_rows(result: dict[str, Any]) -> list[tuple[str, int, str | None]]:
+    stage = result.get("stage")
+    order = ("generation", "execution", "unit_test")
+    if stage not in order:
+        return [("generation", 1, result.get("status"))]
+    rows = []
+    for name in order[: order.index(stage) + 1]:
+        rows.append((name, 1, result.get("status") if name == stage else "ok"))
+    return rows
+
+
+def _experiment_of(path: Path, depth: int) -> str:
+    return str(path.parents[depth]) if len(path.parents) > depth else str(path.parent)
+
+
+def _run_from_summary(summary: dict[str, Any], *, source_path: Path, kind: str, experiment: str, extra: dict[str, Any]) -> tuple[dict[str, Any], list]:
+    log = _read_json(summary.get("workflow_log_path")) or {}
+    status = summary.get("status")
+    stages = workflow_stage_rows(log, status) if log else []
+    run = {
+        "source_path": str(source_path),
+        "kind": kind,
+        "experiment": experiment,
+        "model_key": summary.get("model_key"),
+        "provider": summary.get("provider"),
+        "model": summary.get("model"),
+        "variant_key": summary.get("variant_key"),
+        "problem": summary.get("problem"),
+        "cr": summary.get("cr"),
+        "status": status,
+        "passed": int(status == "pass"),
+        "stage": summary.get("stage"),
+        "termination_reason": summary.get("termination_reason") or log.get("termination_reason"),
+        "loop_count": summary.get("loop_count", log.get("loop_count")),
+        "planner_validation_error_count": summary.get(
+            "planner_validation_error_count", log.get("planner_validation_error_count")
+        ),
+        "exec_error_count": summary.get("exec_error_count", log.get("exec_error_count")),
+        "validation_error_count": summary.get("validation_error_count", log.get("validation_error_count")),
+        "clarification_turn_count": summary.get("clarification_turn_count", log.get("clarification_turn_count")),
+        "llm_calls": sum(1 for stage, _, _ in stages if stage in LLM_STAGES) if stages else None,
+        "seconds": summary.get("runtime_seconds", summary.get("duration_seconds")),
+        "prefix_seconds": summary.get("prefix_seconds"),
+        "workflow_log_path": summary.get("workflow_log_path"),
+        **extra,
+    }
+    return run, stages
+
+
+def iter_runs(path: Path) -> Iterator[tuple[dict[str, Any], list]]:
+    """Runs recorded in one result file, with their stage rows. Unknown files yield nothing."""
+    payload = _read_json(path)
+    if not isinstance(payload, dict):
+        return
+
+    if path.name == "case_summary.json":
+        # cross-model: <eval_root>/<preset>/<problem>/<CR>; ablations: <root>/<preset>/<variant>/<problem>/<CR>
+        kind = "ablation" if payload.get("variant_key") else "cross_model"
+        experiment = _experiment_of(path, 4 if kind == "ablation" else 3)
+        yield _run_from_summary(payload, source_path=path, kind=kind, experiment=experiment, extra={})
+
+    elif path.name.startswith("workflow_summary_") and path.suffix == ".json":
+        llm_config = payload.get("llm_config") or {}
+        extra = {
+            "model_key": None,
+            "provider": llm_config.get("provider"),
+            "model": llm_config.get("model"),
+        }
+        for entry in payload.get("results") or []:
+            yield _run_from_summary(
+                entry, source_path=path, kind="workflow", experiment=str(path), extra=extra
+            )
+
+    elif path.name == "result.json" and "cr" in payload:
+        # baseline: <run_root>/<model_key>/<problem>/<CR>/result.json
+        model_dir = path.parents[2]
+        model_summary = _read_json(model_dir / "model_summary.json") or {}
+        status = payload.get("status")
+        run = {column: None for column in RUN_COLUMNS}
+        run.update(
+            {
+                "source_path": str(path),
+                "kind": "baseline",
+                "experiment": str(model_dir.parent),
+                "model_key": model_dir.name,
+                "provider": model_summary.get("provider"),
+                "model": model_summary.get("model"),
+                "problem": payload.get("problem"),
+                "cr": payload.get("cr"),
+                "status": status,
+                "passed": int(status == "pass"),
+                "stage": payload.get("stage"),
+                "llm_calls": 1,
+            }
+        )
+        yield run, baseline_stage_rows(payload)
+
+
+def _result_files(root: Path) -> Iterator[Path]:
+    yield from root.rglob("case_summary.json")
+    yield from root.rglob("workflow_summary_*.json")
+    yield from root.rglob("result.json")
+
+
+def ingest(conn: sqlite3.Connection, roots: list[Path]) -> dict[str, int]:
+    """Load new or changed result files under ``roots``; returns file and run counts."""
+    counts = {"files_seen": 0, "files_loaded": 0, "runs": 0}
+    known = {row[0]: (row[1], row[2]) for row in conn.execute("SELECT path, mtime_ns, size FROM files")}
+    insert_run = f"INSERT INTO runs ({', '.join(RUN_COLUMNS)}) VALUES ({', '.join('?' for _ in RUN_COLUMNS)})"
+
+    with conn:
+        for root in roots:
+            if not root.is_dir():
+                continue
+            for path in _result_files(root):
+                counts["files_seen"] += 1
+                stat = path.stat()
+                fingerprint = (stat.st_mtime_ns, stat.st_size)
+                if known.get(str(path)) == fingerprint:
+                    continue
+                conn.execute("DELETE FROM runs WHERE source_path = ?", (str(path),))
+                for run, stages in iter_runs(path):
+                    cursor = conn.execute(insert_run, [run.get(column) for column in RUN_COLUMNS])
+                    conn.executemany(
+                        "INSERT INTO stages (run_id, stage, attempt, outcome) VALUES (?, ?, ?, ?)",
+                        [(cursor.lastrowid, *row) for row in stages],
+                    )
+                    counts["runs"] += 1
+                conn.execute(
+                    "INSERT OR REPLACE INTO files (path, mtime_ns, size) VALUES (?, ?, ?)",
+                    (str(path), *fingerprint),
+                )
+                counts["files_loaded"] += 1
+    return counts
+
+
+def _where(filters: dict[str, str | None]) -> tuple[str, list[Any]]:
+    clauses = [f"{column} = ?" for column, value in filters.items() if value is not None]
+    params = [value for value in filters.values() if value is not None]
+    return (" WHERE " + " AND ".join(clauses)) if clauses else "", params
+
+
+def pass_at_k(n: int, c: int, k: int) -> float:
+    """Unbiased pass@k for one case with ``c`` passes out of ``n`` runs."""
+    if n - c < k:
+        return 1.0
+    return 1.0 - math.comb(n - c, k) / math.comb(n, k)
+
+
+def query_pass_at_k(conn: sqlite3.Connection, by: list[str], ks: list[int], filters: dict[str, str | None]) -> list[dict[str, Any]]:
+    where, params = _where(filters)
+    group = ", ".join(by)
+    select_group = f"{group}, " if by else ""
+    rows = conn.execute(
+        f"SELECT {select_group}problem AS _problem, cr AS _cr, COUNT(*), SUM(passed) FROM runs{where} "
+        f"GROUP BY {select_group}problem, cr",
+        params,
+    ).fetchall()
+    grouped: dict[tuple, list[tuple[int, int]]] = {}
+    for row in rows:
+        grouped.setdefault(tuple(row[: len(by)]), []).append((row[-2], row[-1]))
+
+    table = []
+    for key, cases in sorted(grouped.items(), key=lambda item: tuple(str(v) for v in item[0])):
+        entry: dict[str, Any] = dict(zip(by, key))
+        entry["cases"] = len(cases)
+        entry["runs"] = sum(n for n, _ in cases)
+        for k in ks:
+            eligible = [pass_at_k(n, c, k) for n, c in cases if n >= k]
+            entry[f"pass@{k}"] = round(sum(eligible) / len(eligible), 4) if eligible else None
+        table.append(entry)
+    return table
+
+
+def query_loops(conn: sqlite3.Connection, by: list[str], filters: dict[str, str | None]) -> list[dict[str, Any]]:
+    where, params = _where(filters)
+    group = ", ".join(by)
+    select_group = f"{group}, " if by else ""
+    group_clause = f" GROUP BY {group} ORDER BY {group}" if by else ""
+    columns = ("loop_count", "planner_validation_error_count", "exec_error_count", "validation_error_count")
+    averages = ", ".join(f"ROUND(AVG({column}), 3), MAX({column})" for column in columns)
+    rows = conn.execute(f"SELECT {select_group}COUNT(*), {averages} FROM runs{where}{group_clause}", params).fetchall()
+    table = []
+    for row in rows:
+        entry: dict[str, Any] = dict(zip(by, row[: len(by)]))
+        entry["runs"] = row[len(by)]
+        values = row[len(by) + 1 :]
+        for index, column in enumerate(columns):
+            entry[f"avg_{column}"] = values[2 * index]
+            entry[f"max_{column}"] = values[2 * index + 1]
+        table.append(entry)
+    return table
+
+
+def query_terminations(conn: sqlite3.Connection, by: list[str], filters: dict[str, str | None]) -> list[dict[str, Any]]:
+    where, params = _where(filters)
+    group = ", ".join(by + ["termination_reason"])
+    rows = conn.execute(
+        f"SELECT {group}, COUNT(*), SUM(passed) FROM runs{where} GROUP BY {group} ORDER BY {group}",
+        params,
+    ).fetchall()
+    return [
+        {**dict(zip(by + ["termination_reason"], row[: len(by) + 1])), "runs": row[-2], "pass": row[-1]}
+        for row in rows
+    ]
+
+
+def query_latency(conn: sqlite3.Connection, by: list[str], filters: dict[str, str | None]) -> list[dict[str, Any]]:
+    where, params = _where(filters)
+    where = f"{where} AND seconds IS NOT NULL" if where else " WHERE seconds IS NOT NULL"
+    select_group = ", ".join(by) + ", " if by else ""
+    order = f" ORDER BY {', '.join(by)}" if by else ""
+    grouped: dict[tuple, list[float]] = {}
+    for row in conn.execute(f"SELECT {select_group}seconds FROM runs{where}{order}", params):
+        grouped.setdefault(tuple(row[: len(by)]), []).append(row[-1])
+    return [{**dict(zip(by, key)), "runs": len(values), **timing_stats(values)} for key, values in grouped.items()]
+
+
+def query_cost(conn: sqlite3.Connection, by: list[str], filters: dict[str, str | None]) -> list[dict[str, Any]]:
+    """LLM calls and wall time per group; the logs carry no token usage, so calls stand in for spend."""
+    where, params = _where(filters)
+    group = ", ".join(by)
+    select_group = f"{group}, " if by else ""
+    group_clause = f" GROUP BY {group} ORDER BY {group}" if by else ""
+    rows = conn.execute(
+        f"SELECT {select_group}COUNT(*), SUM(passed), SUM(llm_calls), ROUND(AVG(llm_calls), 3), "
+        f"ROUND(SUM(seconds), 3), ROUND(SUM(prefix_seconds), 3) FROM runs{where}{group_clause}",
+        params,
+    ).fetchall()
+    table = []
+    for row in rows:
+        runs, passed, calls, avg_calls, seconds, prefix_seconds = row[len(by) :]
+        table.append(
+            {
+                **dict(zip(by, row[: len(by)])),
+                "runs": runs,
+                "pass": passed,
+                "llm_calls": calls,
+                "avg_llm_calls": avg_calls,
+                "llm_calls_per_pass": round(calls / passed, 3) if calls and passed else None,
+                "seconds": seconds,
+                "shared_prefix_seconds": prefix_seconds,
+            }
+        )
+    return table
+
+
+def print_table(rows: list[dict[str, Any]]) -> None:
+    if not rows:
+        print("(no rows)")
+        return
+    columns = list(rows[0].keys())
+    cells = [[("" if row.get(c) is None else str(row.get(c))) for c in columns] for row in rows]
+    widths = [max(len(c), *(len(r[i]) for r in cells)) for i, c in enumerate(columns)]
+    print("  ".join(c.ljust(w) for c, w in zip(columns, widths)))
+    print("  ".join("-" * w for w in widths))
+    for r in cells:
+        print("  ".join(v.ljust(w) for v, w in zip(r, widths)))
+
+
+def _parse_by(text: str | None) -> list[str]:
+    by = [part.strip() for part in (text or "").split(",") if part.strip()]
+    unknown = sorted(set(by) - set(GROUP_COLUMNS))
+    if unknown:
+        raise SystemExit(f"Unknown --by columns: {unknown}. Choose from {list(GROUP_COLUMNS)}.")
+    return by
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Load benchmark results into SQLite and query them.")
+    parser.add_argument("--db", default=str(DEFAULT_DB_PATH), help="SQLite file (default: src/mod-ref-benchmark/results.sqlite).")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    ingest_parser = commands.add_parser("ingest", help="Load new or changed result files.")
+    ingest_parser.add_argument(
+        "roots",
+        nargs="*",
+        help="Result roots to scan (default: the output roots of the baseline, workflow, cross-model and ablation runners).",
+    )
+
+    for name, help_text in (
+        ("passk", "pass@k per group, averaged over problem/CR cases."),
+        ("loops", "Average and maximum loop counters per group."),
+        ("termination", "Termination reasons per group."),
+        ("latency", "Case wall-time percentiles per group."),
+        ("cost", "LLM calls and wall time per group."),
+    ):
+        sub = commands.add_parser(name, help=help_text)
+        sub.add_argument("--by", default="model_key", help=f"Comma-separated group columns from {', '.join(GROUP_COLUMNS)} (default: model_key).")
+        for column in ("kind", "experiment", "model_key", "variant_key", "problem", "cr"):
+            sub.add_argument(f"--{column.replace('_', '-')}", dest=column, help=f"Only rows with this {column}.")
+        sub.add_argument("--json", action="store_true", help="Print JSON instead of a table.")
+        if name == "passk":
+            sub.add_argument("--k", default="1", help="Comma-separated k values (default: 1).")
+
+    sql_parser = commands.add_parser("sql", help="Run a read-only SQL query against the store.")
+    sql_parser.add_argument("query")
+    sql_parser.add_argument("--json", action="store_true", help="Print JSON instead of a table.")
+    args = parser.parse_args()
+
+    if args.command == "sql":
+        conn = sqlite3.connect(f"file:{Path(args.db).resolve()}?mode=ro", uri=True)
+    else:
+        conn = connect(Path(args.db))
+    if args.command == "ingest":
+        roots = [Path(root).resolve() for root in args.roots] or list(DEFAULT_RESULT_ROOTS)
+        counts = ingest(conn, roots)
+        total = conn.execute("SELECT COUNT(*) FROM runs").fetchone()[0]
+        print(
+            f"[results-store] Scanned {counts['files_seen']} files, loaded {counts['files_loaded']} "
+            f"({counts['runs']} runs). Store holds {total} runs: {args.db}",
+            flush=True,
+        )
+        return
+
+    if args.command == "sql":
+        cursor = conn.execute(args.query)
+        columns = [description[0] for description in cursor.description or []]
+        rows = [dict(zip(columns, row)) for row in cursor.fetchall()]
+    else:
+        by = _parse_by(args.by)
+        filters = {column: getattr(args, column) for column in ("kind", "experiment", "model_key", "variant_key", "problem", "cr")}
+        if args.command == "passk":
+            rows = query_pass_at_k(conn, by, [int(k) for k in args.k.split(",") if k.strip()], filters)
+        elif args.command == "loops":
+            rows = query_loops(conn, by, filters)
+        elif args.command == "termination":
+            rows = query_terminations(conn, by, filters)
+        elif args.command == "latency":
+            rows = query_latency(conn, by, filters)
+        else:
+            rows = query_cost(conn, by, filters)
+
+    if args.json:
+        print(json.dumps(rows, indent=2))
+    else:
+        print_table(rows)
+
+
+if __name__ == "__main__":
+    main()
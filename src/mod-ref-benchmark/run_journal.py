@@ -0,0 +1,126 @@
+"""Append-only JSONL journal of finished cases for the batch runners.
+
+Each finished case is appended as one line
+``{"key": ..., "finished_at": ..., "status": "done" | "error", "result": {...}}`` and flushed to
+disk immediately, so a long sweep can be watched with ``tail -f`` and a crashed one restarted
+with ``--resume <journal>``: cases whose latest entry is ``done`` are skipped and the summary
+files are rebuilt from the journal rather than from memory. A case whose runner raised (the
+runners summarise those with ``"stage": "runner"``) is journaled as ``error`` and run again on
+resume; the retry's entry replaces it.
+"""
+
+from __future__ import annotations
+
+import datetime
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Any, Iterable
+
+JOURNAL_FILENAME = "journal.jsonl"
+STATUS_DONE = "done"
+STATUS_ERROR = "error"
+RUNNER_ERROR_STAGE = "runner"
+
+
+def case_key(*parts: str) -> str:
+    return "/".join(str(part) for part in parts)
+
+
+def entry_status(result: dict[str, Any]) -> str:
+    """``error`` for a runner exception summary, ``done`` for any other finished case."""
+    return STATUS_ERROR if result.get("stage") == RUNNER_ERROR_STAGE else STATUS_DONE
+
+
+def read_journal(path: Path) -> list[dict[str, Any]]:
+    """Entries of a journal in append order. A torn final line from a crash is ignored."""
+    if not path.exists():
+        return []
+    entries: list[dict[str, Any]] = []
+    with path.open() as handle:
+        for line in handle:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                entry = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            if isinstance(entry, dict) and "key" in entry:
+                entries.append(entry)
+    return entries
+
+
+class RunJournal:
+    """Thread-safe appender plus an index of the latest result per case key."""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._results: dict[str, dict[str, Any]] = {}
+        self._statuses: dict[str, str] = {}
+        for entry in read_journal(self.path):
+            result = entry.get("result") or {}
+            self._results[entry["key"]] = result
+            # Journals written before statuses were recorded fall back to the runner-error marker.
+            self._statuses[entry["key"]] = entry.get("status") or entry_status(result)
+        # Terminate a torn final line so the next record starts on a line of its own.
+        if self.path.exists() and self.path.stat().st_size:
+            with self.path.open("rb+") as handle:
+                handle.seek(-1, os.SEEK_END)
+                if handle.read(1) != b"\n":
+                    handle.write(b"\n")
+
+    def is_done(self, key: str) -> bool:
+        """Whether ``key`` finished without a runner error; errored cases are retried on resume."""
+        return self._statuses.get(key) == STATUS_DONE
+
+    def errored(self) -> list[str]:
+        with self._lock:
+            return [key for key, status in self._statuses.items() if status == STATUS_ERROR]
+
+    def get(self, key: str) -> dict[str, Any] | None:
+        return self._results.get(key)
+
+    def append(self, key: str, result: dict[str, Any]) -> None:
+        status = entry_status(result)
+        entry = {
+            "key": key,
+            "finished_at": datetime.datetime.now().isoformat(timespec="seconds"),
+            "status": status,
+            "result": result,
+        }
+        line = json.dumps(entry) + "\n"
+        with self._lock:
+            with self.path.open("a") as handle:
+                handle.write(line)
+                handle.flush()
+                os.fsync(handle.fileno())
+            self._results[key] = result
+            self._statuses[key] = status
+
+    def results(self, keys: Iterable[str] | None = None) -> list[dict[str, Any]]:
+        """Journaled results, in ``keys`` order when given, otherwise in first-append order."""
+        with self._lock:
+            if keys is None:
+                return list(self._results.values())
+            return [self._results[key] for key in keys if key in self._results]
+
+
+def open_journal(resume: str | None, default_path: Path) -> RunJournal:
+    """Journal to append to: the ``--resume`` file when given, else a fresh one at ``default_path``."""
+    if resume:
+        path = Path(resume).resolve()
+        if not path.exists():
+            raise FileNotFoundError(f"Journal to resume not found: {path}")
+        journal = RunJournal(path)
+        errored = len(journal.errored())
+        print(
+            f"[journal] Resuming from {path} ({len(journal.results()) - errored} finished cases, "
+            f"{errored} runner errors to retry)",
+            flush=True,
+        )
+        return journal
+    return RunJournal(default_path)
@@ -0,0 +1,143 @@
+"""Solve-time-versus-size ladder for a CR.
+
+Given a generated model that already passed on the shipped instance, ``run_scale_ladder``
+builds scaled instances with ``instance_generators`` and runs the generated model on each one
+under the solver guard, recording wall time, solver status and unit-test outcome per scale.
+Reference results come from the ``reference_oracle`` store, so the reference model is only
+solved the first time an instance is seen.
+"""
+
+from __future__ import annotations
+
+import json
+import shutil
+import time
+import traceback
+from pathlib import Path
+from typing import Any
+
+from instance_generators import generate_instance, instance_size, supports_problem
+from reference_oracle import OracleStore, is_authoritative, solve_reference, with_oracle_optimum
+from solver_guard import mark_incumbent, run_guarded_script
+from unit_test_loader import load_verify_func
+
+
+def _is_pass(verify_result: Any) -> bool:
+    if verify_result == "pass":
+        return True
+    return isinstance(verify_result, (list, tuple)) and bool(verify_result) and verify_result[0] == "pass"
+
+
+def _verify(verify_func, data: dict[str, Any], output: Any) -> tuple[bool, str | None]:
+    if output is None:
+        return False, None
+    try:
+        return _is_pass(verify_func(data, output)), None
+    except Exception as exc:
+        return False, str(exc)
+
+
+def run_and_verify(*, script_path: Path, cwd: Path, data: dict[str, Any], verify_func, timeout: float | None) -> dict[str, Any]:
+    """Run a model under the solver guard, time it and check its output with ``verify_func``."""
+    started = time.perf_counter()
+    run = run_guarded_script(script_path=script_path, cwd=cwd, timeout=timeout)
+    seconds = time.perf_counter() - started
+
+    output: Any = None
+    if run.returncode == 0 or run.timed_out:
+        try:
+            output = mark_incumbent(json.loads(run.stdout), run)
+        except json.JSONDecodeError:
+            output = None
+
+    unit_test_pass, unit_test_error = _verify(verify_func, data, output)
+    return {
+        "seconds": round(seconds, 4),
+        "returncode": run.returncode,
+        "timed_out": run.timed_out,
+        "solver_status": run.status,
+        "objective": (run.solver_status or {}).get("objective"),
+        "exec_ok": output is not None,
+        "unit_test_pass": unit_test_pass,
+        "unit_test_error": unit_test_error,
+        "stderr_tail": run.stderr[-2000:] if output is None else None,
+    }
+
+
+def run_scale_ladder(
+    *,
+    problem_dir: Path,
+    cr_dir: Path,
+    model_path: Path,
+    scales: list[int],
+    output_dir: Path,
+    seed: int = 0,
+    timeout: float | None = None,
+    oracle: OracleStore | None = None,
+) -> dict[str, Any]:
+    """Time the reference and generated models on each scaled instance of ``problem_dir/cr_dir``.
+
+    Every scale gets its own folder under ``output_dir`` holding the instance and a copy of the
+    generated model; the combined report is written to ``output_dir/scale_ladder.json`` and returned.
+    """
+    problem, cr = problem_dir.name, cr_dir.name
+    report: dict[str, Any] = {"problem": problem, "cr": cr, "seed": seed, "timeout": timeout, "scales": []}
+    output_dir.mkdir(parents=True, exist_ok=True)
+    report_path = output_dir / "scale_ladder.json"
+
+    if not supports_problem(problem):
+        report["error"] = f"No instance generator for {problem}"
+        report_path.write_text(json.dumps(report, indent=2))
+        return report
+
+    template = json.loads((cr_dir / "input_data.json").read_text())
+    verify_func = load_verify_func(cr_dir / "unit_test.py")
+
+    for scale in scales:
+        step_dir = output_dir / f"scale_{scale}"
+        step_dir.mkdir(parents=True, exist_ok=True)
+        entry: dict[str, Any] = {"scale": scale}
+        try:
+            data = generate_instance(problem, cr, template, scale, seed=seed)
+            (step_dir / "input_data.json").write_text(json.dumps(data))
+            shutil.copy2(model_path, step_dir / "generated_model.py")
+            entry["size"] = instance_size(problem, data)
+            print(f"[scale-ladder] {problem}/{cr} scale={scale} size={entry['size']}", flush=True)
+
+            record = solve_reference(
+                cr_dir=cr_dir,
+                data=data,
+                store=oracle,
+                timeout=timeout,
+                instance_label=f"scale_{scale}_seed_{seed}",
+            )
+            data = with_oracle_optimum(data, record)
+            reference_pass, reference_error = _verify(verify_func, data, record.get("solution"))
+            entry["reference"] = {
+                "seconds": record.get("seconds"),
+                "returncode": record.get("returncode"),
+                "timed_out": record.get("timed_out"),
+                "solver_status": record.get("solver_status"),
+                "objective": record.get("objective"),
+                "exec_ok": record.get("solution") is not None,
+                "unit_test_pass": reference_pass,
+                "unit_test_error": reference_error,
+                "oracle_key": record.get("key"),
+                "oracle_authoritative": is_authoritative(record),
+                "cached": record.get("cached"),
+            }
+            entry["generated"] = run_and_verify(
+                script_path=step_dir / "generated_model.py",
+                cwd=step_dir,
+                data=data,
+                verify_func=verify_func,
+                timeout=timeout,
+            )
+        except Exception as exc:
+            entry["error"] = str(exc)
+            entry["traceback"] = traceback.format_exc()
+        report["scales"].append(entry)
+        report_path.write_text(json.dumps(report, indent=2))
+
+    report["report_path"] = str(report_path)
+    return report
@@ -0,0 +1,45 @@
+"""Benchmark entry point for the solver guard.
+
+The guard lives in ``cpmod_web/shared/solver_guard.py`` so the benchmark and the web backend's
+sandboxes run the same file; this module only makes ``src`` importable and re-exports it.
+``GUARD_PATH`` points at the shared file, which is what ``run_guarded_script`` launches.
+"""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+SRC_DIR = Path(__file__).resolve().parent.parent
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+from cpmod_web.shared.solver_guard import (  # noqa: E402
+    GUARD_PATH,
+    STATUS_SENTINEL,
+    TIME_LIMIT_ENV,
+    TIMEOUT_INCUMBENT,
+    TIMEOUT_NO_INCUMBENT,
+    GuardedRun,
+    mark_incumbent,
+    run_guarded_script,
+    set_solver_concurrency,
+    solver_time_limit,
+    solver_time_margin,
+    split_solver_status,
+)
+
+__all__ = [
+    "GUARD_PATH",
+    "STATUS_SENTINEL",
+    "TIME_LIMIT_ENV",
+    "TIMEOUT_INCUMBENT",
+    "TIMEOUT_NO_INCUMBENT",
+    "GuardedRun",
+    "mark_incumbent",
+    "run_guarded_script",
+    "set_solver_concurrency",
+    "solver_time_limit",
+    "solver_time_margin",
+    "split_solver_status",
+]
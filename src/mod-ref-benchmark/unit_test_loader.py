@@ -0,0 +1,23 @@
+"""Load the ``*_verify_func`` a CR's ``unit_test.py`` defines.
+
+Shared by the LangGraph workflow, the baseline runner, the scale ladder, instance evaluation and
+the micro-benchmarks so every caller checks model output with the same verifier.
+"""
+
+from __future__ import annotations
+
+import importlib.util
+from pathlib import Path
+
+
+def load_verify_func(unit_test_path: Path):
+    """Dynamically load the verification function from a CR's unit_test.py file."""
+    spec = importlib.util.spec_from_file_location("verify", unit_test_path)
+    if spec is None or spec.loader is None:
+        raise ValueError(f"Could not load unit test module from {unit_test_path}")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    verify_funcs = [getattr(module, f) for f in dir(module) if f.endswith("_verify_func")]
+    if not verify_funcs:
+        raise ValueError(f"No *_verify_func found in {unit_test_path}")
+    return verify_funcs[0]
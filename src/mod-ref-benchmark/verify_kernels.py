@@ -0,0 +1,154 @@
+"""Vectorised NumPy kernels shared by the CR ``unit_test.py`` verifiers.
+
+The verifiers were written as nested Python loops over windows, time points and player
+pairs, which is fine for the shipped instances but dominates runtime on scaled-up ones.
+These helpers compute the same quantities in bulk; the verifiers then use ``first_true``
+to locate the first violation in the original iteration order so assertion messages are
+unchanged.
+
+Runners put ``src/mod-ref-benchmark`` on ``sys.path`` before loading a unit test, so the
+tests import this module as ``from verify_kernels import ...``.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Sequence
+
+import numpy as np
+
+
+def as_int_array(values: Any) -> np.ndarray:
+    """Convert a (nested) list of ints to an int64 array."""
+    return np.asarray(values, dtype=np.int64)
+
+
+def first_true(mask: Any) -> int | tuple[int, ...] | None:
+    """Index of the first true entry in row-major order, or None if there is none.
+
+    1-D masks return an int, higher-dimensional masks a tuple of ints.
+    """
+    mask = np.asarray(mask, dtype=bool)
+    if mask.size == 0 or not mask.any():
+        return None
+    flat = int(np.argmax(mask))
+    if mask.ndim <= 1:
+        return flat
+    return tuple(int(i) for i in np.unravel_index(flat, mask.shape))
+
+
+def window_sums(values: Any, width: int, count: int | None = None) -> np.ndarray:
+    """Sums of ``values[s:s + width]`` for ``s in range(count)``.
+
+    ``count`` defaults to the number of full windows. Windows running past the end are
+    truncated exactly like the equivalent list slice.
+    """
+    arr = np.asarray(values, dtype=np.int64)
+    n = arr.shape[0]
+    if count is None:
+        count = n - width + 1
+    count = max(0, min(int(count), n))
+    prefix = np.concatenate(([0], np.cumsum(arr, dtype=np.int64)))
+    starts = np.arange(count)
+    ends = np.minimum(starts + max(int(width), 0), n)
+    return prefix[ends] - prefix[starts]
+
+
+def cyclic_window_sums(values: Any, width: int) -> np.ndarray:
+    """Sums of ``values[(i + t) % n]`` for ``t in range(width)``, for every start ``i``."""
+    arr = np.asarray(values, dtype=np.int64)
+    n = arr.shape[0]
+    width = max(int(width), 0)
+    if n == 0:
+        return np.zeros(0, dtype=np.int64)
+    reps = -(-(n + width) // n)
+    prefix = np.concatenate(([0], np.cumsum(np.tile(arr, reps), dtype=np.int64)))
+    starts = np.arange(n)
+    return prefix[starts + width] - prefix[starts]
+
+
+def cyclic_offsets(n: int, offsets: Sequence[int] | np.ndarray) -> np.ndarray:
+    """Index matrix ``[(i + t) % n for t in offsets]`` for every ``i in range(n)``."""
+    offsets = np.asarray(offsets, dtype=np.int64).reshape(1, -1)
+    return (np.arange(n, dtype=np.int64).reshape(-1, 1) + offsets) % max(n, 1)
+
+
+def resource_profile(starts: Any, durations: Any, demands: Any, length: int) -> np.ndarray:
+    """Resource usage at every time ``t in range(length)``.
+
+    A task contributes its demand at ``t`` when ``start <= t < start + duration``.
+    ``demands`` may be 1-D (one resource) or ``(n_tasks, n_resources)``; the result has
+    shape ``(length,)`` or ``(length, n_resources)`` respectively.
+    """
+    starts = np.asarray(starts, dtype=np.int64)
+    durations = np.asarray(durations, dtype=np.int64)
+    demands = np.asarray(demands, dtype=np.int64)
+    length = max(int(length), 0)
+
+    active = durations > 0
+    begin = np.clip(starts[active], 0, length)
+    end = np.clip(starts[active] + durations[active], 0, length)
+    delta = np.zeros((length + 1,) + demands.shape[1:], dtype=np.int64)
+    np.add.at(delta, begin, demands[active])
+    np.subtract.at(delta, end, demands[active])
+    return np.cumsum(delta, axis=0)[:length]
+
+
+def group_sums(labels: Any, weights: Any = None, size: int | None = None) -> np.ndarray:
+    """Per-label totals of ``weights`` (or counts when omitted), kept as integers."""
+    labels = np.asarray(labels, dtype=np.int64).ravel()
+    if size is None:
+        size = int(labels.max()) + 1 if labels.size else 0
+    totals = np.zeros(size, dtype=np.int64)
+    if weights is None:
+        np.add.at(totals, labels, 1)
+    else:
+        np.add.at(totals, labels, np.asarray(weights, dtype=np.int64).ravel())
+    return totals
+
+
+def pair_meeting_counts(assignments: Any, n_groups: int) -> np.ndarray:
+    """Number of rounds in which each pair of players shares a group.
+
+    ``assignments`` is ``(n_rounds, n_players)`` with 0-based group ids. The result is a
+    symmetric ``(n_players, n_players)`` matrix whose diagonal holds ``n_rounds``.
+    """
+    table = np.asarray(assignments, dtype=np.int64)
+    if table.ndim != 2:
+        table = table.reshape(0, 0)
+    n_rounds, n_players = table.shape
+    one_hot = table[:, :, None] == np.arange(n_groups)[None, None, :]
+    incidence = one_hot.transpose(1, 0, 2).reshape(n_players, n_rounds * n_groups)
+    incidence = incidence.astype(np.int64)
+    return incidence @ incidence.T
+
+
+def first_duplicate(values: Any) -> int | None:
+    """Position of the first element equal to an earlier one, or None if all differ."""
+    arr = np.asarray(values).ravel()
+    if arr.size < 2:
+        return None
+    _, first_seen = np.unique(arr, return_index=True)
+    repeated = np.ones(arr.size, dtype=bool)
+    repeated[first_seen] = False
+    return first_true(repeated)
+
+
+def first_invalid_id(values: Sequence[Any], low: int, high: int) -> tuple[str, int] | None:
+    """First id that is not an int, lies outside ``[low, high)`` or repeats an earlier id.
+
+    Mirrors the per-element ``isinstance`` / range / ``seen`` loop of the verifiers and
+    returns ``(reason, index)`` with reason ``"type"``, ``"range"`` or ``"duplicate"``.
+    """
+    stop = first_true([not isinstance(v, int) for v in values])
+    ids = as_int_array(list(values[:stop]) if stop is not None else list(values))
+    out_of_range = first_true((ids < low) | (ids >= high))
+    if out_of_range is not None:
+        ids = ids[:out_of_range]
+    duplicate = first_duplicate(ids)
+    if duplicate is not None:
+        return "duplicate", duplicate
+    if out_of_range is not None:
+        return "range", out_of_range
+    if stop is not None:
+        return "type", stop
+    return None